@@ -0,0 +1,67 @@
+"""Benchmark for de Bruijn graph assembly of a bacterial-genome-sized read set
+
+Error-free reads are sampled uniformly from a random genome, the graph is
+built by streaming them through DeBruijnGraph.from_sequences, and the graph
+is compacted into unitigs. Run from the repository root:
+
+    python -m benchmarks.bench_de_bruijn --length 4600000 --k 31 --coverage 20
+
+Measured on a single core with the defaults (613,333 reads, 92 Mb):
+
+    build from reads        110.5 s  4,599,899 k-mers, 13.0 bytes per k-mer
+    unitigs                   3.7 s  3 unitigs, longest 2,885,563 bases
+    genome Eulerian path     19.0 s  4,599,971 nodes, spelled back exactly
+
+Counting dominates the build: every read k-mer is coded and sorted before
+the batch counts are merged, whereas the graph itself stays at 13 bytes per
+k-mer against several hundred for a dict of strings.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from bioalgo.graphs.de_bruijn import DeBruijnGraph, eulerian_path, unitigs
+from bioalgo.strings.simulate import codes_to_strings, random_sequences
+
+
+def sample_reads(genome: str, read_length: int, coverage: float, rng: np.random.Generator):
+    n_reads = int(len(genome) * coverage / read_length)
+    for start in rng.integers(0, len(genome) - read_length + 1, size=n_reads).tolist():
+        yield genome[start:start+read_length]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=4600000)
+    parser.add_argument("--k", type=int, default=31)
+    parser.add_argument("--coverage", type=float, default=20)
+    parser.add_argument("--read-length", type=int, default=150)
+    parser.add_argument("--min-count", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    genome = codes_to_strings(random_sequences(1, args.length, rng=rng))[0]
+    print(f"length={args.length} k={args.k} coverage={args.coverage} reads of {args.read_length}")
+
+    start = time.perf_counter()
+    graph = DeBruijnGraph.from_sequences(sample_reads(genome, args.read_length, args.coverage, rng), args.k,
+                                         min_count=args.min_count)
+    print(f"{'build from reads':<24}{time.perf_counter() - start:>7.2f} s  {graph.n_edges} k-mers, "
+          f"{graph.nbytes / graph.n_edges:.1f} bytes per k-mer")
+
+    start = time.perf_counter()
+    contigs = unitigs(graph)
+    lengths = sorted((len(contig) for contig in contigs), reverse=True)
+    print(f"{'unitigs':<24}{time.perf_counter() - start:>7.2f} s  {len(contigs)} unitigs, longest {lengths[0]}")
+
+    start = time.perf_counter()
+    genome_graph = DeBruijnGraph.from_sequences([genome], args.k)
+    path = eulerian_path(genome_graph)
+    assert genome_graph.spell(path) == genome
+    print(f"{'genome Eulerian path':<24}{time.perf_counter() - start:>7.2f} s  {len(path)} nodes")
+
+
+if __name__ == "__main__":
+    main()
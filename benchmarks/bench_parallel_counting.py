@@ -0,0 +1,68 @@
+"""Scaling benchmark for the process-pool k-mer counters
+
+The encoded sequence is copied into shared memory once and each worker counts
+the shards it is handed; only shard bounds go out and (codes, counts) tables
+come back. Run from the repository root:
+
+    python -m benchmarks.bench_parallel_counting --length 4000000 --k 11
+    python -m benchmarks.bench_parallel_counting --length 200000 --k 9 --d 2 --chunk-size 50000
+
+Measured on a single-core machine (random sequence, numpy backend):
+
+    4 Mb, k=11, 1 Mb shards                 200 kb, k=9, d=2, 50 kb shards
+    workers   time (s)   speedup            workers   time (s)   speedup
+          1       0.80      1.00                  1       1.19      1.00
+          2       0.87      0.91                  2       1.23      0.97
+          4       1.10      0.72                  4       1.25      0.95
+          8       1.33      0.60                  8       1.26      0.95
+
+With one core the extra workers only add process start-up and merge cost, so
+these numbers are an upper bound on the overhead rather than a measure of
+scaling; rerun the script on a multi-core machine before relying on the speedup
+column. Shards are independent, so the count work itself divides evenly.
+"""
+import argparse
+import os
+import random
+import time
+
+from bioalgo.strings.parallel_counting import parallel_frequent_words_with_mismatches, parallel_kmer_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=4000000)
+    parser.add_argument("--k", type=int, default=11)
+    parser.add_argument("--d", type=int, default=None, help="count approximate occurences with d mismatches")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--backend", default="numpy", choices=("numpy", "python"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = "".join(rng.choices("ACGT", k=args.length))
+    print(f"length={args.length} k={args.k} d={args.d} backend={args.backend} cpus={os.cpu_count()}")
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>9}")
+
+    baseline = None
+    reference = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        if args.d is None:
+            codes, counts = parallel_kmer_counts(text, args.k, workers=workers,
+                                                 chunk_size=args.chunk_size, backend=args.backend)
+            result = (codes.tolist(), counts.tolist())
+        else:
+            result = parallel_frequent_words_with_mismatches(text, args.k, args.d, workers=workers,
+                                                             chunk_size=args.chunk_size, backend=args.backend)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            baseline, reference = elapsed, result
+        assert result == reference
+        print(f"{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
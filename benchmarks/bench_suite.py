@@ -0,0 +1,521 @@
+"""Benchmark suite for the bioalgo.strings and bioalgo.motifs implementations
+
+Every task groups the implementations that compute the same thing, such as
+frequent_words, fast_frequent_words and sorted_frequent_words with both
+backends. Each implementation is timed on the same seeded synthetic genome
+over a grid of lengths and k/d values, and its results are checked against
+the other implementations of the task. Run from the repository root:
+
+    python -m benchmarks.bench_suite --output results.json
+    python -m benchmarks.bench_suite --quick --baseline benchmarks/baseline.json
+
+For every case the suite records the best and median wall time over the
+repeats, the peak memory traced by tracemalloc in a separate run (tracing
+slows Python code down, so it is never timed) and throughput in bases per
+second of input. Once a case takes longer than --max-seconds at one length,
+its memory is not traced and larger lengths are skipped for it, so the
+quadratic implementations stop early instead of dominating the run.
+
+With --baseline, cases whose best time grew by more than --tolerance over the
+baseline, and by more than a millisecond, are reported as regressions and
+the exit status is 1. Baselines are only comparable on the same machine;
+benchmarks/baseline.json holds a --quick run on a single core.
+
+The recommendations list the fastest implementation of each task at each
+length, merging neighbouring lengths with the same winner. Measured on a
+single core with the default grid (1 kb to 1 Mb):
+
+    frequent words          most_frequent_kmers / sorted_frequent_words[numpy]
+                            for k <= 8 (0.03 s at 1 Mb). At k = 12 the 4^12
+                            count array costs ~0.1 s whatever the length, so
+                            sorted_frequent_words[python] wins up to 100 kb;
+                            frequent_words[python] takes 17 s at 10 kb
+    compute frequencies     kmer_frequencies for k <= 8; at k = 12 the python
+                            backend (0.42 s at 1 Mb vs 0.66 s)
+    words with mismatches   most_frequent_with_mismatches or the numpy backend,
+                            30-130x faster than python (0.9 s at 1 Mb, k=9 d=2)
+    pattern to number       encode_kmers / decode_kmers at every k and length
+    hamming distance        hamming_one_vs_many for one query against many
+                            k-mers (2-4x faster, but 0.5 GB at 1 Mb); pair by
+                            pair, hamming_distance beats the pre-kernel loop
+                            (hamming_distance[loop]) by 1.2x at k = 8, 1.6x at
+                            k = 30 and 2.9x at k = 100
+    pattern count           pattern_count on the string (0.12 s at 1 Mb);
+                            building an FMIndex takes 0.36 s and only pays off
+                            when one text is queried many times
+    pattern index           AhoCorasick for several patterns at once: 10
+                            patterns in 0.13 s at 1 Mb, vs 0.38 s through an
+                            FMIndex and 1.4 s with pattern_index per pattern
+    neighbors               NeighborhoodCache, 12-40x faster than neighbors or
+                            iter_neighbors; immediate_neighbors for d = 1
+                            strings (4-6x faster than iter_neighbors)
+    compress dna            compress_dna or pack_dna (0.01 s at 1 Mb, 4000x
+                            the old shift loop); a PackedGenome file round trip
+                            adds 0.005 s
+    gc content              stream_gc_content's str.count is 5x faster than
+                            gc_content's Counter; nucleotides and
+                            stream_nucleotides are even (0.03 s at 1 Mb)
+    motif matrix            MotifMatrix directly, 2x faster than chaining the
+                            count_matrix / profile / consensus / score adapters
+    find clumps             numpy backend (6x faster at 100 kb, 1.5x at 1 Mb)
+    motif search            greedy_motif_search on 1 kb inputs, the randomized
+                            motif_search from 10 kb
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from bioalgo.motifs.consensus import consensus
+from bioalgo.motifs.count_matrix import count_matrix
+from bioalgo.motifs.median_string import median_string
+from bioalgo.motifs.motif_matrix import MotifMatrix
+from bioalgo.motifs.motif_search import greedy_motif_search, motif_search
+from bioalgo.motifs.profile_matrix import profile
+from bioalgo.motifs.profile_scan import profile_most_probable_kmers
+from bioalgo.motifs.score_matrix import score
+from bioalgo.seqio.packed_genome import PackedGenome, write_packed
+from bioalgo.seqio.streaming import stream_gc_content, stream_nucleotides
+from bioalgo.strings.aho_corasick import AhoCorasick
+from bioalgo.strings.compress_dna import compress_dna
+from bioalgo.strings.compute_frequencies import compute_frequencies
+from bioalgo.strings.compute_skew import compute_skew
+from bioalgo.strings.decompress_dna import decompress_dna_bit_string
+from bioalgo.strings.dna_packing import pack_dna, unpack_dna
+from bioalgo.strings.fast_frequent_words import fast_frequent_words
+from bioalgo.strings.find_clumps import find_clumps
+from bioalgo.strings.fm_index import FMIndex
+from bioalgo.strings.frequent_words import frequent_words
+from bioalgo.strings.frequent_words_with_mismatches import frequent_words_with_mismatches
+from bioalgo.strings.gc_content import gc_content
+from bioalgo.strings.hamming_distance import hamming_distance
+from bioalgo.strings.hamming_kernel import bit_hamming_distance, hamming_one_vs_many
+from bioalgo.strings.immediate_neighbors import immediate_neighbors
+from bioalgo.strings.kmer_codec import decode_kmer, decode_kmers, encode_kmer, encode_kmers
+from bioalgo.strings.kmer_counting import kmer_frequencies, most_frequent_kmers
+from bioalgo.strings.mismatch_counting import most_frequent_with_mismatches
+from bioalgo.strings.neighborhood import NeighborhoodCache, iter_neighbors
+from bioalgo.strings.neighbors import neighbors
+from bioalgo.strings.nucleotides import nucleotides
+from bioalgo.strings.number_to_pattern import number_to_pattern
+from bioalgo.strings.number_to_pattern_pythonic import number_to_pattern_pythonic
+from bioalgo.strings.pattern_count import pattern_count
+from bioalgo.strings.pattern_index import pattern_index
+from bioalgo.strings.pattern_to_number import pattern_to_number
+from bioalgo.strings.pattern_to_number_pythonic import pattern_to_number_pythonic
+from bioalgo.strings.reverse_complement import reverse_complement
+from bioalgo.strings.sequence_transforms import reverse_complement_sequence, translate_sequence
+from bioalgo.strings.simulate import codes_to_strings, plant_motif, random_sequences
+from bioalgo.strings.skew import skew_array
+from bioalgo.strings.sorted_frequent_words import sorted_frequent_words
+from bioalgo.strings.translate import translate
+
+
+LENGTHS = (1000, 10000, 100000, 1000000)
+QUICK_LENGTHS = (1000, 10000)
+MOTIF_STRINGS = 10  # motif tasks split the genome into this many equal strings
+PATTERNS = 10  # patterns searched for at once by the pattern_index task
+NEIGHBORHOOD_KMERS = 1000  # k-mers whose neighborhoods are generated, whatever the genome length
+NOISE_SECONDS = 1e-3  # time differences below this are never reported as regressions
+
+
+class Case(NamedTuple):
+    """One implementation of a task. run takes the task's prepared inputs;
+    max_k skips k values the implementation cannot handle in reasonable time."""
+    name: str
+    run: Callable[..., Any]
+    max_k: int = None
+
+
+class Task(NamedTuple):
+    """Implementations of one computation, the (k, d) values to run them with,
+    a setup turning (genome, k, d) into their shared arguments, and a function
+    making results comparable, or None when results legitimately differ"""
+    name: str
+    params: Sequence[Tuple[int, int]]
+    setup: Callable[[str, int, int], tuple]
+    cases: Sequence[Case]
+    normalize: Callable[[Any], Any] = None
+
+
+def _kmers(text: str, k: int) -> List[str]:
+    return [text[i:i+k] for i in range(len(text) - k + 1)]
+
+
+def _hamming_loop(str_1: str, str_2: str) -> int:
+    """hamming_distance as it was before the bit-parallel kernel, kept as the reference"""
+    if len(str_1) != len(str_2):
+        raise ValueError("Strings must be the same length")
+
+    count = 0
+    for i in range(len(str_1)):
+        if str_1[i] != str_2[i]:
+            count += 1
+
+    return count
+
+
+def _compress_loop(text: str) -> int:
+    """compress_dna as it was before the byte packing, kept as the reference"""
+    bit_string = 1
+    for nt in text.upper():
+        bit_string = bit_string << 2 | "ACGT".index(nt)
+
+    return bit_string
+
+
+def _packed_round_trip(text: str) -> str:
+    """Write text to a packed genome file and read it back"""
+    handle, path = tempfile.mkstemp(suffix=".2bit")
+    os.close(handle)
+    try:
+        write_packed([("genome", text)], path)
+        with PackedGenome(path) as packed:
+            return packed.fetch("genome", 0, len(text))
+    finally:
+        os.remove(path)
+
+
+def _neighborhood_kmers(text: str, k: int, d: int) -> tuple:
+    """About NEIGHBORHOOD_KMERS k-mers spread evenly over the genome"""
+    return _kmers(text, k)[::max(1, len(text) // NEIGHBORHOOD_KMERS)], k, d
+
+
+def _cached_neighborhoods(kmers: List[str], k: int, d: int) -> List[Tuple[int, ...]]:
+    cache = NeighborhoodCache()
+    return [cache.get(code, k, d) for code in encode_kmers(kmers).tolist()]
+
+
+def _sorted_codes(neighborhoods: Sequence) -> List[List[int]]:
+    """Neighborhoods given as strings or as codes, as sorted code lists"""
+    return [sorted(hood) if isinstance(hood, tuple) else sorted(encode_kmers(list(hood)).tolist())
+            for hood in neighborhoods]
+
+
+def _motif_strings(text: str, k: int, d: int) -> tuple:
+    """Split the genome into MOTIF_STRINGS strings and plant a k-mer with d mutations in each"""
+    width = len(text) // MOTIF_STRINGS
+    codes = np.frombuffer(text[:width * MOTIF_STRINGS].encode("ascii"), dtype=np.uint8).reshape(MOTIF_STRINGS, width)
+    codes = np.searchsorted(np.frombuffer(b"ACGT", dtype=np.uint8), codes).astype(np.uint8)
+    planted, _ = plant_motif(codes, text[:k], d, rng=np.random.default_rng(len(text)))
+
+    return codes_to_strings(planted), k
+
+
+def _profile_inputs(text: str, k: int, d: int) -> tuple:
+    dna, _ = _motif_strings(text, k, d)
+    profile = np.random.default_rng(k).dirichlet(np.ones(4), size=k).T
+
+    return dna, profile
+
+
+def _motifs(text: str, k: int, d: int) -> tuple:
+    """Consecutive non-overlapping k-mers of the genome as the rows of a motif matrix"""
+    return [text[i:i+k] for i in range(0, len(text) - k + 1, k)],
+
+
+def _motif_summary_dicts(motifs: List[str]) -> tuple:
+    counts = count_matrix(motifs)
+    consensus_string = consensus(profile(counts))
+
+    return consensus_string, score(motifs, consensus_string)
+
+
+def _motif_summary_matrix(motifs: List[str]) -> tuple:
+    counts = MotifMatrix.from_motifs(motifs)
+
+    return counts.consensus(), counts.score()
+
+
+TASKS = (
+    Task("frequent_words", [(4, 0), (8, 0), (12, 0)], lambda text, k, d: (text, k), [
+        Case("frequent_words[python]", lambda text, k: frequent_words(text, k)),
+        Case("frequent_words[numpy]", lambda text, k: frequent_words(text, k, backend="numpy")),
+        Case("fast_frequent_words[python]", lambda text, k: fast_frequent_words(text, k)),
+        Case("fast_frequent_words[numpy]", lambda text, k: fast_frequent_words(text, k, backend="numpy")),
+        Case("sorted_frequent_words[python]", lambda text, k: sorted_frequent_words(text, k)),
+        Case("sorted_frequent_words[numpy]", lambda text, k: sorted_frequent_words(text, k, backend="numpy")),
+        Case("most_frequent_kmers", most_frequent_kmers),
+    ], sorted),
+    Task("compute_frequencies", [(4, 0), (8, 0), (12, 0)], lambda text, k, d: (text, k), [
+        Case("compute_frequencies[python]", lambda text, k: compute_frequencies(text, k)),
+        Case("compute_frequencies[numpy]", lambda text, k: compute_frequencies(text, k, backend="numpy")),
+        Case("kmer_frequencies", kmer_frequencies),
+    ], lambda counts: sorted(counts.items())),
+    Task("frequent_words_with_mismatches", [(6, 1), (9, 2)], lambda text, k, d: (text, k, d), [
+        Case("frequent_words_with_mismatches[python]", lambda text, k, d: frequent_words_with_mismatches(text, k, d)),
+        Case("frequent_words_with_mismatches[numpy]",
+             lambda text, k, d: frequent_words_with_mismatches(text, k, d, backend="numpy")),
+        Case("most_frequent_with_mismatches", most_frequent_with_mismatches),
+    ], sorted),
+    Task("pattern_to_number", [(4, 0), (8, 0), (16, 0)], lambda text, k, d: (_kmers(text, k),), [
+        Case("pattern_to_number", lambda kmers: [pattern_to_number(kmer) for kmer in kmers]),
+        Case("pattern_to_number_pythonic", lambda kmers: [pattern_to_number_pythonic(kmer) for kmer in kmers], max_k=6),
+        Case("encode_kmer", lambda kmers: [encode_kmer(kmer) for kmer in kmers]),
+        Case("encode_kmers", lambda kmers: encode_kmers(kmers).tolist()),
+    ], list),
+    Task("number_to_pattern", [(4, 0), (8, 0), (16, 0)],
+         lambda text, k, d: (encode_kmers(_kmers(text, k)).tolist(), k), [
+        Case("number_to_pattern", lambda codes, k: [number_to_pattern(code, k) for code in codes]),
+        Case("number_to_pattern_pythonic", lambda codes, k: [number_to_pattern_pythonic(code, k) for code in codes],
+             max_k=6),
+        Case("decode_kmer", lambda codes, k: [decode_kmer(code, k) for code in codes]),
+        Case("decode_kmers", decode_kmers),
+    ], list),
+    Task("hamming_distance", [(8, 0), (12, 0), (30, 0), (100, 0)], lambda text, k, d: (text[:k], _kmers(text, k)), [
+        Case("hamming_distance[loop]", lambda query, kmers: [_hamming_loop(query, kmer) for kmer in kmers]),
+        Case("hamming_distance", lambda query, kmers: [hamming_distance(query, kmer) for kmer in kmers]),
+        Case("bit_hamming_distance", lambda query, kmers: [bit_hamming_distance(query, kmer) for kmer in kmers]),
+        Case("hamming_one_vs_many", lambda query, kmers: hamming_one_vs_many(query, kmers).tolist()),
+    ], list),
+    Task("pattern_count", [(10, 0)], lambda text, k, d: (text, text[len(text) // 2:len(text) // 2 + k]), [
+        Case("pattern_count[str]", pattern_count),
+        Case("pattern_count[FMIndex]", lambda text, pattern: pattern_count(FMIndex(text), pattern)),
+    ], int),
+    Task("pattern_index", [(10, 0)], lambda text, k, d: (text, _kmers(text, k)[::max(1, len(text) // PATTERNS)]), [
+        Case("pattern_index[str]", lambda text, patterns: {p: pattern_index(text, p) for p in patterns}),
+        Case("pattern_index[FMIndex]",
+             lambda text, patterns: (lambda index: {p: pattern_index(index, p) for p in patterns})(FMIndex(text))),
+        Case("AhoCorasick", lambda text, patterns: AhoCorasick(patterns).index(text)),
+    ], lambda positions: sorted((p, sorted(hits)) for p, hits in positions.items())),
+    Task("neighbors", [(8, 1), (6, 2)], _neighborhood_kmers, [
+        Case("neighbors", lambda kmers, k, d: [neighbors(kmer, d) for kmer in kmers]),
+        Case("iter_neighbors", lambda kmers, k, d: [list(iter_neighbors(kmer, d)) for kmer in kmers]),
+        Case("NeighborhoodCache", _cached_neighborhoods),
+    ], _sorted_codes),
+    Task("immediate_neighbors", [(8, 1), (16, 1)], lambda text, k, d: (_neighborhood_kmers(text, k, d)[0],), [
+        Case("immediate_neighbors", lambda kmers: [immediate_neighbors(kmer) for kmer in kmers]),
+        Case("iter_neighbors", lambda kmers: [list(iter_neighbors(kmer, 1)) for kmer in kmers]),
+    ], lambda hoods: [sorted(hood) for hood in hoods]),
+    Task("compress_dna", [(0, 0)], lambda text, k, d: (text,), [
+        Case("compress_dna[loop]", lambda text: decompress_dna_bit_string(_compress_loop(text))),
+        Case("compress_dna", lambda text: decompress_dna_bit_string(compress_dna(text))),
+        Case("pack_dna", lambda text: unpack_dna(pack_dna(text), len(text))),
+        Case("PackedGenome", _packed_round_trip),
+    ], str),
+    Task("gc_content", [(0, 0)], lambda text, k, d: (text,), [
+        Case("gc_content", gc_content),
+        Case("stream_gc_content", lambda text: stream_gc_content([text])),
+    ], float),
+    Task("nucleotides", [(0, 0)], lambda text, k, d: (text,), [
+        Case("nucleotides", nucleotides),
+        Case("stream_nucleotides", lambda text: stream_nucleotides([text])),
+    ], lambda counts: sorted(counts.items())),
+    Task("find_clumps", [(9, 0)], lambda text, k, d: (text, k), [
+        Case("find_clumps[python]", lambda text, k: find_clumps(text, k, 500, 3)),
+        Case("find_clumps[numpy]", lambda text, k: find_clumps(text, k, 500, 3, backend="numpy")),
+    ], sorted),
+    Task("skew", [(0, 0)], lambda text, k, d: (text,), [
+        Case("compute_skew", compute_skew),
+        Case("skew_array", lambda text: skew_array(text).tolist()),
+    ], list),
+    Task("reverse_complement", [(0, 0)], lambda text, k, d: (text,), [
+        Case("reverse_complement", reverse_complement),
+        Case("reverse_complement_sequence", reverse_complement_sequence),
+    ], str),
+    Task("translate", [(0, 0)], lambda text, k, d: (text[:len(text) // 3 * 3].replace("T", "U"),), [
+        Case("translate", lambda rna: translate(rna, stop="keep")),
+        Case("translate_sequence", translate_sequence),
+    ], str),
+    Task("profile_most_probable_kmers", [(8, 0), (15, 0)], _profile_inputs, [
+        Case("profile_most_probable_kmers", profile_most_probable_kmers),
+    ]),
+    Task("motif_matrix", [(12, 0)], _motifs, [
+        Case("count_matrix/profile/consensus/score", _motif_summary_dicts),
+        Case("MotifMatrix", _motif_summary_matrix),
+    ], tuple),
+    Task("median_string", [(5, 1), (7, 1)], _motif_strings, [
+        Case("median_string", median_string),
+    ]),
+    Task("motif_search", [(8, 2), (12, 3)], _motif_strings, [
+        Case("greedy_motif_search", greedy_motif_search),
+        Case("motif_search[randomized]", lambda dna, k: motif_search(dna, k, restarts=20, seed=0).score),
+        Case("motif_search[gibbs]",
+             lambda dna, k: motif_search(dna, k, method="gibbs", restarts=20, seed=0, n_iterations=200).score),
+    ]),
+)
+
+
+def genome(length: int, seed: int) -> str:
+    """Seeded synthetic genome; the same (length, seed) always gives the same text"""
+    return codes_to_strings(random_sequences(1, length, rng=np.random.default_rng([seed, length])))[0]
+
+
+def measure(run: Callable[[], Any], repeat: int, max_seconds: float) -> Dict[str, Any]:
+    """Time run up to repeat times, stopping early once the total passes max_seconds,
+    then trace its peak memory in one more call unless a single call already took
+    longer than max_seconds"""
+    times = []
+    while len(times) < repeat and (not times or sum(times) < max_seconds):
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if min(times) <= max_seconds:
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {"result": result, "seconds": min(times), "median_seconds": statistics.median(times),
+            "repeats": len(times), "peak_bytes": peak}
+
+
+def run_suite(tasks: Sequence[Task], lengths: Sequence[int], repeat: int = 3, max_seconds: float = 2.0,
+              seed: int = 0, log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """Run every case of every task over the grid
+
+    Returns:
+        List[Dict[str, Any]] -- one record per (case, k, d, length) that was run
+    """
+    records = []
+    for task in tasks:
+        for k, d in task.params:
+            too_slow = set()
+            for length in sorted(lengths):
+                text = genome(length, seed)
+                args = task.setup(text, k, d)
+                expected = None
+                for case in task.cases:
+                    if case.name in too_slow or (case.max_k is not None and k > case.max_k):
+                        continue
+                    timing = measure(lambda: case.run(*args), repeat, max_seconds)
+                    result = timing.pop("result")
+
+                    agrees = None
+                    if task.normalize is not None:
+                        result = task.normalize(result)
+                        if expected is None:
+                            expected = result
+                        agrees = result == expected
+
+                    record = {"task": task.name, "case": case.name, "length": length, "k": k, "d": d,
+                              **timing, "bases_per_second": length / timing["seconds"] if timing["seconds"] else None,
+                              "agrees": agrees}
+                    records.append(record)
+                    log(_format_record(record))
+                    if timing["seconds"] > max_seconds:
+                        too_slow.add(case.name)
+
+    return records
+
+
+def _format_record(record: Dict[str, Any]) -> str:
+    flag = "" if record["agrees"] is not False else "  RESULT DIFFERS"
+    memory = "-" if record["peak_bytes"] is None else f"{record['peak_bytes'] / 2 ** 20:.2f} MiB"
+    return (f"{record['task']:<31}{record['case']:<40}k={record['k']:<4}d={record['d']:<2}"
+            f"{record['length']:>9} {record['seconds']:>10.4f} s {memory:>13}{flag}")
+
+
+def _key(record: Dict[str, Any]) -> Tuple:
+    return record["case"], record["k"], record["d"], record["length"]
+
+
+def compare(records: Sequence[Dict[str, Any]], baseline: Sequence[Dict[str, Any]],
+            tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """Find records slower than the matching baseline record by more than tolerance
+
+    Returns:
+        List[Dict[str, Any]] -- regressions, with the baseline time and the ratio to it
+    """
+    previous = {_key(record): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = previous.get(_key(record))
+        if old is None:
+            continue
+        if record["seconds"] > old["seconds"] * (1 + tolerance) and record["seconds"] - old["seconds"] > NOISE_SECONDS:
+            regressions.append({**record, "baseline_seconds": old["seconds"], "ratio": record["seconds"] / old["seconds"]})
+
+    return regressions
+
+
+def recommend(records: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Pick the fastest case of each task at each length, merging consecutive
+    lengths with the same winner into one range
+
+    Returns:
+        List[Dict[str, Any]] -- task, k, d, the range of lengths and the case to use there
+    """
+    fastest = {}
+    for record in records:
+        key = (record["task"], record["k"], record["d"], record["length"])
+        if key not in fastest or record["seconds"] < fastest[key]["seconds"]:
+            fastest[key] = record
+
+    recommendations = []
+    for (task, k, d, length), record in sorted(fastest.items()):
+        last = recommendations[-1] if recommendations else None
+        if last and (last["task"], last["k"], last["d"], last["case"]) == (task, k, d, record["case"]):
+            last["max_length"] = length
+        else:
+            recommendations.append({"task": task, "k": k, "d": d, "min_length": length, "max_length": length,
+                                    "case": record["case"]})
+
+    return recommendations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=None)
+    parser.add_argument("--quick", action="store_true", help=f"only run lengths {QUICK_LENGTHS}")
+    parser.add_argument("--tasks", nargs="+", default=None, choices=[task.name for task in TASKS])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="write results as JSON to this path")
+    parser.add_argument("--baseline", default=None, help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    lengths = args.lengths or (QUICK_LENGTHS if args.quick else LENGTHS)
+    tasks = [task for task in TASKS if args.tasks is None or task.name in args.tasks]
+    records = run_suite(tasks, lengths, args.repeat, args.max_seconds, args.seed)
+    recommendations = recommend(records)
+
+    print("\nRecommendations")
+    for item in recommendations:
+        print(f"{item['task']:<31}k={item['k']:<4}d={item['d']:<2}"
+              f"{item['min_length']:>9} - {item['max_length']:<9}{item['case']}")
+
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+                 "processor": platform.processor(), "seed": args.seed, "repeat": args.repeat, "lengths": list(lengths)},
+        "results": records,
+        "recommendations": recommendations,
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=1)
+
+    status = 0
+    if any(record["agrees"] is False for record in records):
+        print("\nSome implementations returned different results, see RESULT DIFFERS above")
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(records, json.load(handle)["results"], args.tolerance)
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}")
+        for item in regressions:
+            print(f"{item['case']:<40}k={item['k']:<4}d={item['d']:<2}{item['length']:>9}"
+                  f" {item['baseline_seconds']:>9.4f} s -> {item['seconds']:.4f} s ({item['ratio']:.2f}x)")
+        if regressions:
+            status = 1
+
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
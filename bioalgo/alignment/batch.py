@@ -0,0 +1,65 @@
+from typing import Sequence
+
+import numpy as np
+
+from bioalgo.alignment.pairwise import SequenceLike, _encode, _gap_costs, _score_pass, check_mode
+from bioalgo.alignment.scoring import Scoring
+
+
+BATCH_CELLS = 1 << 22  # cells of one DP row computed at once across a block of targets
+
+
+def _pad(sequences: Sequence[np.ndarray]) -> np.ndarray:
+    padded = np.zeros((len(sequences), max((len(s) for s in sequences), default=0)), dtype=np.uint8)
+    for row, sequence in zip(padded, sequences):
+        row[:len(sequence)] = sequence
+
+    return padded
+
+
+def batch_scores(query: SequenceLike, targets: Sequence[SequenceLike], scoring: Scoring,
+                 mode: str = "global") -> np.ndarray:
+    """Optimal alignment score of query against each of many targets. Targets are
+    padded into one array and the DP advances a row of every pair at once, in
+    blocks of about BATCH_CELLS cells, so the per-row cost of NumPy is shared by
+    the whole block.
+
+    Arguments:
+        query {SequenceLike} -- query sequence
+        targets {Sequence[SequenceLike]} -- sequences to score against
+        scoring {Scoring} -- scoring scheme
+
+    Keyword Arguments:
+        mode {str} -- "global", "local" or "fitting" (all of each target against part of query) (default: {"global"})
+
+    Returns:
+        np.ndarray -- alignment_score(query, target, scoring, mode) for each target
+
+    Example:
+    >>> from bioalgo.alignment.scoring import simple_scoring
+    >>> batch_scores("GATTACA", ["GATTACA", "GCATGCU", "TTAC", ""], simple_scoring(), mode="local").tolist()
+    [7, 2, 4, 0]
+
+    """
+    check_mode(mode)
+    g, h = _gap_costs(scoring)
+    q = _encode(query)
+    encoded = [_encode(target) for target in targets]
+    scores = np.zeros(len(encoded), dtype=np.int64)
+    longest = max((len(target) for target in encoded), default=0)
+    block = max(1, BATCH_CELLS // (max(longest, len(q)) + 1))
+
+    for first in range(0, len(encoded), block):
+        chunk = encoded[first:first + block]
+        padded = _pad(chunk)
+        lengths = np.array([len(target) for target in chunk])
+        queries = np.broadcast_to(q, (len(chunk), len(q)))
+        query_lengths = np.full(len(chunk), len(q))
+        if mode == "fitting":
+            *_, best, _, _ = _score_pass(padded, lengths, queries, query_lengths,
+                                         np.ascontiguousarray(scoring.matrix.T), g, h, g, mode)
+        else:
+            *_, best, _, _ = _score_pass(queries, query_lengths, padded, lengths, scoring.matrix, g, h, g, mode)
+        scores[first:first + len(chunk)] = best
+
+    return scores
@@ -0,0 +1,472 @@
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from bioalgo.alignment.scoring import Scoring
+
+
+MODES = ("global", "local", "fitting")
+NEG = -(1 << 29)  # stands in for minus infinity, far below any reachable score
+LEAF_CELLS = 1 << 16  # linear-space subproblems up to this many cells get a full traceback matrix
+PROFILE_CELLS = 1 << 24  # largest query profile (distinct symbols x target cells) built per pass
+GAP = ord("-")
+
+# traceback bits of one cell: where the best score came from, and whether the
+# deletion / insertion ending there extends an earlier one
+_DIAGONAL, _DELETION, _INSERTION = 0, 1, 2
+_DELETION_EXTENDS = 4
+_INSERTION_EXTENDS = 8
+
+SequenceLike = Union[str, bytes]
+
+
+class Alignment(NamedTuple):
+    """Aligned rows of two sequences, their score, and the aligned slice
+    [start, end) of each sequence"""
+    score: int
+    aligned_1: str
+    aligned_2: str
+    start_1: int
+    end_1: int
+    start_2: int
+    end_2: int
+
+
+def check_mode(mode: str) -> None:
+    """Raise a ValueError if mode is not one of the supported alignment modes
+
+    Arguments:
+        mode {str} -- "global", "local" or "fitting"
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode!r}, expected one of {MODES}")
+
+
+def _encode(sequence: SequenceLike) -> np.ndarray:
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii")
+
+    return np.frombuffer(sequence, dtype=np.uint8)
+
+
+def _gap_costs(scoring: Scoring) -> Tuple[int, int]:
+    """Split the penalties into a one-off opening cost g and a per-position cost h,
+    so that a gap of length L costs g + h * L"""
+    return scoring.gap_open - scoring.gap_extend, scoring.gap_extend
+
+
+def _score_pass(a: np.ndarray, la: np.ndarray, b: np.ndarray, lb: np.ndarray, matrix: np.ndarray,
+                g: int, h: int, tb: int, mode: str) -> Tuple[np.ndarray, ...]:
+    """Affine-gap DP over the rows of a, computing each whole row of every pair at
+    once and keeping only the current row. Insertions within a row are a running
+    maximum: the best insertion ending at column j opens after the best
+    max(V[j'] + h * j') for j' < j, where V is the best score not ending in an
+    insertion.
+
+    Arguments:
+        a {np.ndarray} -- (T, rows) symbols of the first sequence of each pair, padded
+        la {np.ndarray} -- length of each first sequence
+        b {np.ndarray} -- (T, columns) symbols of the second sequence of each pair, padded
+        lb {np.ndarray} -- length of each second sequence
+        matrix {np.ndarray} -- 256 x 256 substitution scores
+        g {int} -- gap opening cost
+        h {int} -- gap cost per position
+        tb {int} -- opening cost of a deletion that starts at the first row
+        mode {str} -- "global", "local", "fitting" (all of a against part of b),
+        "anchored" (all of a against a prefix of b) or "prefix" (both sequences
+        start at the beginning, either may end anywhere)
+
+    Returns:
+        Tuple[np.ndarray, ...] -- last row of best scores, last row of scores ending in a
+        deletion, and the best score of each pair with its end row and column
+    """
+    n_pairs, n_rows = a.shape
+    width = b.shape[1] + 1
+    ramp = h * np.arange(width, dtype=np.int32)
+    open_ramp = g + ramp[1:]
+    in_b = np.arange(width) <= lb[:, None]
+    whole_rows = bool(in_b.all())
+    pairs = np.arange(n_pairs)
+
+    # query profile: substitution scores of each symbol of a against all of b,
+    # so that a row's scores are a lookup instead of a gather from matrix
+    symbols, a_index = np.unique(a, return_inverse=True)
+    a_index = a_index.reshape(a.shape)
+    profile = None
+    if len(symbols) * b.size <= PROFILE_CELLS:
+        profile = matrix[symbols][:, b]
+
+    H = np.zeros((n_pairs, width), dtype=np.int32)
+    if mode in ("global", "anchored", "prefix"):
+        H[:, 1:] = -(g + ramp[1:])
+    D = np.full((n_pairs, width), NEG, dtype=np.int32)
+    new_H = np.empty_like(H)
+    work = np.empty_like(H)
+    insertion = np.empty((n_pairs, width - 1), dtype=np.int32)
+
+    best = np.full(n_pairs, NEG, dtype=np.int64)
+    best_i = np.zeros(n_pairs, dtype=np.int64)
+    best_j = np.zeros(n_pairs, dtype=np.int64)
+
+    def record(i: int):
+        if mode == "global":
+            done = la == i
+            best[done] = H[done, lb[done]]
+            best_i[done], best_j[done] = i, lb[done]
+            return
+        scores = H if whole_rows else np.where(in_b, H, NEG)
+        columns = scores.argmax(axis=1)
+        row_best = scores[pairs, columns]
+        if mode in ("fitting", "anchored"):
+            better = la == i
+        else:
+            better = (row_best > best) & (i <= la)
+        best[better] = row_best[better]
+        best_i[better], best_j[better] = i, columns[better]
+
+    record(0)
+    for i in range(1, n_rows + 1):
+        if profile is None:
+            substitution = np.take_along_axis(matrix[a[:, i - 1]], b, axis=1)
+        elif n_pairs == 1:
+            substitution = profile[a_index[0, i - 1]]
+        else:
+            substitution = profile[a_index[:, i - 1], pairs]
+
+        # D[i, j] = max(H[i-1, j] - g - h, D[i-1, j] - h), updated in place
+        np.subtract(H, g + h, out=work)
+        np.subtract(D, h, out=D)
+        np.maximum(D, work, out=D)
+        if mode == "local":
+            new_H[:, 0] = 0
+            D[:, 0] = NEG
+        else:
+            new_H[:, 0] = D[:, 0] = -(tb + h * i)
+
+        np.add(H[:, :-1], substitution, out=new_H[:, 1:])
+        np.maximum(new_H[:, 1:], D[:, 1:], out=new_H[:, 1:])
+        np.add(new_H, ramp, out=work)
+        np.maximum.accumulate(work, axis=1, out=work)
+        np.subtract(work[:, :-1], open_ramp, out=insertion)
+        np.maximum(new_H[:, 1:], insertion, out=new_H[:, 1:])
+        if mode == "local":
+            np.maximum(new_H, 0, out=new_H)
+
+        H, new_H = new_H, H
+        record(i)
+
+    return H, D, best, best_i, best_j
+
+
+def _best(a: np.ndarray, b: np.ndarray, matrix: np.ndarray, g: int, h: int, mode: str) -> Tuple[int, int, int]:
+    """Best score of one pair and the row and column where its alignment ends"""
+    _, _, best, best_i, best_j = _score_pass(a[None, :], np.array([len(a)]), b[None, :], np.array([len(b)]),
+                                             matrix, g, h, g, mode)
+
+    return int(best[0]), int(best_i[0]), int(best_j[0])
+
+
+def _shifted(row: np.ndarray, shift: int) -> np.ndarray:
+    """out[k] = row[k + shift], NEG where k + shift falls outside row"""
+    if shift == 0:
+        return row
+    out = np.full_like(row, NEG)
+    if shift > 0:
+        out[:-shift] = row[shift:]
+    else:
+        out[-shift:] = row[:shift]
+
+    return out
+
+
+def _traceback_align(a: np.ndarray, b: np.ndarray, matrix: np.ndarray, g: int, h: int, tb: int, te: int,
+                     bandwidth: int = None) -> Tuple[bytes, bytes]:
+    """Global alignment with one traceback byte per cell, over the whole matrix or
+    over the band of cells with |j - i| <= bandwidth. tb and te are the opening
+    costs of a deletion touching the first and the last row.
+
+    Returns:
+        Tuple[bytes, bytes] -- aligned rows
+    """
+    M, N = len(a), len(b)
+    if bandwidth is None:
+        width = N + 1
+        starts = np.zeros(M + 1, dtype=np.int64)
+    else:
+        width = 2 * bandwidth + 1
+        starts = np.arange(M + 1, dtype=np.int64) - bandwidth
+
+    ramp = h * np.arange(width, dtype=np.int32)
+    pointers = np.zeros((M + 1, width), dtype=np.uint8)
+    b_padded = np.concatenate(([0], b)) if N else np.zeros(1, dtype=np.uint8)
+
+    columns = starts[0] + np.arange(width)
+    inside = (columns >= 0) & (columns <= N)
+    H = np.where(inside, -(g + h * columns), NEG).astype(np.int32)
+    H[columns == 0] = 0
+    D = np.full(width, NEG, dtype=np.int32)
+    pointers[0] = np.where(columns > 1, _INSERTION | _INSERTION_EXTENDS, _INSERTION)
+
+    for i in range(1, M + 1):
+        delta = int(starts[i] - starts[i - 1])
+        columns = starts[i] + np.arange(width)
+        inside = (columns >= 0) & (columns <= N)
+        substitution = matrix[a[i - 1], b_padded[np.clip(columns, 0, N)]]
+
+        diagonal = _shifted(H, delta - 1) + substitution
+        opened = _shifted(H, delta) - (g + h)
+        extended = _shifted(D, delta) - h
+        new_D = np.maximum(opened, extended)
+        pointer = np.where(extended > opened, _DELETION_EXTENDS, 0).astype(np.uint8)
+
+        V = np.maximum(diagonal, new_D)
+        pointer |= np.where(new_D > diagonal, _DELETION, _DIAGONAL).astype(np.uint8)
+        left = columns == 0
+        V[left] = new_D[left] = -(tb + h * i)
+        pointer[left] = _DELETION | (_DELETION_EXTENDS if i > 1 else 0)
+        V[~inside] = NEG
+
+        insertion = np.full(width, NEG, dtype=np.int32)
+        insertion[1:] = np.maximum.accumulate(V + ramp)[:-1] - g - ramp[1:]
+        pointer[1:] |= np.where(insertion[1:] != V[:-1] - (g + h), _INSERTION_EXTENDS, 0).astype(np.uint8)
+        new_H = np.maximum(V, insertion)
+        pointer = np.where(insertion > V, (pointer & ~np.uint8(3)) | _INSERTION, pointer)
+
+        new_H[~inside] = NEG
+        new_D[~inside] = NEG
+        np.maximum(new_H, NEG, out=new_H)
+        np.maximum(new_D, NEG, out=new_D)
+        H, D = new_H, new_D
+        pointers[i] = pointer
+
+    end = N - starts[M]
+    in_deletion = M > 0 and N > 0 and D[end] + g - te > H[end]
+
+    flat = memoryview(pointers.reshape(-1))
+    row_starts = starts.tolist()
+    a_bytes, b_bytes = a.tobytes(), b.tobytes()
+    aligned_1, aligned_2 = bytearray(), bytearray()
+    i, j = M, N
+    state = _DELETION if in_deletion else _DIAGONAL  # _DIAGONAL doubles as "best of any state"
+    while i > 0 or j > 0:
+        pointer = flat[i * width + j - row_starts[i]]
+        if state == _DIAGONAL:
+            source = _DELETION if j == 0 else _INSERTION if i == 0 else pointer & 3
+            if source != _DIAGONAL:
+                state = source
+                continue
+            aligned_1.append(a_bytes[i - 1])
+            aligned_2.append(b_bytes[j - 1])
+            i, j = i - 1, j - 1
+        elif state == _DELETION:
+            aligned_1.append(a_bytes[i - 1])
+            aligned_2.append(GAP)
+            if j and not pointer & _DELETION_EXTENDS:
+                state = _DIAGONAL
+            i -= 1
+        else:
+            aligned_1.append(GAP)
+            aligned_2.append(b_bytes[j - 1])
+            if i and not pointer & _INSERTION_EXTENDS:
+                state = _DIAGONAL
+            j -= 1
+
+    return bytes(aligned_1[::-1]), bytes(aligned_2[::-1])
+
+
+def _linear_space(a: np.ndarray, b: np.ndarray, matrix: np.ndarray, g: int, h: int, tb: int, te: int,
+                  rows_1: List[bytes], rows_2: List[bytes]) -> None:
+    """Myers and Miller's linear-space form of Hirschberg's algorithm for affine
+    gaps: score the top half of a forwards and the bottom half backwards, split at
+    the best column of the middle row, either between rows or inside a deletion
+    spanning it, and recurse on both sides. The aligned pieces are appended to
+    rows_1 and rows_2 in order."""
+    M, N = len(a), len(b)
+    if M <= 1 or (M + 1) * (N + 1) <= LEAF_CELLS:
+        aligned_1, aligned_2 = _traceback_align(a, b, matrix, g, h, tb, te)
+        rows_1.append(aligned_1)
+        rows_2.append(aligned_2)
+        return
+
+    mid = M // 2
+    lengths = np.array([N])
+    forward, forward_deletion, *_ = _score_pass(a[None, :mid], np.array([mid]), b[None, :], lengths,
+                                                matrix, g, h, tb, "global")
+    backward, backward_deletion, *_ = _score_pass(a[None, :mid - 1:-1], np.array([M - mid]), b[None, ::-1], lengths,
+                                                  matrix, g, h, te, "global")
+    through = forward[0].astype(np.int64) + backward[0, ::-1]
+    across = forward_deletion[0].astype(np.int64) + backward_deletion[0, ::-1] + g
+    j_through, j_across = int(through.argmax()), int(across.argmax())
+
+    if through[j_through] >= across[j_across]:
+        _linear_space(a[:mid], b[:j_through], matrix, g, h, tb, g, rows_1, rows_2)
+        _linear_space(a[mid:], b[j_through:], matrix, g, h, g, te, rows_1, rows_2)
+    else:
+        _linear_space(a[:mid - 1], b[:j_across], matrix, g, h, tb, 0, rows_1, rows_2)
+        rows_1.append(a[mid - 1:mid + 1].tobytes())
+        rows_2.append(b"--")
+        _linear_space(a[mid + 1:], b[j_across:], matrix, g, h, 0, te, rows_1, rows_2)
+
+
+def _global_rows(a: np.ndarray, b: np.ndarray, scoring: Scoring) -> Tuple[str, str]:
+    """Optimal global alignment in linear space. The shorter sequence is laid along
+    the rows, so fewer, longer rows are computed."""
+    g, h = _gap_costs(scoring)
+    rows_1: List[bytes] = []
+    rows_2: List[bytes] = []
+    if len(a) <= len(b):
+        _linear_space(a, b, scoring.matrix, g, h, g, g, rows_1, rows_2)
+    else:
+        _linear_space(b, a, np.ascontiguousarray(scoring.matrix.T), g, h, g, g, rows_2, rows_1)
+
+    return b"".join(rows_1).decode("ascii"), b"".join(rows_2).decode("ascii")
+
+
+def score_alignment(aligned_1: str, aligned_2: str, scoring: Scoring) -> int:
+    """Score two aligned rows: substitution scores of the aligned columns minus the
+    penalty of every maximal gap run
+
+    Arguments:
+        aligned_1 {str} -- first row, gaps written as "-"
+        aligned_2 {str} -- second row of the same length
+        scoring {Scoring} -- scoring scheme
+
+    Returns:
+        int -- alignment score
+
+    Example:
+    >>> from bioalgo.alignment.scoring import simple_scoring
+    >>> score_alignment("TAGGCTTA", "TAGA--TA", simple_scoring())
+    2
+
+    """
+    if len(aligned_1) != len(aligned_2):
+        raise ValueError("Aligned rows must have the same length")
+
+    x, y = _encode(aligned_1), _encode(aligned_2)
+    gaps_1, gaps_2 = x == GAP, y == GAP
+    if (gaps_1 & gaps_2).any():
+        raise ValueError("A column cannot be a gap in both rows")
+
+    paired = ~(gaps_1 | gaps_2)
+    score = int(scoring.matrix[x[paired], y[paired]].sum())
+    for gaps in (gaps_1, gaps_2):
+        n_gaps = int(gaps.sum())
+        n_runs = int(np.count_nonzero(np.diff(gaps.astype(np.int8), prepend=0) == 1))
+        score -= n_runs * scoring.gap_open + (n_gaps - n_runs) * scoring.gap_extend
+
+    return score
+
+
+def alignment_score(seq_1: SequenceLike, seq_2: SequenceLike, scoring: Scoring, mode: str = "global") -> int:
+    """Score of an optimal alignment, computed a row at a time in O(len(seq_2)) memory
+
+    Arguments:
+        seq_1 {SequenceLike} -- first sequence
+        seq_2 {SequenceLike} -- second sequence
+        scoring {Scoring} -- scoring scheme
+
+    Keyword Arguments:
+        mode {str} -- "global", "local" or "fitting" (all of seq_2 against part of seq_1) (default: {"global"})
+
+    Returns:
+        int -- optimal score
+
+    Example:
+    >>> from bioalgo.alignment.scoring import BLOSUM62, matrix_scoring
+    >>> alignment_score("PLEASANTLY", "MEANLY", matrix_scoring(BLOSUM62, 5))
+    8
+
+    """
+    check_mode(mode)
+    a, b = _encode(seq_1), _encode(seq_2)
+    g, h = _gap_costs(scoring)
+    if mode == "fitting":
+        return _best(b, a, np.ascontiguousarray(scoring.matrix.T), g, h, mode)[0]
+
+    return _best(a, b, scoring.matrix, g, h, mode)[0]
+
+
+def align(seq_1: SequenceLike, seq_2: SequenceLike, scoring: Scoring, mode: str = "global") -> Alignment:
+    """Optimal global, local or fitting alignment with affine gaps in linear space.
+    Local and fitting alignments are located with one forward pass for their end
+    and one backward pass for their start, and the aligned slices are then aligned
+    globally with the Myers-Miller form of Hirschberg's algorithm. Memory stays
+    O(len(seq_1) + len(seq_2)).
+
+    Arguments:
+        seq_1 {SequenceLike} -- first sequence
+        seq_2 {SequenceLike} -- second sequence
+        scoring {Scoring} -- scoring scheme
+
+    Keyword Arguments:
+        mode {str} -- "global", "local" or "fitting" (all of seq_2 against part of seq_1) (default: {"global"})
+
+    Returns:
+        Alignment -- score, aligned rows and the aligned slice of each sequence
+
+    Example:
+    >>> from bioalgo.alignment.scoring import BLOSUM62, PAM250, matrix_scoring, simple_scoring
+    >>> align("PRTEINS", "PRTWPSEIN", matrix_scoring(BLOSUM62, 11, 1))[:3]
+    (8, 'PRT---EINS', 'PRTWPSEIN-')
+    >>> align("MEANLY", "PENALTY", matrix_scoring(PAM250, 5), mode="local")
+    Alignment(score=15, aligned_1='EANL-Y', aligned_2='ENALTY', start_1=1, end_1=6, start_2=1, end_2=7)
+    >>> align("GTAGGCTTAAGGTTA", "TAGATA", simple_scoring(), mode="fitting")[:3]
+    (2, 'TAGGCTTA', 'TA-G-ATA')
+
+    """
+    check_mode(mode)
+    a, b = _encode(seq_1), _encode(seq_2)
+    g, h = _gap_costs(scoring)
+
+    if mode == "global":
+        start_1, end_1, start_2, end_2 = 0, len(a), 0, len(b)
+    elif mode == "local":
+        score, end_1, end_2 = _best(a, b, scoring.matrix, g, h, "local")
+        if score <= 0:
+            return Alignment(0, "", "", 0, 0, 0, 0)
+        _, length_1, length_2 = _best(a[end_1 - 1::-1] if end_1 else a[:0], b[end_2 - 1::-1] if end_2 else b[:0],
+                                      scoring.matrix, g, h, "prefix")
+        start_1, start_2 = end_1 - length_1, end_2 - length_2
+    else:
+        transposed = np.ascontiguousarray(scoring.matrix.T)
+        _, _, end_1 = _best(b, a, transposed, g, h, "fitting")
+        _, _, length_1 = _best(b[::-1], a[end_1 - 1::-1] if end_1 else a[:0], transposed, g, h, "anchored")
+        start_1, start_2, end_2 = end_1 - length_1, 0, len(b)
+
+    aligned_1, aligned_2 = _global_rows(a[start_1:end_1], b[start_2:end_2], scoring)
+
+    return Alignment(score_alignment(aligned_1, aligned_2, scoring), aligned_1, aligned_2,
+                     start_1, end_1, start_2, end_2)
+
+
+def banded_align(seq_1: SequenceLike, seq_2: SequenceLike, scoring: Scoring, bandwidth: int) -> Alignment:
+    """Global alignment restricted to the cells within bandwidth of the main
+    diagonal, for near-identical sequences. Time and memory are
+    O(len(seq_1) * bandwidth); the result is optimal among alignments whose
+    path stays in the band.
+
+    Arguments:
+        seq_1 {SequenceLike} -- first sequence
+        seq_2 {SequenceLike} -- second sequence
+        scoring {Scoring} -- scoring scheme
+        bandwidth {int} -- largest allowed |i - j| on the alignment path, at least the length difference
+
+    Returns:
+        Alignment -- score and aligned rows
+
+    Example:
+    >>> from bioalgo.alignment.scoring import simple_scoring
+    >>> banded_align("ACGTTACGTA", "ACGTACGGTA", simple_scoring(), 1)[:3]
+    (7, 'ACGTTAC-GTA', 'ACG-TACGGTA')
+
+    """
+    a, b = _encode(seq_1), _encode(seq_2)
+    if bandwidth < abs(len(a) - len(b)):
+        raise ValueError("bandwidth must be at least the difference of the sequence lengths")
+
+    g, h = _gap_costs(scoring)
+    aligned_1, aligned_2 = _traceback_align(a, b, scoring.matrix, g, h, g, g, bandwidth)
+    aligned_1, aligned_2 = aligned_1.decode("ascii"), aligned_2.decode("ascii")
+
+    return Alignment(score_alignment(aligned_1, aligned_2, scoring), aligned_1, aligned_2, 0, len(a), 0, len(b))
@@ -0,0 +1,134 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+BLOSUM62 = """
+   A  C  D  E  F  G  H  I  K  L  M  N  P  Q  R  S  T  V  W  Y
+A  4  0 -2 -1 -2  0 -2 -1 -1 -1 -1 -2 -1 -1 -1  1  0  0 -3 -2
+C  0  9 -3 -4 -2 -3 -3 -1 -3 -1 -1 -3 -3 -3 -3 -1 -1 -1 -2 -2
+D -2 -3  6  2 -3 -1 -1 -3 -1 -4 -3  1 -1  0 -2  0 -1 -3 -4 -3
+E -1 -4  2  5 -3 -2  0 -3  1 -3 -2  0 -1  2  0  0 -1 -2 -3 -2
+F -2 -2 -3 -3  6 -3 -1  0 -3  0  0 -3 -4 -3 -3 -2 -2 -1  1  3
+G  0 -3 -1 -2 -3  6 -2 -4 -2 -4 -3  0 -2 -2 -2  0 -2 -3 -2 -3
+H -2 -3 -1  0 -1 -2  8 -3 -1 -3 -2  1 -2  0  0 -1 -2 -3 -2  2
+I -1 -1 -3 -3  0 -4 -3  4 -3  2  1 -3 -3 -3 -3 -2 -1  3 -3 -1
+K -1 -3 -1  1 -3 -2 -1 -3  5 -2 -1  0 -1  1  2  0 -1 -2 -3 -2
+L -1 -1 -4 -3  0 -4 -3  2 -2  4  2 -3 -3 -2 -2 -2 -1  1 -2 -1
+M -1 -1 -3 -2  0 -3 -2  1 -1  2  5 -2 -2  0 -1 -1 -1  1 -1 -1
+N -2 -3  1  0 -3  0  1 -3  0 -3 -2  6 -2  0  0  1  0 -3 -4 -2
+P -1 -3 -1 -1 -4 -2 -2 -3 -1 -3 -2 -2  7 -1 -2 -1 -1 -2 -4 -3
+Q -1 -3  0  2 -3 -2  0 -3  1 -2  0  0 -1  5  1  0 -1 -2 -2 -1
+R -1 -3 -2  0 -3 -2  0 -3  2 -2 -1  0 -2  1  5 -1 -1 -3 -3 -2
+S  1 -1  0  0 -2  0 -1 -2  0 -2 -1  1 -1  0 -1  4  1 -2 -3 -2
+T  0 -1 -1 -1 -2 -2 -2 -1 -1 -1 -1  0 -1 -1 -1  1  5  0 -2 -2
+V  0 -1 -3 -2 -1 -3 -3  3 -2  1  1 -3 -2 -2 -3 -2  0  4 -3 -1
+W -3 -2 -4 -3  1 -2 -2 -3 -3 -2 -1 -4 -4 -2 -3 -3 -2 -3 11  2
+Y -2 -2 -3 -2  3 -3  2 -1 -2 -1 -1 -2 -3 -1 -2 -2 -2 -1  2  7
+"""
+
+PAM250 = """
+   A  C  D  E  F  G  H  I  K  L  M  N  P  Q  R  S  T  V  W  Y
+A  2 -2  0  0 -3  1 -1 -1 -1 -2 -1  0  1  0 -2  1  1  0 -6 -3
+C -2 12 -5 -5 -4 -3 -3 -2 -5 -6 -5 -4 -3 -5 -4  0 -2 -2 -8  0
+D  0 -5  4  3 -6  1  1 -2  0 -4 -3  2 -1  2 -1  0  0 -2 -7 -4
+E  0 -5  3  4 -5  0  1 -2  0 -3 -2  1 -1  2 -1  0  0 -2 -7 -4
+F -3 -4 -6 -5  9 -5 -2  1 -5  2  0 -3 -5 -5 -4 -3 -3 -1  0  7
+G  1 -3  1  0 -5  5 -2 -3 -2 -4 -3  0  0 -1 -3  1  0 -1 -7 -5
+H -1 -3  1  1 -2 -2  6 -2  0 -2 -2  2  0  3  2 -1 -1 -2 -3  0
+I -1 -2 -2 -2  1 -3 -2  5 -2  2  2 -2 -2 -2 -2 -1  0  4 -5 -1
+K -1 -5  0  0 -5 -2  0 -2  5 -3  0  1 -1  1  3  0  0 -2 -3 -4
+L -2 -6 -4 -3  2 -4 -2  2 -3  6  4 -3 -3 -2 -3 -3 -2  2 -2 -1
+M -1 -5 -3 -2  0 -3 -2  2  0  4  6 -2 -2 -1  0 -2 -1  2 -4 -2
+N  0 -4  2  1 -3  0  2 -2  1 -3 -2  2  0  1  0  1  0 -2 -4 -2
+P  1 -3 -1 -1 -5  0  0 -2 -1 -3 -2  0  6  0  0  1  0 -1 -6 -5
+Q  0 -5  2  2 -5 -1  3 -2  1 -2 -1  1  0  4  1 -1 -1 -2 -5 -4
+R -2 -4 -1 -1 -4 -3  2 -2  3 -3  0  0  0  1  6  0 -1 -2  2 -4
+S  1  0  0  0 -3  1 -1 -1  0 -3 -2  1  1 -1  0  2  1 -1 -2 -3
+T  1 -2  0  0 -3  0 -1  0  0 -2 -1  0  0 -1 -1  1  3  0 -5 -3
+V  0 -2 -2 -2 -1 -1 -2  4 -2  2  2 -2 -1 -2 -2 -1  0  4 -6 -2
+W -6 -8 -7 -7  0 -7 -3 -5 -3 -2 -4 -4 -6 -5  2 -2 -5 -6 17  0
+Y -3  0 -4 -4  7 -5  0 -1 -4 -1 -2 -2 -5 -4 -4 -3 -3 -2  0 10
+"""
+
+
+class Scoring(NamedTuple):
+    """Substitution scores for every pair of byte values, and affine gap
+    penalties: a gap of length L costs gap_open + (L - 1) * gap_extend, so a
+    linear gap penalty has gap_open == gap_extend"""
+    matrix: np.ndarray
+    gap_open: int
+    gap_extend: int
+
+
+def _check_gaps(gap_open: int, gap_extend: int) -> None:
+    if not 0 <= gap_extend <= gap_open:
+        raise ValueError("Gap penalties must satisfy 0 <= gap_extend <= gap_open")
+
+
+def simple_scoring(match: int = 1, mismatch: int = -1, gap_open: int = 1, gap_extend: int = None) -> Scoring:
+    """Score identical symbols (ignoring case) with match and any other pair with mismatch
+
+    Keyword Arguments:
+        match {int} -- score of identical symbols (default: {1})
+        mismatch {int} -- score of different symbols (default: {-1})
+        gap_open {int} -- penalty of a gap of length one (default: {1})
+        gap_extend {int} -- penalty of each further gap position, None for a linear gap penalty (default: {None})
+
+    Returns:
+        Scoring -- scoring scheme
+
+    Example:
+    >>> scoring = simple_scoring(2, -3, 5, 2)
+    >>> int(scoring.matrix[ord("A"), ord("a")]), int(scoring.matrix[ord("A"), ord("C")]), scoring.gap_extend
+    (2, -3, 2)
+
+    """
+    gap_extend = gap_open if gap_extend is None else gap_extend
+    _check_gaps(gap_open, gap_extend)
+
+    folded = np.frombuffer(bytes(range(256)).upper(), dtype=np.uint8)
+    matrix = np.where(folded[:, None] == folded[None, :], match, mismatch).astype(np.int32)
+
+    return Scoring(matrix, gap_open, gap_extend)
+
+
+def matrix_scoring(table: str, gap_open: int, gap_extend: int = None, default: int = None) -> Scoring:
+    """Build a scoring scheme from a substitution table in the usual text layout:
+    a header row of symbols followed by one row per symbol. Lowercase symbols
+    score like uppercase ones.
+
+    Arguments:
+        table {str} -- substitution table, such as BLOSUM62 or PAM250
+        gap_open {int} -- penalty of a gap of length one
+
+    Keyword Arguments:
+        gap_extend {int} -- penalty of each further gap position, None for a linear gap penalty (default: {None})
+        default {int} -- score of pairs with a symbol missing from the table, None for the table's minimum (default: {None})
+
+    Returns:
+        Scoring -- scoring scheme
+
+    Example:
+    >>> scoring = matrix_scoring(BLOSUM62, 11, 1)
+    >>> int(scoring.matrix[ord("W"), ord("W")]), int(scoring.matrix[ord("p"), ord("E")])
+    (11, -1)
+
+    """
+    gap_extend = gap_open if gap_extend is None else gap_extend
+    _check_gaps(gap_open, gap_extend)
+
+    lines = [line.split() for line in table.strip().splitlines()]
+    symbols = lines[0]
+    scores = np.array([[int(value) for value in line[1:]] for line in lines[1:]], dtype=np.int32)
+    rows = [line[0] for line in lines[1:]]
+    if rows != symbols or scores.shape != (len(symbols), len(symbols)):
+        raise ValueError("Substitution table must be square with matching row and column symbols")
+
+    matrix = np.full((256, 256), scores.min() if default is None else default, dtype=np.int32)
+    codes = np.array([[ord(s), ord(s.lower())] for s in symbols])
+    for i in range(2):
+        for j in range(2):
+            matrix[np.ix_(codes[:, i], codes[:, j])] = scores
+
+    return Scoring(matrix, gap_open, gap_extend)
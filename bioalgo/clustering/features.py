@@ -0,0 +1,189 @@
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import decode_kmers, encode_kmers
+from bioalgo.strings.kmer_counting import kmer_code_array, sequence_to_codes
+from bioalgo.strings.mismatch_counting import reverse_complement_codes
+
+
+FEATURE_MAX_K = 8  # 4^8 = 65536 float32 columns per sequence
+BATCH_BASES = 1 << 24  # bases concatenated and counted at once
+
+
+def _check_k(k: int) -> None:
+    if not 1 <= k <= FEATURE_MAX_K:
+        raise ValueError(f"k must be between 1 and {FEATURE_MAX_K} for a dense feature matrix")
+
+
+def _canonical_columns(k: int) -> np.ndarray:
+    codes = np.arange(4 ** k, dtype=np.uint64)
+    return np.flatnonzero(codes <= reverse_complement_codes(codes, k))
+
+
+def feature_names(k: int, canonical: bool = False) -> List[str]:
+    """Names of the columns of kmer_feature_matrix
+
+    Arguments:
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        canonical {bool} -- one column per k-mer and reverse complement pair (default: {False})
+
+    Returns:
+        List[str] -- k-mer of each column, in lexicographic order
+
+    Example:
+    >>> feature_names(2, canonical=True)
+    ['AA', 'AC', 'AG', 'AT', 'CA', 'CC', 'CG', 'GA', 'GC', 'TA']
+
+    """
+    _check_k(k)
+    columns = _canonical_columns(k) if canonical else np.arange(4 ** k)
+
+    return decode_kmers(columns, k)
+
+
+def _count_batch(sequences: Sequence[str], k: int) -> np.ndarray:
+    # one INVALID separator after each sequence keeps windows from spanning two of them
+    lengths = np.array([len(sequence) + 1 for sequence in sequences])
+    codes = sequence_to_codes("\n".join(sequences) + "\n")
+    windows, valid = kmer_code_array(codes, k)
+    rows = np.repeat(np.arange(len(sequences)), lengths)[:len(windows)]
+    flat = rows[valid] * 4 ** k + windows[valid].astype(np.intp)
+
+    return np.bincount(flat, minlength=len(sequences) * 4 ** k).reshape(len(sequences), 4 ** k)
+
+
+def _finish(counts: np.ndarray, k: int, canonical: bool, normalize: bool) -> np.ndarray:
+    if canonical:
+        columns = _canonical_columns(k)
+        reverse = reverse_complement_codes(columns, k).astype(np.intp)
+        palindromes = reverse == columns
+        counts = counts[:, columns] + np.where(palindromes, 0, counts[:, reverse])
+    features = counts.astype(np.float32)
+    if normalize:
+        totals = features.sum(axis=1, keepdims=True)
+        features /= np.where(totals > 0, totals, 1)
+
+    return features
+
+
+def iter_feature_batches(sequences: Iterable[str], k: int, canonical: bool = False,
+                         normalize: bool = True) -> Iterator[np.ndarray]:
+    """Compute k-mer frequency vectors for batches of about BATCH_BASES bases.
+    Each batch is joined into one string, coded with a single kmer_code_array
+    call and counted with one bincount over (row, k-mer) pairs.
+
+    Arguments:
+        sequences {Iterable[str]} -- DNA sequences, such as reads or contigs
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        canonical {bool} -- add the counts of each k-mer and its reverse complement (default: {False})
+        normalize {bool} -- divide each row by its number of k-mers (default: {True})
+
+    Yields:
+        Iterator[np.ndarray] -- float32 feature rows of consecutive sequences
+    """
+    _check_k(k)
+    batch, size = [], 0
+    for sequence in sequences:
+        batch.append(sequence)
+        size += len(sequence) + 1
+        if size >= BATCH_BASES or len(batch) * 4 ** k >= BATCH_BASES:
+            yield _finish(_count_batch(batch, k), k, canonical, normalize)
+            batch, size = [], 0
+    if batch:
+        yield _finish(_count_batch(batch, k), k, canonical, normalize)
+
+
+def kmer_feature_matrix(sequences: Iterable[str], k: int, canonical: bool = False,
+                        normalize: bool = True) -> np.ndarray:
+    """Dense float32 matrix of k-mer frequency vectors, one row per sequence.
+    k-mers containing symbols other than ACGT are not counted.
+
+    Arguments:
+        sequences {Iterable[str]} -- DNA sequences, such as reads or contigs
+        k {int} -- k-mer length (k <= 8)
+
+    Keyword Arguments:
+        canonical {bool} -- add the counts of each k-mer and its reverse complement (default: {False})
+        normalize {bool} -- divide each row by its number of k-mers (default: {True})
+
+    Returns:
+        np.ndarray -- (n, 4^k) feature matrix, columns in the order of feature_names
+
+    Example:
+    >>> kmer_feature_matrix(["ACGT", "AANAA"], 1, normalize=False).tolist()
+    [[1.0, 1.0, 1.0, 1.0], [4.0, 0.0, 0.0, 0.0]]
+    >>> kmer_feature_matrix(["AAAC", "GTTT"], 2, canonical=True, normalize=False)[:, :2].tolist()
+    [[2.0, 1.0], [2.0, 1.0]]
+
+    """
+    batches = list(iter_feature_batches(sequences, k, canonical, normalize))
+    if not batches:
+        return np.zeros((0, len(feature_names(k, canonical))), dtype=np.float32)
+
+    return np.concatenate(batches)
+
+
+def save_feature_matrix(path: str, sequences: Sequence[str], k: int, canonical: bool = False,
+                        normalize: bool = True) -> np.ndarray:
+    """Write the feature matrix of many sequences to a .npy file batch by batch,
+    so it never has to fit in memory. The result can be clustered with
+    minibatch_kmeans(path, ...).
+
+    Arguments:
+        path {str} -- output .npy path
+        sequences {Sequence[str]} -- DNA sequences
+        k {int} -- k-mer length (k <= 8)
+
+    Keyword Arguments:
+        canonical {bool} -- add the counts of each k-mer and its reverse complement (default: {False})
+        normalize {bool} -- divide each row by its number of k-mers (default: {True})
+
+    Returns:
+        np.ndarray -- the written matrix, memory-mapped from path
+    """
+    n_columns = len(feature_names(k, canonical))
+    matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(len(sequences), n_columns))
+    row = 0
+    for batch in iter_feature_batches(sequences, k, canonical, normalize):
+        matrix[row:row + len(batch)] = batch
+        row += len(batch)
+    matrix.flush()
+
+    return matrix
+
+
+def frequencies_to_features(frequencies: Sequence[Dict[str, int]], k: int, canonical: bool = False,
+                            normalize: bool = True) -> np.ndarray:
+    """Turn frequency dictionaries, as returned by compute_frequencies, into a
+    feature matrix with the same columns as kmer_feature_matrix
+
+    Arguments:
+        frequencies {Sequence[Dict[str, int]]} -- k-mer counts of each sequence
+        k {int} -- k-mer length (k <= 8)
+
+    Keyword Arguments:
+        canonical {bool} -- add the counts of each k-mer and its reverse complement (default: {False})
+        normalize {bool} -- divide each row by its number of k-mers (default: {True})
+
+    Returns:
+        np.ndarray -- (n, columns) float32 feature matrix
+
+    Example:
+    >>> from bioalgo.strings.compute_frequencies import compute_frequencies
+    >>> frequencies_to_features([compute_frequencies("ACGT", 1)], 1).tolist()
+    [[0.25, 0.25, 0.25, 0.25]]
+
+    """
+    _check_k(k)
+    counts = np.zeros((len(frequencies), 4 ** k), dtype=np.int64)
+    for row, table in enumerate(frequencies):
+        kmers = [kmer for kmer in table if len(kmer) == k and not set(kmer.upper()) - set("ACGT")]
+        if kmers:
+            np.add.at(counts[row], encode_kmers(kmers).astype(np.intp), [table[kmer] for kmer in kmers])
+
+    return _finish(counts, k, canonical, normalize)
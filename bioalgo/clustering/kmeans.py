@@ -0,0 +1,333 @@
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+
+INITS = ("k-means++", "farthest-first", "first")
+BLOCK_CELLS = 1 << 22  # point-center distances computed at once
+
+PointsLike = Union[str, np.ndarray]
+
+
+class KMeansResult(NamedTuple):
+    """Hard clustering: centers, the index of the nearest center of each point,
+    the sum of squared distances of points to their centers and the number of
+    iterations run"""
+    centers: np.ndarray
+    labels: np.ndarray
+    inertia: float
+    n_iter: int
+
+
+class SoftKMeansResult(NamedTuple):
+    """Soft clustering: centers, the (points, clusters) responsibility of each
+    cluster for each point and the number of iterations run"""
+    centers: np.ndarray
+    responsibilities: np.ndarray
+    n_iter: int
+
+
+def check_init(init: str) -> None:
+    """Raise a ValueError if init is not one of the supported seeding methods
+
+    Arguments:
+        init {str} -- name of the seeding method
+    """
+    if init not in INITS:
+        raise ValueError(f"Unknown init: {init!r}, expected one of {INITS}")
+
+
+def _generator(rng: Union[np.random.Generator, int, None]) -> np.random.Generator:
+    return rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+
+
+def _block_rows(points: np.ndarray, k: int) -> int:
+    return max(1, BLOCK_CELLS // max(k, points.shape[1]))
+
+
+def squared_distances(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Squared Euclidean distance of every point to every center, expanded as
+    |x|^2 - 2 x.c + |c|^2 so the bulk of the work is one matrix product
+
+    Arguments:
+        points {np.ndarray} -- (n, d) points
+        centers {np.ndarray} -- (k, d) centers
+
+    Returns:
+        np.ndarray -- (n, k) squared distances
+
+    Example:
+    >>> squared_distances(np.array([[0, 0], [3, 4]]), np.array([[0, 0], [1, 1]])).tolist()
+    [[0.0, 2.0], [25.0, 13.0]]
+
+    """
+    points = np.asarray(points, dtype=np.float32)
+    centers = np.asarray(centers, dtype=np.float32)
+    distances = points @ centers.T
+    distances *= -2
+    distances += np.einsum("ij,ij->i", points, points)[:, None]
+    distances += np.einsum("ij,ij->i", centers, centers)[None, :]
+
+    return np.maximum(distances, 0, out=distances)
+
+
+def assign(points: np.ndarray, centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Nearest center of every point, computed in blocks of rows so that the
+    distance matrix stays below BLOCK_CELLS cells. points may be a memory-mapped
+    array, which is then read one block at a time.
+
+    Arguments:
+        points {np.ndarray} -- (n, d) points
+        centers {np.ndarray} -- (k, d) centers
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- index of the nearest center and squared distance to it
+    """
+    n = len(points)
+    labels = np.empty(n, dtype=np.intp)
+    nearest = np.empty(n, dtype=np.float32)
+    block = _block_rows(points, len(centers))
+    for first in range(0, n, block):
+        distances = squared_distances(points[first:first + block], centers)
+        labels[first:first + block] = distances.argmin(axis=1)
+        nearest[first:first + block] = distances[np.arange(len(distances)), labels[first:first + block]]
+
+    return labels, nearest
+
+
+def _weighted_sums(points: np.ndarray, weights_of_block, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum of points weighted by each cluster's weight, block by block: one
+    (k, block) x (block, d) product per block"""
+    sums = np.zeros((k, points.shape[1]))
+    totals = np.zeros(k)
+    block = _block_rows(points, k)
+    for first in range(0, len(points), block):
+        weights = weights_of_block(first, first + block)
+        sums += weights.T @ np.asarray(points[first:first + block], dtype=np.float32)
+        totals += weights.sum(axis=0)
+
+    return sums, totals
+
+
+def _one_hot(labels: np.ndarray, k: int) -> np.ndarray:
+    return (labels[:, None] == np.arange(k)).astype(np.float32)
+
+
+def initial_centers(points: np.ndarray, k: int, init: str = "k-means++",
+                    rng: Union[np.random.Generator, int, None] = None) -> np.ndarray:
+    """Choose k initial centers among the points. k-means++ samples each new
+    center with probability proportional to its squared distance to the
+    nearest chosen center; farthest-first takes the farthest point outright
+    and first takes the first k points, as in the textbook's Lloyd algorithm.
+
+    Arguments:
+        points {np.ndarray} -- (n, d) points
+        k {int} -- number of centers
+
+    Keyword Arguments:
+        init {str} -- "k-means++", "farthest-first" or "first" (default: {"k-means++"})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        np.ndarray -- (k, d) float32 centers
+
+    Example:
+    >>> points = np.array([[0, 0], [5, 5], [3, 4], [1, 1], [0, 1]])
+    >>> initial_centers(points, 3, "farthest-first").tolist()
+    [[0.0, 0.0], [5.0, 5.0], [3.0, 4.0]]
+
+    """
+    check_init(init)
+    if not 1 <= k <= len(points):
+        raise ValueError("k must be between 1 and the number of points")
+    if init == "first":
+        return np.array(points[:k], dtype=np.float32)
+
+    rng = _generator(rng)
+    chosen = [0 if init == "farthest-first" else int(rng.integers(len(points)))]
+    closest = assign(points, np.asarray(points[chosen], dtype=np.float32))[1].astype(np.float64)
+    while len(chosen) < k:
+        if init == "farthest-first" or not closest.sum():
+            chosen.append(int(closest.argmax()))
+        else:
+            chosen.append(int(np.searchsorted(np.cumsum(closest), rng.random() * closest.sum(), side="right")))
+        new = np.asarray(points[chosen[-1:]], dtype=np.float32)
+        np.minimum(closest, assign(points, new)[1], out=closest)
+
+    return np.asarray(points[chosen], dtype=np.float32)
+
+
+def _start(points: np.ndarray, k: int, init: Union[str, np.ndarray], rng) -> np.ndarray:
+    if isinstance(init, str):
+        return initial_centers(points, k, init, rng)
+
+    centers = np.array(init, dtype=np.float32)
+    if centers.shape != (k, points.shape[1]):
+        raise ValueError("Initial centers must have shape (k, number of features)")
+
+    return centers
+
+
+def lloyd(points: np.ndarray, k: int, init: Union[str, np.ndarray] = "k-means++", max_iter: int = 300,
+          tol: float = 1e-8, rng: Union[np.random.Generator, int, None] = None) -> KMeansResult:
+    """Lloyd's k-means: assign every point to its nearest center, move each
+    center to the mean of its points and repeat until the centers stop
+    moving. A center left without points is moved to the point farthest from
+    its own center.
+
+    Arguments:
+        points {np.ndarray} -- (n, d) points, such as a kmer_feature_matrix
+        k {int} -- number of clusters
+
+    Keyword Arguments:
+        init {Union[str, np.ndarray]} -- seeding method of initial_centers, or (k, d) initial centers (default: {"k-means++"})
+        max_iter {int} -- maximum number of iterations (default: {300})
+        tol {float} -- stop once the centers move by less than this in total squared distance (default: {1e-8})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        KMeansResult -- centers, labels, inertia and number of iterations
+
+    Example:
+    >>> points = np.array([[1.3, 1.1], [1.3, 0.2], [0.6, 2.8], [3.0, 3.2], [1.2, 0.7], [1.4, 1.6], [1.2, 1.0],
+    ...                    [1.2, 1.1], [0.6, 1.5], [1.8, 2.6], [1.2, 1.3], [1.2, 1.0], [0.0, 1.9]])
+    >>> result = lloyd(points, 2, init="first")
+    >>> result.centers.astype(float).round(3).tolist(), result.labels.tolist()
+    ([[1.8, 2.867], [1.06, 1.14]], [1, 1, 0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1])
+
+    """
+    rng = _generator(rng)
+    centers = _start(points, k, init, rng)
+
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        labels, nearest = assign(points, centers)
+        sums, totals = _weighted_sums(points, lambda first, last: _one_hot(labels[first:last], k), k)
+        new_centers = (sums / np.where(totals > 0, totals, 1)[:, None]).astype(np.float32)
+        for empty in np.flatnonzero(totals == 0):
+            farthest = int(nearest.argmax())
+            new_centers[empty] = points[farthest]
+            nearest[farthest] = 0
+        shift = float(((new_centers - centers) ** 2).sum())
+        centers = new_centers
+        if shift <= tol:
+            break
+
+    labels, nearest = assign(points, centers)
+
+    return KMeansResult(centers, labels, float(nearest.sum(dtype=np.float64)), n_iter)
+
+
+def soft_kmeans(points: np.ndarray, k: int, stiffness: float = 1.0, init: Union[str, np.ndarray] = "k-means++",
+                max_iter: int = 100, tol: float = 1e-8,
+                rng: Union[np.random.Generator, int, None] = None) -> SoftKMeansResult:
+    """Soft k-means, the expectation maximization clustering of the textbook:
+    the responsibility of cluster i for point x is proportional to
+    exp(-stiffness * distance(x, center_i)), and each center moves to the
+    responsibility-weighted mean of all points. Responsibilities are computed
+    for all points and clusters at once, shifted by each point's nearest
+    distance so that large stiffness does not underflow.
+
+    Arguments:
+        points {np.ndarray} -- (n, d) points
+        k {int} -- number of clusters
+
+    Keyword Arguments:
+        stiffness {float} -- larger values approach hard k-means (default: {1.0})
+        init {Union[str, np.ndarray]} -- seeding method of initial_centers, or (k, d) initial centers (default: {"k-means++"})
+        max_iter {int} -- maximum number of iterations (default: {100})
+        tol {float} -- stop once the centers move by less than this in total squared distance (default: {1e-8})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        SoftKMeansResult -- centers, responsibilities and number of iterations
+
+    Example:
+    >>> points = np.array([[1.3, 1.1], [1.3, 0.2], [0.6, 2.8], [3.0, 3.2], [1.2, 0.7], [1.4, 1.6], [1.2, 1.0],
+    ...                    [1.2, 1.1], [0.6, 1.5], [1.8, 2.6], [1.2, 1.3], [1.2, 1.0], [0.0, 1.9]])
+    >>> result = soft_kmeans(points, 2, stiffness=2.7, init="first")
+    >>> result.centers.astype(float).round(3).tolist()
+    [[1.662, 2.623], [1.075, 1.148]]
+
+    """
+    rng = _generator(rng)
+    centers = _start(points, k, init, rng)
+
+    def responsibilities(first: int, last: int) -> np.ndarray:
+        distances = np.sqrt(squared_distances(points[first:last], centers))
+        weights = np.exp(-stiffness * (distances - distances.min(axis=1, keepdims=True)))
+        return weights / weights.sum(axis=1, keepdims=True)
+
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        sums, totals = _weighted_sums(points, responsibilities, k)
+        new_centers = (sums / np.where(totals > 0, totals, 1)[:, None]).astype(np.float32)
+        shift = float(((new_centers - centers) ** 2).sum())
+        centers = new_centers
+        if shift <= tol:
+            break
+
+    return SoftKMeansResult(centers, responsibilities(0, len(points)), n_iter)
+
+
+def minibatch_kmeans(points: PointsLike, k: int, batch_size: int = 4096, max_iter: int = 100,
+                     init: Union[str, np.ndarray] = "k-means++", init_size: int = None,
+                     rng: Union[np.random.Generator, int, None] = None) -> KMeansResult:
+    """Mini-batch k-means for feature matrices too large for memory. A path is
+    opened with np.load(mmap_mode="r"), so only the sampled rows of each batch
+    are read. Each step moves every center to the running mean of all points
+    assigned to it so far, so a center's learning rate falls as 1/count.
+    Centers are seeded from a random sample of init_size rows, and a final
+    blocked pass labels every point.
+
+    Arguments:
+        points {PointsLike} -- (n, d) array, or path of a .npy file such as written by save_feature_matrix
+        k {int} -- number of clusters
+
+    Keyword Arguments:
+        batch_size {int} -- rows sampled per step (default: {4096})
+        max_iter {int} -- number of steps (default: {100})
+        init {Union[str, np.ndarray]} -- seeding method of initial_centers, or (k, d) initial centers (default: {"k-means++"})
+        init_size {int} -- rows sampled for seeding, None for 3 * batch_size (default: {None})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        KMeansResult -- centers, labels, inertia and number of steps
+
+    Example:
+    >>> rng = np.random.default_rng(0)
+    >>> points = np.concatenate([rng.normal(0, 0.1, (500, 2)), rng.normal(5, 0.1, (500, 2))])
+    >>> result = minibatch_kmeans(points, 2, batch_size=100, max_iter=20, rng=1)
+    >>> sorted(result.centers.round().astype(int).tolist()), np.bincount(result.labels).tolist()
+    ([[0, 0], [5, 5]], [500, 500])
+
+    """
+    if isinstance(points, str):
+        points = np.load(points, mmap_mode="r")
+    rng = _generator(rng)
+    n = len(points)
+
+    if isinstance(init, str):
+        sample = np.unique(rng.integers(0, n, size=min(n, init_size or 3 * batch_size)))
+        if len(sample) < k:
+            sample = np.arange(min(n, max(k, len(sample))))
+        centers = initial_centers(np.asarray(points[sample], dtype=np.float32), k, init, rng)
+    else:
+        centers = _start(points, k, init, rng)
+
+    counts = np.zeros(k)
+    for _ in range(max_iter):
+        # sorted, distinct rows keep reads from a memory map sequential
+        rows = np.unique(rng.integers(0, n, size=batch_size)) if batch_size < n else np.arange(n)
+        batch = np.asarray(points[rows], dtype=np.float32)
+        labels, _ = assign(batch, centers)
+        one_hot = _one_hot(labels, k)
+        batch_counts = one_hot.sum(axis=0)
+        counts += batch_counts
+        moved = batch_counts > 0
+        sums = one_hot.T @ batch
+        centers[moved] += (sums[moved] - batch_counts[moved, None] * centers[moved]) / counts[moved, None]
+
+    labels, nearest = assign(points, centers)
+
+    return KMeansResult(centers, labels, float(nearest.sum(dtype=np.float64)), max_iter)
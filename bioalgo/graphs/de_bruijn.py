@@ -0,0 +1,352 @@
+from array import array
+from typing import Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import MAX_K, decode_kmer, decode_kmers, encode_kmers
+from bioalgo.strings.kmer_counting import kmer_code_array
+from bioalgo.strings.mismatch_counting import reverse_complement_codes
+
+
+DEFAULT_BATCH_SIZE = 1 << 24  # k-mer codes collected before they are merged into the counts
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(16)], dtype=np.uint8)
+_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+_OUT_MASK = np.uint8(0x0F)
+
+
+def _merge_counts(codes: np.ndarray, counts: np.ndarray, new_codes: np.ndarray) -> tuple:
+    """Add a batch of k-mer codes to sorted distinct codes and their counts"""
+    new_codes, new_counts = np.unique(new_codes, return_counts=True)
+    merged, inverse = np.unique(np.concatenate((codes, new_codes)), return_inverse=True)
+    totals = np.zeros(len(merged), dtype=np.int64)
+    np.add.at(totals, inverse, np.concatenate((counts, new_counts)))
+
+    return merged, totals
+
+
+class DeBruijnGraph:
+    """De Bruijn graph of a k-mer multiset, with the (k-1)-mers as nodes and one
+    edge per distinct k-mer. Nodes are held as a sorted array of 2-bit codes and
+    each node's edges as a byte of bitmaps: bit b of the low nibble is set when
+    the node followed by base b is a k-mer, bit b of the high nibble when base b
+    followed by the node is. Edge multiplicities are kept in sorted k-mer order,
+    which is the order of (source node, base), so the graph costs about 13 bytes
+    per distinct k-mer.
+
+    Arguments:
+        codes {np.ndarray} -- sorted distinct k-mer codes
+        counts {np.ndarray} -- multiplicity of each k-mer
+        k {int} -- k-mer length (2 <= k <= 32)
+
+    Example:
+    >>> graph = DeBruijnGraph.from_kmers(["GAGG", "CAGG", "GGGG", "GGGA", "CAGG", "AGGG", "GGAG"])
+    >>> graph.n_nodes, graph.n_edges
+    (5, 6)
+    >>> graph.adjacency()["CAG"]
+    ['AGG', 'AGG']
+
+    """
+
+    def __init__(self, codes: np.ndarray, counts: np.ndarray, k: int):
+        if not 2 <= k <= MAX_K:
+            raise ValueError(f"k must be between 2 and {MAX_K}")
+
+        codes = np.asarray(codes, dtype=np.uint64)
+        if len(codes) > 1 and not (codes[1:] > codes[:-1]).all():
+            raise ValueError("k-mer codes must be sorted and distinct")
+
+        self.k = k
+        node_mask = np.uint64((1 << (2 * (k - 1))) - 1)
+        prefixes = codes >> np.uint64(2)
+        suffixes = codes & node_mask
+        self.nodes = np.union1d(prefixes, suffixes)
+
+        first_bases = (codes >> np.uint64(2 * (k - 1))).astype(np.uint8)
+        last_bases = (codes & np.uint64(0b11)).astype(np.uint8)
+        self.masks = np.zeros(len(self.nodes), dtype=np.uint8)
+        np.bitwise_or.at(self.masks, np.searchsorted(self.nodes, prefixes), np.left_shift(1, last_bases).astype(np.uint8))
+        np.bitwise_or.at(self.masks, np.searchsorted(self.nodes, suffixes),
+                         np.left_shift(16, first_bases).astype(np.uint8))
+        self.counts = np.asarray(counts, dtype=np.uint32)
+
+    @classmethod
+    def from_sequences(cls, sequences: Iterable[Union[str, bytes]], k: int, min_count: int = 1,
+                       include_reverse: bool = False, batch_size: int = DEFAULT_BATCH_SIZE) -> "DeBruijnGraph":
+        """Build the graph of every k-mer in a stream of reads or contigs. Codes are
+        collected in batches and merged into sorted counts, so the strings are never
+        held at once. Windows containing non-ACGT symbols are skipped.
+
+        Arguments:
+            sequences {Iterable[Union[str, bytes]]} -- DNA strings
+            k {int} -- k-mer length
+
+        Keyword Arguments:
+            min_count {int} -- drop k-mers seen fewer times, such as those from sequencing errors (default: {1})
+            include_reverse {bool} -- also add the reverse complement of every k-mer (default: {False})
+            batch_size {int} -- k-mer codes collected before merging (default: {DEFAULT_BATCH_SIZE})
+
+        Returns:
+            DeBruijnGraph -- graph of the k-mers
+
+        Example:
+        >>> DeBruijnGraph.from_sequences(["ACGTT", "CGTTA", "AAAA"], 4, min_count=2).adjacency()
+        {'CGT': ['GTT', 'GTT']}
+
+        """
+        codes = np.zeros(0, dtype=np.uint64)
+        counts = np.zeros(0, dtype=np.int64)
+        batch: List[np.ndarray] = []
+        pending = 0
+        for sequence in sequences:
+            kmers, valid = kmer_code_array(sequence, k)
+            kmers = kmers[valid]
+            batch.append(kmers)
+            if include_reverse:
+                batch.append(reverse_complement_codes(kmers, k))
+            pending += len(kmers) * (1 + include_reverse)
+            if pending >= batch_size:
+                codes, counts = _merge_counts(codes, counts, np.concatenate(batch))
+                batch, pending = [], 0
+
+        if batch:
+            codes, counts = _merge_counts(codes, counts, np.concatenate(batch))
+
+        keep = counts >= min_count
+        return cls(codes[keep], counts[keep], k)
+
+    @classmethod
+    def from_kmers(cls, patterns: Sequence[str]) -> "DeBruijnGraph":
+        """Build the graph of a collection of k-mers, repeated k-mers giving parallel edges
+
+        Arguments:
+            patterns {Sequence[str]} -- k-mers of the same length
+
+        Returns:
+            DeBruijnGraph -- graph of the k-mers
+
+        Raises:
+            ValueError -- if there are no k-mers, from which to tell k
+        """
+        if not len(patterns):
+            raise ValueError("At least one k-mer is required to build a graph")
+        codes, counts = np.unique(encode_kmers(patterns), return_counts=True)
+
+        return cls(codes, counts, len(patterns[0]))
+
+    @classmethod
+    def from_frequencies(cls, frequencies: Dict[str, int]) -> "DeBruijnGraph":
+        """Build the graph from k-mer counts, such as the output of compute_frequencies
+
+        Arguments:
+            frequencies {Dict[str, int]} -- k-mers and their counts
+
+        Returns:
+            DeBruijnGraph -- graph of the k-mers
+
+        Raises:
+            ValueError -- if there are no k-mers, from which to tell k
+        """
+        if not frequencies:
+            raise ValueError("At least one k-mer is required to build a graph")
+        patterns = list(frequencies)
+        codes = encode_kmers(patterns)
+        order = np.argsort(codes)
+
+        return cls(codes[order], np.array([frequencies[p] for p in patterns], dtype=np.int64)[order], len(patterns[0]))
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.counts)
+
+    @property
+    def nbytes(self) -> int:
+        return self.nodes.nbytes + self.masks.nbytes + self.counts.nbytes
+
+    def out_degrees(self) -> np.ndarray:
+        """Number of distinct edges leaving each node"""
+        return _POPCOUNT[self.masks & _OUT_MASK]
+
+    def in_degrees(self) -> np.ndarray:
+        """Number of distinct edges entering each node"""
+        return _POPCOUNT[self.masks >> 4]
+
+    def edge_offsets(self) -> np.ndarray:
+        """Index of each node's first edge in sorted k-mer order, plus the number of edges at the end"""
+        return np.concatenate(([0], np.cumsum(self.out_degrees(), dtype=np.int64)))
+
+    def edge_codes(self) -> np.ndarray:
+        """Sorted k-mer codes of the edges, rebuilt from the node codes and out bitmaps"""
+        has_edge = (self.masks[:, None] >> np.arange(4, dtype=np.uint8)) & 1
+        sources, bases = np.nonzero(has_edge)
+
+        return (self.nodes[sources] << np.uint64(2)) | bases.astype(np.uint64)
+
+    def edge_targets(self) -> np.ndarray:
+        """Node index each edge points to, in sorted k-mer order"""
+        node_mask = np.uint64((1 << (2 * (self.k - 1))) - 1)
+
+        return np.searchsorted(self.nodes, self.edge_codes() & node_mask)
+
+    def spell(self, path: np.ndarray) -> str:
+        """Spell the string of a walk given as node indices
+
+        Arguments:
+            path {np.ndarray} -- node indices, each joined to the next by an edge
+
+        Returns:
+            str -- first node followed by the last base of every other node
+        """
+        path = np.asarray(path)
+        if not len(path):
+            return ""
+        last_bases = _BASES[(self.nodes[path[1:]] & np.uint64(0b11)).astype(np.intp)]
+
+        return decode_kmer(int(self.nodes[path[0]]), self.k - 1) + last_bases.tobytes().decode("ascii")
+
+    def adjacency(self) -> Dict[str, List[str]]:
+        """Adjacency list with nodes as strings, each edge repeated by its multiplicity.
+        Meant for small graphs and inspection.
+
+        Returns:
+            Dict[str, List[str]] -- successors of every node with outgoing edges
+        """
+        names = decode_kmers(self.nodes, self.k - 1)
+        sources = np.repeat(np.arange(self.n_nodes), self.out_degrees())
+        adjacency: Dict[str, List[str]] = {}
+        for source, target, count in zip(sources.tolist(), self.edge_targets().tolist(), self.counts.tolist()):
+            adjacency.setdefault(names[source], []).extend([names[target]] * count)
+
+        return adjacency
+
+
+def eulerian_path(graph: DeBruijnGraph) -> np.ndarray:
+    """Find a walk using every edge as many times as its multiplicity with the
+    iterative form of Hierholzer's algorithm. The walk starts at the node with one
+    more outgoing than incoming edge, or anywhere when the graph is balanced, in
+    which case the walk is an Eulerian cycle.
+
+    Arguments:
+        graph {DeBruijnGraph} -- graph to walk
+
+    Returns:
+        np.ndarray -- node indices of the walk
+
+    Raises:
+        ValueError -- if the graph has no Eulerian path
+    """
+    offsets = graph.edge_offsets()
+    sources = np.repeat(np.arange(graph.n_nodes), np.diff(offsets))
+    weights = graph.counts.astype(np.int64)
+    balance = np.bincount(sources, weights, graph.n_nodes) - np.bincount(graph.edge_targets(), weights, graph.n_nodes)
+
+    starts = np.flatnonzero(balance == 1)
+    if (np.abs(balance) > 1).any() or len(starts) > 1 or len(starts) != np.count_nonzero(balance == -1):
+        raise ValueError("Graph has no Eulerian path")
+    if not graph.n_edges:
+        return np.zeros(0, dtype=np.int64)
+
+    start = int(starts[0]) if len(starts) else int(sources[0])
+    targets = memoryview(graph.edge_targets().astype(np.int64))
+    ends = memoryview(offsets[1:].copy())
+    next_edge = memoryview(offsets[:-1].copy())
+    remaining = memoryview(weights.copy())
+
+    stack = array("q", [start])
+    path = array("q")
+    while stack:
+        node = stack[-1]
+        edge, end = next_edge[node], ends[node]
+        while edge < end and not remaining[edge]:
+            edge += 1
+        next_edge[node] = edge
+        if edge < end:
+            remaining[edge] -= 1
+            stack.append(targets[edge])
+        else:
+            path.append(stack.pop())
+
+    if len(path) != int(weights.sum()) + 1:
+        raise ValueError("Graph has no Eulerian path")
+
+    return np.frombuffer(path, dtype=np.int64)[::-1]
+
+
+def string_reconstruction(patterns: Sequence[str]) -> str:
+    """Reconstruct a string from its k-mer composition by spelling an Eulerian
+    path of its de Bruijn graph
+
+    Arguments:
+        patterns {Sequence[str]} -- k-mers of the string, in any order
+
+    Returns:
+        str -- a string whose k-mers are exactly patterns
+
+    Example:
+    >>> string_reconstruction(["CTTA", "ACCA", "TACC", "GGCT", "GCTT", "TTAC"])
+    'GGCTTACCA'
+
+    """
+    graph = DeBruijnGraph.from_kmers(patterns)
+
+    return graph.spell(eulerian_path(graph))
+
+
+def unitigs(graph: DeBruijnGraph) -> List[str]:
+    """Compact the graph into its maximal non-branching paths. A path is extended
+    through every node with exactly one incoming and one outgoing edge, and cycles
+    made only of such nodes are reported once each. Edge multiplicities are read
+    as coverage and do not duplicate unitigs.
+
+    Arguments:
+        graph {DeBruijnGraph} -- graph to compact
+
+    Returns:
+        List[str] -- unitig strings, in order of their first node
+
+    Example:
+    >>> graph = DeBruijnGraph.from_kmers(["ATG", "ATG", "TGT", "TGG", "CAT", "GGA", "GAT", "AGA"])
+    >>> unitigs(graph)
+    ['AGA', 'ATG', 'CAT', 'GAT', 'TGGA', 'TGT']
+
+    """
+    out_degrees = graph.out_degrees()
+    simple = (out_degrees == 1) & (graph.in_degrees() == 1)
+    offsets = graph.edge_offsets()
+    targets = graph.edge_targets()
+
+    is_simple = memoryview(simple.view(np.uint8))
+    first_edge = memoryview(offsets[:-1].copy())
+    target_of = memoryview(targets.astype(np.int64))
+
+    paths = []
+    for node in np.flatnonzero(~simple & (out_degrees > 0)).tolist():
+        for edge in range(offsets[node], offsets[node + 1]):
+            path = array("q", [node])
+            target = target_of[edge]
+            while is_simple[target]:
+                path.append(target)
+                target = target_of[first_edge[target]]
+            path.append(target)
+            paths.append(path)
+
+    visited = np.zeros(graph.n_nodes, dtype=bool)
+    for path in paths:
+        visited[np.frombuffer(path, dtype=np.int64)] = True
+    for node in np.flatnonzero(simple & ~visited).tolist():
+        if visited[node]:
+            continue
+        path = array("q", [node])
+        target = target_of[first_edge[node]]
+        while target != node:
+            path.append(target)
+            target = target_of[first_edge[target]]
+        path.append(node)
+        visited[np.frombuffer(path, dtype=np.int64)] = True
+        paths.append(path)
+
+    return [graph.spell(np.frombuffer(path, dtype=np.int64)) for path in paths]
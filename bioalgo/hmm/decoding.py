@@ -0,0 +1,190 @@
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from bioalgo.hmm.model import HMM, ObservationLike
+
+
+def _pointer_dtype(n_states: int) -> np.dtype:
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n_states <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+
+def _log_dot(log_vector: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """log(exp(log_vector) @ matrix), shifted by the maximum so the product is a
+    plain matrix-vector multiply that cannot underflow"""
+    peak = log_vector.max()
+    if peak == -np.inf:
+        return np.full(matrix.shape[1], -np.inf)
+    with np.errstate(divide="ignore"):
+        return np.log(np.exp(log_vector - peak) @ matrix) + peak
+
+
+def viterbi(hmm: HMM, observations: ObservationLike) -> Tuple[np.ndarray, float]:
+    """Most probable hidden path of the observations. Each step adds the scores
+    of all states to the transposed log transition matrix at once, so the
+    best predecessor of every state is an argmax along a contiguous row, and
+    keeps one back pointer per state and position in the smallest integer type that fits,
+    so a 1 Mb sequence under a 100-state model needs 100 MB of pointers.
+
+    Arguments:
+        hmm {HMM} -- model
+        observations {ObservationLike} -- observed symbols
+
+    Returns:
+        Tuple[np.ndarray, float] -- state index at each position, and the log probability of path and observations
+
+    Example:
+    >>> hmm = HMM([[0.641, 0.359], [0.729, 0.271]], [[0.117, 0.691, 0.192], [0.097, 0.42, 0.483]],
+    ...           states="AB", alphabet="xyz")
+    >>> path, score = viterbi(hmm, "xyxzzxyxyy")
+    >>> hmm.path_names(path), round(score, 4)
+    ('AAABBAAAAA', -17.5239)
+
+    """
+    codes = hmm.encode(observations)
+    if not len(codes):
+        return np.zeros(0, dtype=np.intp), 0.0
+
+    n_states = hmm.n_states
+    emission = np.ascontiguousarray(hmm.log_emission.T)
+    pointers = np.zeros((len(codes), n_states), dtype=_pointer_dtype(n_states))
+    # candidates[j, i] is the score of reaching state j from state i
+    incoming = np.ascontiguousarray(hmm.log_transition.T)
+    candidates = np.empty((n_states, n_states))
+    states = np.arange(n_states)
+
+    score = hmm.log_initial + emission[codes[0]]
+    for t in range(1, len(codes)):
+        np.add(incoming, score, out=candidates)
+        best = candidates.argmax(axis=1)
+        pointers[t] = best
+        score = candidates[states, best] + emission[codes[t]]
+
+    score += hmm.log_final
+    path = np.empty(len(codes), dtype=np.intp)
+    state = int(score.argmax())
+    best_score = float(score[state])
+    flat = pointers.reshape(-1)
+    for t in range(len(codes) - 1, 0, -1):
+        path[t] = state
+        state = int(flat[t * n_states + state])
+    path[0] = state
+
+    return path, best_score
+
+
+def forward(hmm: HMM, observations: ObservationLike) -> Tuple[np.ndarray, float]:
+    """Forward algorithm in log space
+
+    Arguments:
+        hmm {HMM} -- model
+        observations {ObservationLike} -- observed symbols
+
+    Returns:
+        Tuple[np.ndarray, float] -- (n, states) log forward probabilities, and the log likelihood of the observations
+    """
+    codes = hmm.encode(observations)
+    alpha = np.empty((len(codes), hmm.n_states))
+    if not len(codes):
+        return alpha, 0.0
+
+    transition = hmm.transition
+    emission = np.ascontiguousarray(hmm.log_emission.T)
+    alpha[0] = hmm.log_initial + emission[codes[0]]
+    for t in range(1, len(codes)):
+        alpha[t] = _log_dot(alpha[t - 1], transition) + emission[codes[t]]
+
+    return alpha, float(np.logaddexp.reduce(alpha[-1] + hmm.log_final))
+
+
+def backward(hmm: HMM, observations: ObservationLike) -> np.ndarray:
+    """Backward algorithm in log space
+
+    Arguments:
+        hmm {HMM} -- model
+        observations {ObservationLike} -- observed symbols
+
+    Returns:
+        np.ndarray -- (n, states) log probabilities of the observations after each position given its state
+    """
+    codes = hmm.encode(observations)
+    beta = np.empty((len(codes), hmm.n_states))
+    if not len(codes):
+        return beta
+
+    transition_t = np.ascontiguousarray(hmm.transition.T)
+    emission = np.ascontiguousarray(hmm.log_emission.T)
+    beta[-1] = hmm.log_final
+    for t in range(len(codes) - 2, -1, -1):
+        beta[t] = _log_dot(emission[codes[t + 1]] + beta[t + 1], transition_t)
+
+    return beta
+
+
+def posterior_decoding(hmm: HMM, observations: ObservationLike) -> np.ndarray:
+    """Probability of each state at each position given all of the observations,
+    from one forward and one backward pass
+
+    Arguments:
+        hmm {HMM} -- model
+        observations {ObservationLike} -- observed symbols
+
+    Returns:
+        np.ndarray -- (n, states) posterior probabilities, each row summing to one
+
+    Example:
+    >>> hmm = HMM([[0.9, 0.1], [0.1, 0.9]], [[0.9, 0.1], [0.2, 0.8]], states="FB", alphabet="HT")
+    >>> posterior_decoding(hmm, "HHTT").round(3).tolist()
+    [[0.757, 0.243], [0.659, 0.341], [0.138, 0.862], [0.085, 0.915]]
+
+    """
+    alpha, log_likelihood = forward(hmm, observations)
+    if log_likelihood == -np.inf:
+        raise ValueError("Observations have zero probability under the model")
+
+    return np.exp(alpha + backward(hmm, observations) - log_likelihood)
+
+
+def log_likelihood(hmm: HMM, observations: Union[ObservationLike, Iterable[ObservationLike]]) -> float:
+    """Log likelihood of the observations, which may be given as an iterable of
+    consecutive chunks of one sequence (such as the blocks of a FASTA record
+    from bioalgo.seqio.streaming). Only the current forward column is kept, so
+    memory is O(states) however long the sequence.
+
+    Arguments:
+        hmm {HMM} -- model
+        observations {Union[ObservationLike, Iterable[ObservationLike]]} -- observed symbols, or chunks of them
+
+    Returns:
+        float -- natural log of P(observations)
+
+    Example:
+    >>> hmm = HMM([[0.303, 0.697], [0.831, 0.169]], [[0.533, 0.065, 0.402], [0.342, 0.334, 0.324]],
+    ...           states="AB", alphabet="xyz")
+    >>> float(np.exp(log_likelihood(hmm, "xzyyzzyzyy")))  # doctest: +ELLIPSIS
+    1.10055103196948...e-06
+    >>> log_likelihood(hmm, ["xzyy", "zzy", "zyy"]) == log_likelihood(hmm, "xzyyzzyzyy")
+    True
+
+    """
+    if isinstance(observations, (str, bytes, np.ndarray)):
+        observations = [observations]
+
+    transition = hmm.transition
+    emission = np.ascontiguousarray(hmm.log_emission.T)
+    alpha = None
+    for chunk in observations:
+        codes = hmm.encode(chunk)
+        if not len(codes):
+            continue
+        if alpha is None:
+            alpha = hmm.log_initial + emission[codes[0]]
+            codes = codes[1:]
+        for code in codes.tolist():
+            alpha = _log_dot(alpha, transition) + emission[code]
+
+    return 0.0 if alpha is None else float(np.logaddexp.reduce(alpha + hmm.log_final))
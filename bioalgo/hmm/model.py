@@ -0,0 +1,139 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+
+ObservationLike = Union[str, bytes, np.ndarray]
+
+
+def _normalize(matrix: np.ndarray, name: str) -> np.ndarray:
+    matrix = np.array(matrix, dtype=np.float64)
+    if (matrix < 0).any():
+        raise ValueError(f"{name} probabilities must not be negative")
+    totals = matrix.sum(axis=-1, keepdims=True)
+    if (totals <= 0).any():
+        raise ValueError(f"Every row of the {name} matrix needs a positive total")
+
+    return matrix / totals
+
+
+class HMM:
+    """Hidden Markov model over a discrete alphabet. Probabilities are stored as
+    natural logarithms, so decoding and training never underflow on long
+    sequences. Rows of the given matrices are normalized to sum to one. With
+    final probabilities, a sequence ends after its last symbol with the final
+    probability of the last state, and each row of transition and final
+    together sums to one; without them, a sequence may end in any state at no
+    cost.
+
+    Arguments:
+        transition {np.ndarray} -- (states, states) matrix, transition[i, j] = P(next state j | state i)
+        emission {np.ndarray} -- (states, symbols) matrix, emission[i, c] = P(symbol c | state i)
+
+    Keyword Arguments:
+        initial {np.ndarray} -- probability of starting in each state, None for uniform (default: {None})
+        final {np.ndarray} -- probability of ending after each state, None to leave the end unmodelled (default: {None})
+        states {Sequence[str]} -- state names, None for "0", "1", ... (default: {None})
+        alphabet {str} -- observed symbols in column order of emission (default: {"ACGT"})
+
+    Example:
+    >>> hmm = HMM([[0.9, 0.1], [0.2, 0.8]], [[0.5, 0.5], [0.1, 0.9]], states="FB", alphabet="HT")
+    >>> hmm.n_states, hmm.encode("HTTH").tolist()
+    (2, [0, 1, 1, 0])
+    >>> hmm.transition[1].tolist(), hmm.initial.tolist()
+    ([0.2, 0.8], [0.5, 0.5])
+
+    """
+
+    def __init__(self, transition: np.ndarray, emission: np.ndarray, initial: np.ndarray = None,
+                 states: Sequence[str] = None, alphabet: str = "ACGT", final: np.ndarray = None):
+        transition = np.asarray(transition, dtype=np.float64)
+        emission = _normalize(emission, "emission")
+        n_states = len(transition)
+        if transition.shape != (n_states, n_states) or emission.shape != (n_states, len(alphabet)):
+            raise ValueError("Transition must be states x states and emission states x len(alphabet)")
+        self.models_end = final is not None
+        if self.models_end:
+            final = np.asarray(final, dtype=np.float64)
+            if final.shape != (n_states,):
+                raise ValueError("Final probabilities must have one entry per state")
+            joint = _normalize(np.column_stack((transition, final)), "transition")
+            transition, final = joint[:, :-1], joint[:, -1]
+        else:
+            transition = _normalize(transition, "transition")
+            final = np.ones(n_states)
+        initial = np.full(n_states, 1 / n_states) if initial is None else _normalize(initial, "initial")
+        if initial.shape != (n_states,):
+            raise ValueError("Initial distribution must have one entry per state")
+        if len(set(alphabet)) != len(alphabet) or any(ord(symbol) > 255 for symbol in alphabet):
+            raise ValueError("Alphabet symbols must be distinct single-byte characters")
+
+        self.states = [str(i) for i in range(n_states)] if states is None else list(states)
+        if len(self.states) != n_states:
+            raise ValueError("There must be one name per state")
+        self.alphabet = alphabet
+
+        with np.errstate(divide="ignore"):
+            self.log_transition = np.log(transition)
+            self.log_emission = np.log(emission)
+            self.log_initial = np.log(initial)
+            self.log_final = np.log(final)
+
+        self._codes = np.full(256, -1, dtype=np.int16)
+        self._codes[np.frombuffer(alphabet.encode("latin-1"), dtype=np.uint8)] = np.arange(len(alphabet))
+
+    @property
+    def n_states(self) -> int:
+        return len(self.states)
+
+    @property
+    def transition(self) -> np.ndarray:
+        return np.exp(self.log_transition)
+
+    @property
+    def emission(self) -> np.ndarray:
+        return np.exp(self.log_emission)
+
+    @property
+    def initial(self) -> np.ndarray:
+        return np.exp(self.log_initial)
+
+    @property
+    def final(self) -> np.ndarray:
+        """Probability of ending after each state, all ones when the end is not modelled"""
+        return np.exp(self.log_final)
+
+    def encode(self, observations: ObservationLike) -> np.ndarray:
+        """Map observed symbols to column indices of the emission matrix. Arrays
+        are taken to be encoded already and are only checked.
+
+        Arguments:
+            observations {ObservationLike} -- observed string, bytes or array of symbol indices
+
+        Returns:
+            np.ndarray -- intp array of symbol indices
+        """
+        if isinstance(observations, np.ndarray):
+            codes = observations.astype(np.intp, copy=False)
+            if codes.size and (codes.min() < 0 or codes.max() >= len(self.alphabet)):
+                raise ValueError("Observation indices must lie in range(len(alphabet))")
+            return codes
+
+        if isinstance(observations, str):
+            observations = observations.encode("latin-1")
+        codes = self._codes[np.frombuffer(observations, dtype=np.uint8)].astype(np.intp)
+        if (codes < 0).any():
+            raise ValueError(f"Observations may only contain symbols of {self.alphabet!r}")
+
+        return codes
+
+    def path_names(self, path: np.ndarray) -> str:
+        """Join the names of the states along a path, as returned by viterbi
+
+        Arguments:
+            path {np.ndarray} -- state indices
+
+        Returns:
+            str -- concatenated state names
+        """
+        return "".join(self.states[state] for state in np.asarray(path).tolist())
@@ -0,0 +1,197 @@
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+
+from bioalgo.hmm.model import HMM
+
+
+GAP = "-"
+
+
+class ProfileHMM(NamedTuple):
+    """Profile HMM of a multiple alignment. States are ordered S, I0, M1, D1, I1,
+    ..., Mn, Dn, In, E; the start, end and deletion states are silent and have
+    all-zero emission rows. profile_to_hmm turns it into an HMM for decoding
+    and training."""
+    states: List[str]
+    alphabet: str
+    transition: np.ndarray
+    emission: np.ndarray
+
+
+def _allowed_transitions(n_match: int) -> np.ndarray:
+    """Transitions of the profile HMM graph: S, every I, M and D state of
+    column k moves to I_k, M_k+1 or D_k+1, and those of the last column to
+    I_n or E"""
+    n_states = 3 * n_match + 3
+    end = n_states - 1
+    allowed = np.zeros((n_states, n_states), dtype=bool)
+    for k in range(n_match + 1):
+        insertion = 3 * k + 1
+        sources = [0, insertion] if k == 0 else [3 * k - 1, 3 * k, insertion]
+        targets = [insertion, end] if k == n_match else [insertion, 3 * k + 2, 3 * k + 3]
+        allowed[np.ix_(sources, targets)] = True
+
+    return allowed
+
+
+def profile_hmm(alignment: Sequence[str], threshold: float, alphabet: str = "ACGT",
+                pseudocount: float = 0.0) -> ProfileHMM:
+    """Build the profile HMM of a multiple alignment, such as a set of motifs
+    with gaps. Columns in which the fraction of gaps is at least threshold are
+    insertion columns; every other column gets a match and a deletion state.
+    The path of every row is assigned at once from the column types and gap
+    mask, and transitions and emissions are counted with np.add.at.
+
+    Pseudocounts follow the textbook construction: they are added to the
+    normalized probabilities, which are then normalized again. For an
+    alignment without gaps and no pseudocount, the match emission rows equal
+    MotifMatrix.from_motifs(alignment).profile() of bioalgo.motifs.motif_matrix.
+
+    Arguments:
+        alignment {Sequence[str]} -- aligned rows of equal length, gaps written as "-"
+        threshold {float} -- gap fraction from which a column is an insertion column
+
+    Keyword Arguments:
+        alphabet {str} -- symbols that may occur in the alignment (default: {"ACGT"})
+        pseudocount {float} -- added to every allowed transition and emission probability (default: {0.0})
+
+    Returns:
+        ProfileHMM -- states, transition matrix and emission matrix
+
+    Example:
+    >>> hmm = profile_hmm(["ACG-T", "AC--T", "A-GAT", "ACG-T"], 0.5)
+    >>> hmm.states
+    ['S', 'I0', 'M1', 'D1', 'I1', 'M2', 'D2', 'I2', 'M3', 'D3', 'I3', 'M4', 'D4', 'I4', 'E']
+    >>> hmm.transition[hmm.states.index("M2")].round(3).tolist()[4:10]
+    [0.0, 0.0, 0.0, 0.0, 0.667, 0.333]
+    >>> hmm.emission[hmm.states.index("I3")].tolist()
+    [1.0, 0.0, 0.0, 0.0]
+
+    """
+    if not alignment or any(len(row) != len(alignment[0]) for row in alignment):
+        raise ValueError("Alignment rows must be non-empty and of equal length")
+    if GAP in alphabet or len(set(alphabet)) != len(alphabet):
+        raise ValueError("Alphabet symbols must be distinct and may not include the gap")
+
+    lookup = np.full(256, -1, dtype=np.int16)
+    lookup[np.frombuffer(alphabet.encode("latin-1"), dtype=np.uint8)] = np.arange(len(alphabet))
+    lookup[ord(GAP)] = len(alphabet)
+    raw = np.frombuffer("".join(alignment).encode("latin-1"), dtype=np.uint8)
+    symbols = lookup[raw].reshape(len(alignment), -1)
+    if (symbols < 0).any():
+        raise ValueError(f"Alignment may only contain {alphabet!r} and gaps")
+
+    gaps = symbols == len(alphabet)
+    match = gaps.mean(axis=0) < threshold
+    n_match = int(match.sum())
+    n_states = 3 * n_match + 3
+    column = np.cumsum(match)  # index k of the match column at or before each column
+
+    # M_k = 3k - 1, D_k = 3k, I_k = 3k + 1, S = 0, E = 3n + 2; -1 where a row skips an insertion column
+    state = np.where(match, np.where(gaps, 3 * column, 3 * column - 1), np.where(gaps, -1, 3 * column + 1))
+    paths = np.concatenate((np.zeros((len(alignment), 1), dtype=state.dtype), state,
+                            np.full((len(alignment), 1), n_states - 1, dtype=state.dtype)), axis=1)
+    visited = paths[paths >= 0]
+    source, target = visited[:-1], visited[1:]
+    within_row = source != n_states - 1
+
+    transition = np.zeros((n_states, n_states))
+    np.add.at(transition, (source[within_row], target[within_row]), 1)
+    emission = np.zeros((n_states, len(alphabet)))
+    emitted = ~gaps
+    np.add.at(emission, (state[emitted], symbols[emitted]), 1)
+
+    transition = _normalize_rows(transition)
+    emission = _normalize_rows(emission)
+    if pseudocount:
+        allowed = _allowed_transitions(n_match)
+        transition = _normalize_rows(transition + pseudocount * allowed)
+        emitting = np.zeros(n_states, dtype=bool)
+        emitting[1:-1] = np.arange(1, n_states - 1) % 3 != 0
+        emission = _normalize_rows(emission + pseudocount * emitting[:, None])
+
+    names = ["S", "I0"] + [f"{kind}{k}" for k in range(1, n_match + 1) for kind in "MDI"] + ["E"]
+
+    return ProfileHMM(names, alphabet, transition, emission)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    totals = matrix.sum(axis=1, keepdims=True)
+    return matrix / np.where(totals > 0, totals, 1)
+
+
+def profile_to_hmm(profile: ProfileHMM) -> HMM:
+    """Turn a profile HMM into an HMM of its emitting states for the decoding
+    and training functions. The silent states are folded into the
+    transitions: S becomes the initial distribution, E the final
+    probabilities, and a move through deletions becomes a direct transition
+    with the product of their probabilities. The deletions between two
+    emitting states form a single chain, so the folded model gives the same
+    Viterbi paths (see profile_path) and likelihoods as the silent-state
+    model; only the probability of the empty sequence, S -> D1 -> ... -> E, is
+    dropped, so likelihoods are conditioned on a non-empty sequence.
+    Insertion states that no row visits, which cannot emit without a
+    pseudocount, are left out.
+
+    Arguments:
+        profile {ProfileHMM} -- profile HMM, as returned by profile_hmm
+
+    Returns:
+        HMM -- model over the emitting states, with final probabilities
+
+    Example:
+    >>> from bioalgo.hmm.decoding import viterbi
+    >>> profile = profile_hmm(["ACDEFACADF", "AFDA---CCF", "A--EFD-FDC", "ACAEF--A-C", "ADDEFAAADF"], 0.4,
+    ...                       alphabet="ABCDEF", pseudocount=0.01)
+    >>> hmm = profile_to_hmm(profile)
+    >>> path, _ = viterbi(hmm, "AEFDFDC")
+    >>> " ".join(profile_path(hmm, path))
+    'M1 D2 D3 M4 M5 I5 M6 M7 M8'
+
+    """
+    n_states = len(profile.states)
+    end = n_states - 1
+    deletions = np.arange(3, end, 3)
+    emitting = np.flatnonzero(profile.emission.sum(axis=1) > 0)
+    targets = np.append(emitting, end)
+    transition = profile.transition
+
+    # probability of reaching each emitting state or E from every state, directly or through deletions
+    through = np.linalg.solve(np.eye(len(deletions)) - transition[np.ix_(deletions, deletions)],
+                              transition[np.ix_(deletions, targets)])
+    reach = transition[:, targets] + transition[:, deletions] @ through
+    if not reach[0, :-1].sum():
+        raise ValueError("The profile HMM only generates the empty sequence")
+
+    return HMM(reach[np.ix_(emitting, np.arange(len(emitting)))], profile.emission[emitting], initial=reach[0, :-1],
+               states=[profile.states[state] for state in emitting], alphabet=profile.alphabet,
+               final=reach[emitting, -1])
+
+
+def profile_path(hmm: HMM, path: np.ndarray) -> List[str]:
+    """Names of the states along a path of a profile_to_hmm model, with the
+    deletion states the path passes through put back in
+
+    Arguments:
+        hmm {HMM} -- model returned by profile_to_hmm
+        path {np.ndarray} -- state indices, as returned by viterbi
+
+    Returns:
+        List[str] -- state names, such as ["M1", "D2", "I2", "M3"]
+    """
+    n_match = sum(name[0] == "M" for name in hmm.states)
+    names = []
+    column = 0
+    for state in np.asarray(path).tolist():
+        name = hmm.states[state]
+        target = int(name[1:])
+        # a match state of column j is entered from column j - 1, an insertion state from column j
+        last_deleted = target - 1 if name[0] == "M" else target
+        names.extend(f"D{k}" for k in range(column + 1, last_deleted + 1))
+        names.append(name)
+        column = target
+    if names:
+        names.extend(f"D{k}" for k in range(column + 1, n_match + 1))
+
+    return names
@@ -0,0 +1,119 @@
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from bioalgo.hmm.decoding import backward, forward
+from bioalgo.hmm.model import HMM, ObservationLike
+
+
+class ExpectedCounts(NamedTuple):
+    """Expected number of starts in, transitions between, emissions from and ends
+    after each state, summed over sequences, with their total log likelihood"""
+    initial: np.ndarray
+    transition: np.ndarray
+    emission: np.ndarray
+    final: np.ndarray
+    log_likelihood: float
+
+
+def expected_counts(hmm: HMM, sequences: Sequence[ObservationLike]) -> ExpectedCounts:
+    """E-step of Baum-Welch. Transition counts sum the forward and backward terms
+    of every position with one matrix product instead of building the
+    (n, states, states) array of pairwise posteriors.
+
+    Arguments:
+        hmm {HMM} -- model
+        sequences {Sequence[ObservationLike]} -- observed sequences
+
+    Returns:
+        ExpectedCounts -- expected counts under the posterior of each sequence
+    """
+    n_states, n_symbols = hmm.n_states, len(hmm.alphabet)
+    initial = np.zeros(n_states)
+    final = np.zeros(n_states)
+    pairs = np.zeros((n_states, n_states))
+    emission = np.zeros((n_states, n_symbols))
+    total = 0.0
+
+    log_emission = np.ascontiguousarray(hmm.log_emission.T)
+    for sequence in sequences:
+        codes = hmm.encode(sequence)
+        if not len(codes):
+            continue
+        alpha, log_likelihood = forward(hmm, codes)
+        if log_likelihood == -np.inf:
+            raise ValueError("A sequence has zero probability under the model")
+        beta = backward(hmm, codes)
+        total += log_likelihood
+
+        posterior = np.exp(alpha + beta - log_likelihood)
+        initial += posterior[0]
+        final += posterior[-1]
+        for symbol in range(n_symbols):
+            emission[:, symbol] += posterior[codes == symbol].sum(axis=0)
+
+        # sum over t of alpha[t, i] * T[i, j] * e[j, x[t+1]] * beta[t+1, j] / P(x)
+        left = alpha[:-1]
+        right = log_emission[codes[1:]] + beta[1:]
+        left_peak = left.max(axis=1, keepdims=True)
+        right_peak = right.max(axis=1, keepdims=True)
+        scale = np.exp(left_peak + right_peak - log_likelihood)
+        pairs += (np.exp(left - left_peak) * scale).T @ np.exp(right - right_peak)
+
+    return ExpectedCounts(initial, pairs * hmm.transition, emission, final, total)
+
+
+def _reestimate(counts: np.ndarray, previous: np.ndarray, pseudocount: float) -> np.ndarray:
+    counts = counts + pseudocount
+    totals = counts.sum(axis=-1, keepdims=True)
+    # states never visited keep their previous parameters
+    return np.where(totals > 0, counts / np.where(totals > 0, totals, 1), previous)
+
+
+def baum_welch(hmm: HMM, sequences: Sequence[ObservationLike], iterations: int = 100,
+               tolerance: float = 1e-6, pseudocount: float = 0.0,
+               fit_initial: bool = True) -> Tuple[HMM, List[float]]:
+    """Estimate transition, emission and initial probabilities, and final
+    probabilities if hmm models the end, from unlabelled sequences by
+    expectation maximization, starting from hmm
+
+    Arguments:
+        hmm {HMM} -- initial model, which also fixes the states and alphabet
+        sequences {Sequence[ObservationLike]} -- training sequences
+
+    Keyword Arguments:
+        iterations {int} -- maximum number of EM iterations (default: {100})
+        tolerance {float} -- stop once the log likelihood improves by less than this (default: {1e-6})
+        pseudocount {float} -- added to every expected count before normalizing (default: {0.0})
+        fit_initial {bool} -- re-estimate the initial distribution, else keep hmm's (default: {True})
+
+    Returns:
+        Tuple[HMM, List[float]] -- trained model, and the log likelihood of the sequences before each update
+
+    Example:
+    >>> hmm = HMM([[0.6, 0.4], [0.4, 0.6]], [[0.5, 0.3, 0.2], [0.2, 0.3, 0.5]], alphabet="xyz")
+    >>> trained, trace = baum_welch(hmm, ["xxxyxxzzzzyzzxxxx", "zzzzyzzzzx"], iterations=20)
+    >>> len(trace), all(b >= a - 1e-9 for a, b in zip(trace, trace[1:]))
+    (20, True)
+    >>> trained.emission.round(2).tolist()
+    [[0.91, 0.09, 0.0], [0.0, 0.12, 0.88]]
+
+    """
+    trace = []
+    for _ in range(iterations):
+        counts = expected_counts(hmm, sequences)
+        if trace and counts.log_likelihood - trace[-1] < tolerance:
+            break
+        trace.append(counts.log_likelihood)
+        initial = _reestimate(counts.initial, hmm.initial, pseudocount) if fit_initial else hmm.initial
+        if hmm.models_end:
+            # transitions and ends out of a state share one distribution
+            joint = _reestimate(np.column_stack((counts.transition, counts.final)),
+                                np.column_stack((hmm.transition, hmm.final)), pseudocount)
+            transition, final = joint[:, :-1], joint[:, -1]
+        else:
+            transition, final = _reestimate(counts.transition, hmm.transition, pseudocount), None
+        hmm = HMM(transition, _reestimate(counts.emission, hmm.emission, pseudocount),
+                  initial, hmm.states, hmm.alphabet, final)
+
+    return hmm, trace
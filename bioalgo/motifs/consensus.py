@@ -1,8 +1,12 @@
 from typing import Dict
 
+import numpy as np
+
 
 def consensus(profile_matrix: Dict) -> str:
     """Return the consensus by scoring columns in the profile matrix.  
+    Ties go to the base listed first in profile_matrix, and a column with no
+    positive entry is skipped.
     
     Arguments:
         profile_matrix {Dict} -- profile matrix computed from count matrix
@@ -17,16 +21,12 @@ def consensus(profile_matrix: Dict) -> str:
     ...                   'T' : [0.7, 0.2, 0.0, 0.0, 0.1, 0.1, 0.0, 0.5, 0.8, 0.7, 0.3, 0.4]}
     >>> print(consensus(profile_matrix))
     TCGGGGATTTCC
+    >>> consensus({'A': [0.5, 0.0], 'C': [0.5, 0.0], 'G': [0.0, 0.0], 'T': [0.0, 0.0]})
+    'A'
     """
-    consensus = ""
-    for i in range(len(profile_matrix['A'])):  # arbitrarily select the 'A' list to get length
-        max_freq = 0
-        base_called = ""
-        for k, v in profile_matrix.items():
-            if v[i] > max_freq:
-                max_freq = v[i]
-                base_called = k
-
-        consensus += base_called
+    bases = list(profile_matrix)
+    values = np.array([profile_matrix[base] for base in bases])
+    calls = values.argmax(axis=0).tolist()
+    called = (values.max(axis=0) > 0).tolist()
 
-    return consensus
\ No newline at end of file
+    return "".join(bases[i] for i, keep in zip(calls, called) if keep)
\ No newline at end of file
@@ -1,4 +1,6 @@
-from typing import List
+from typing import Dict, List
+
+from bioalgo.motifs.motif_matrix import MotifMatrix
 
 
 def count_matrix(motifs: List[str]) -> Dict:
@@ -29,17 +31,4 @@ def count_matrix(motifs: List[str]) -> Dict:
     G [0, 0, 10, 10, 9, 9, 1, 0, 0, 0, 0, 0]
     T [7, 2, 0, 0, 1, 1, 0, 5, 8, 7, 3, 4]
     """
-    if not all([len(m) == len(motifs[0]) for m in motifs]):
-        raise ValueError("All motifs must be same length.")
-
-    count_mat = {"A" : [0 for _ in range(len(motifs[0]))],
-                 "C" : [0 for _ in range(len(motifs[0]))],
-                 "G" : [0 for _ in range(len(motifs[0]))],
-                 "T" : [0 for _ in range(len(motifs[0]))]
-                }
-
-    for seq in motifs:
-        for i, nt in enumerate(seq):
-            count_mat[nt][i] += 1
-            
-    return count_mat
\ No newline at end of file
+    return MotifMatrix.from_motifs(motifs).to_dict()
\ No newline at end of file
@@ -0,0 +1,157 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Set, Tuple
+
+import numpy as np
+
+from bioalgo.motifs.motif_search import _encode_dna
+from bioalgo.strings.hamming_kernel import hamming_one_vs_many
+from bioalgo.strings.kmer_codec import decode_kmer, decode_kmers
+
+
+def distance_between_pattern_and_strings(pattern: str, dna: Sequence[str]) -> int:
+    """Sum over the strings of the smallest Hamming distance between pattern and
+    any k-mer of the string, using the batch Hamming kernel for each string
+
+    Arguments:
+        pattern {str} -- k-mer
+        dna {Sequence[str]} -- DNA strings at least k long
+
+    Returns:
+        int -- total distance
+
+    Example:
+    >>> distance_between_pattern_and_strings("AAA", ["TTACCTTAAC", "GATATCTGTC", "ACGGCGTTCG", "CCCTAAAGAG", "CGTCAGAGGT"])
+    5
+
+    """
+    k = len(pattern)
+    return sum(int(hamming_one_vs_many(pattern, [s[i:i+k] for i in range(len(s) - k + 1)]).min()) for s in dna)
+
+
+def _children(codes: np.ndarray, depth: int, mismatches: np.ndarray) -> np.ndarray:
+    """Mismatch arrays of the four one-base extensions of a prefix: (4, t, windows)"""
+    n_windows = mismatches.shape[1]
+    column = codes[:, depth:depth+n_windows]
+
+    return mismatches + (column != np.arange(4, dtype=codes.dtype)[:, None, None])
+
+
+def _prefix_state(codes: np.ndarray, k: int, prefix: int, length: int) -> np.ndarray:
+    mismatches = np.zeros((len(codes), codes.shape[1] - k + 1), dtype=np.int32)
+    for depth in range(length):
+        base = (prefix >> (2 * (length - 1 - depth))) & 0b11
+        mismatches = _children(codes, depth, mismatches)[base]
+
+    return mismatches
+
+
+def _branch_and_bound(codes: np.ndarray, k: int, prefix: int, length: int, limit: int) -> Tuple[int, int]:
+    """Depth-first search of the k-mers that start with prefix, in lexicographic
+    order. A branch is pruned when the sum over strings of the smallest partial
+    mismatch count already exceeds the best total, or equals it once a k-mer with
+    that total has been found, so the lexicographically first median is kept.
+
+    Returns:
+        Tuple[int, int] -- best total distance and its k-mer code, or (limit + 1, -1) if none is within limit
+    """
+    best = [limit, -1]
+
+    def visit(code: int, depth: int, mismatches: np.ndarray) -> None:
+        children = _children(codes, depth, mismatches)
+        bounds = children.min(axis=2).sum(axis=1).tolist()
+        for base in range(4):
+            bound = bounds[base]
+            if bound > best[0] or (best[1] >= 0 and bound >= best[0]):
+                continue
+            if depth + 1 == k:
+                best[0], best[1] = bound, (code << 2) | base
+            else:
+                visit((code << 2) | base, depth + 1, children[base])
+
+    if length == k:
+        distance = int(_prefix_state(codes, k, prefix, length).min(axis=1).sum())
+        return (distance, prefix) if distance <= limit else (limit + 1, -1)
+
+    visit(prefix, length, _prefix_state(codes, k, prefix, length))
+    return (best[0], best[1]) if best[1] >= 0 else (limit + 1, -1)
+
+
+def median_string(dna: Sequence[str], k: int, workers: int = 1, prefix_length: int = None) -> str:
+    """Find a k-mer minimizing the total distance to dna by branch and bound over
+    the prefix tree of 2-bit k-mer codes. Extending a prefix by one base adds one
+    column to each string's window mismatch counts, and the sum of their minima
+    bounds every k-mer below that prefix. The search starts from the best total
+    of the strings' first k-mers, computed with the batch Hamming kernel.
+
+    Arguments:
+        dna {Sequence[str]} -- DNA strings of equal length
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        workers {int} -- worker processes, None for one per CPU (default: {1})
+        prefix_length {int} -- bases fixed per pool task, None to pick enough
+        for four tasks per worker (default: {None})
+
+    Returns:
+        str -- the lexicographically first median string
+
+    Example:
+    >>> median_string(["AAATTGACGCAT", "GACGACCACGTT", "CGTCAGCGCCTG", "GCTGAGCACCGG", "AGTTCGGGACAG"], 3)
+    'GAC'
+
+    """
+    codes = _encode_dna(dna, k)
+    limit = min(distance_between_pattern_and_strings(s[:k], dna) for s in dna)
+
+    if workers == 1:
+        distance, code = _branch_and_bound(codes, k, 0, 0, limit)
+    else:
+        if prefix_length is None:
+            target = 4 * (workers or 1)
+            prefix_length = 1
+            while 4 ** prefix_length < target and prefix_length < k:
+                prefix_length += 1
+        prefix_length = min(prefix_length, k)
+        prefixes = range(4 ** prefix_length)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_branch_and_bound, *zip(*[(codes, k, prefix, prefix_length, limit) for prefix in prefixes]))
+            distance, code = min((d, c) for d, c in results if c >= 0)
+
+    return decode_kmer(code, k)
+
+
+def motif_enumeration(dna: Sequence[str], k: int, d: int) -> Set[str]:
+    """Find every (k, d)-motif: the k-mers that appear in each string with at most
+    d mismatches. The prefix tree is walked like median_string, and a branch is
+    pruned as soon as some string has no window within d mismatches of the prefix.
+
+    Arguments:
+        dna {Sequence[str]} -- DNA strings of equal length
+        k {int} -- k-mer length
+        d {int} -- maximum number of mismatches
+
+    Returns:
+        Set[str] -- (k, d)-motifs
+
+    Example:
+    >>> sorted(motif_enumeration(["ATTTGGC", "TGCCTTA", "CGGTATC", "GAAAATT"], 3, 1))
+    ['ATA', 'ATT', 'GTT', 'TTT']
+
+    """
+    codes = _encode_dna(dna, k)
+    found: List[int] = []
+
+    def visit(code: int, depth: int, mismatches: np.ndarray) -> None:
+        children = _children(codes, depth, mismatches)
+        feasible = (children.min(axis=2) <= d).all(axis=1).tolist()
+        for base in range(4):
+            if not feasible[base]:
+                continue
+            if depth + 1 == k:
+                found.append((code << 2) | base)
+            else:
+                visit((code << 2) | base, depth + 1, children[base])
+
+    visit(0, 0, np.zeros((len(codes), codes.shape[1] - k + 1), dtype=np.int32))
+
+    return set(decode_kmers(found, k))
@@ -0,0 +1,170 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from bioalgo.strings.kmer_counting import INVALID, sequence_to_codes
+
+
+BASES = "ACGT"
+
+
+def encode_motifs(motifs: Sequence[str]) -> np.ndarray:
+    """Encode equal-length DNA strings as a 2-D array of base codes
+
+    Arguments:
+        motifs {Sequence[str]} -- DNA strings of equal length
+
+    Returns:
+        np.ndarray -- (n, k) uint8 array, A=0, C=1, G=2, T=3
+
+    Example:
+    >>> encode_motifs(["ACGT", "TTGA"]).tolist()
+    [[0, 1, 2, 3], [3, 3, 2, 0]]
+
+    """
+    if not motifs:
+        raise ValueError("At least one motif is required.")
+    if not all(len(m) == len(motifs[0]) for m in motifs):
+        raise ValueError("All motifs must be same length.")
+
+    codes = sequence_to_codes("".join(motifs)).reshape(len(motifs), len(motifs[0]))
+    if (codes == INVALID).any():
+        raise ValueError("Motifs may only contain A, C, G and T.")
+
+    return codes
+
+
+class MotifMatrix:
+    """Count or profile matrix of a motif, stored as a 4 x k array whose rows are
+    A, C, G and T and whose columns are motif positions
+
+    Arguments:
+        values {np.ndarray} -- 4 x k array of counts or probabilities
+
+    Example:
+    >>> counts = MotifMatrix.from_motifs(["TCGGG", "CCGGT", "ACGGG", "TTGGG"])
+    >>> counts.values.tolist()
+    [[1, 0, 0, 0, 0], [1, 3, 0, 0, 0], [0, 0, 4, 4, 3], [2, 1, 0, 0, 1]]
+    >>> counts.consensus(), counts.score(), round(counts.entropy(), 4)
+    ('TCGGG', 4, 3.1226)
+    >>> counts.profile(pseudocount=1).values[:, 0].tolist()
+    [0.25, 0.25, 0.125, 0.375]
+
+    """
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values)
+        if values.ndim != 2 or values.shape[0] != 4:
+            raise ValueError("A motif matrix must have 4 rows, one per base.")
+        self.values = values
+
+    @classmethod
+    def from_motifs(cls, motifs: Sequence[str]) -> "MotifMatrix":
+        """Build the count matrix of equal-length DNA strings with a single bincount
+
+        Arguments:
+            motifs {Sequence[str]} -- DNA strings of equal length
+
+        Returns:
+            MotifMatrix -- count matrix
+        """
+        return cls.from_codes(encode_motifs(motifs))
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> "MotifMatrix":
+        """Build the count matrix of motifs already encoded by encode_motifs
+
+        Arguments:
+            codes {np.ndarray} -- (n, k) array of base codes
+
+        Returns:
+            MotifMatrix -- count matrix
+        """
+        k = codes.shape[1]
+        flat = codes.astype(np.intp) * k + np.arange(k)
+
+        return cls(np.bincount(flat.ravel(), minlength=4 * k).reshape(4, k))
+
+    @classmethod
+    def from_dict(cls, matrix: Dict[str, List[float]]) -> "MotifMatrix":
+        """Build a motif matrix from the {'A': [...], 'C': [...], ...} form
+
+        Arguments:
+            matrix {Dict[str, List[float]]} -- counts or probabilities keyed by base
+
+        Returns:
+            MotifMatrix -- motif matrix
+        """
+        return cls(np.array([matrix[base] for base in BASES]))
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Return the matrix in the {'A': [...], 'C': [...], ...} form
+
+        Returns:
+            Dict[str, List[float]] -- matrix rows keyed by base
+        """
+        return dict(zip(BASES, self.values.tolist()))
+
+    @property
+    def k(self) -> int:
+        """Motif length"""
+        return self.values.shape[1]
+
+    def profile(self, pseudocount: float = 0) -> "MotifMatrix":
+        """Normalize each column of a count matrix to probabilities
+
+        Keyword Arguments:
+            pseudocount {float} -- added to every count first, e.g. 1 for Laplace's rule (default: {0})
+
+        Returns:
+            MotifMatrix -- profile matrix
+        """
+        counts = self.values + pseudocount
+
+        return MotifMatrix(counts / counts.sum(axis=0))
+
+    def consensus(self) -> str:
+        """Return the most common base of each column, the first of A, C, G, T on ties
+
+        Returns:
+            str -- consensus string
+        """
+        return "".join(BASES[i] for i in self.values.argmax(axis=0))
+
+    def score(self) -> int:
+        """Score a count matrix: the number of motif bases that differ from the consensus
+
+        Returns:
+            int -- score
+        """
+        return (self.values.sum(axis=0) - self.values.max(axis=0)).sum().item()
+
+    def mismatches(self, pattern: str) -> int:
+        """Count the motif bases that differ from pattern in a count matrix
+
+        Arguments:
+            pattern {str} -- DNA string of length k
+
+        Returns:
+            int -- total Hamming distance between pattern and the motifs
+        """
+        codes = encode_motifs([pattern])[0]
+        if len(codes) != self.k:
+            raise ValueError("Pattern and motifs must be same length.")
+
+        return (self.values.sum(axis=0) - self.values[codes, np.arange(self.k)]).sum().item()
+
+    def entropy(self) -> float:
+        """Total Shannon entropy in bits of the matrix's columns, 0 log 0 taken as 0
+
+        Returns:
+            float -- entropy
+        """
+        probabilities = self.values / self.values.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(probabilities > 0, probabilities * np.log2(probabilities), 0.0)
+
+        return -terms.sum().item()
+
+    def __repr__(self) -> str:
+        return f"MotifMatrix({self.values.tolist()!r})"
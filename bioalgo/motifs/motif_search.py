@@ -0,0 +1,270 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bioalgo.motifs.motif_matrix import MotifMatrix
+from bioalgo.motifs.profile_scan import encode_sequences, kmer_probabilities, window_log_probabilities
+from bioalgo.strings.kmer_counting import INVALID
+
+
+METHODS = ("randomized", "gibbs")
+RESTARTS_PER_TASK = 25  # restarts a worker runs per submitted task
+_GREEDY_BLOCK = 1 << 22  # cap on candidate x window scores held by greedy_motif_search
+
+
+class MotifSearchResult(NamedTuple):
+    """Best motifs over all restarts, their score, each restart's score trace and
+    the number of restarts run before stopping"""
+    motifs: List[str]
+    score: int
+    traces: List[List[int]]
+    restarts: int
+
+
+def _encode_dna(dna: Sequence[str], k: int) -> np.ndarray:
+    if not dna:
+        raise ValueError("At least one DNA string is required.")
+    if any(len(s) != len(dna[0]) for s in dna):
+        raise ValueError("All DNA strings must be same length.")
+    if not 1 <= k <= len(dna[0]):
+        raise ValueError("k must be between 1 and the length of the DNA strings.")
+
+    codes = encode_sequences(dna)
+    if (codes == INVALID).any():
+        raise ValueError("DNA strings may only contain A, C, G and T.")
+
+    return codes
+
+
+def _motif_codes(codes: np.ndarray, starts: np.ndarray, k: int) -> np.ndarray:
+    return codes[np.arange(len(codes))[:, None], starts[:, None] + np.arange(k)]
+
+
+def _decode(motif_codes: np.ndarray) -> List[str]:
+    return ["".join("ACGT"[code] for code in row) for row in motif_codes.tolist()]
+
+
+def _score(motif_codes: np.ndarray) -> int:
+    return MotifMatrix.from_codes(motif_codes).score()
+
+
+def greedy_motif_search(dna: Sequence[str], k: int, pseudocount: float = 0) -> List[str]:
+    """GreedyMotifSearch: seed with each k-mer of the first string and add the
+    profile-most probable k-mer of each following string. All seeds are extended
+    together, one string at a time, with the profiles held in one array.
+
+    Arguments:
+        dna {Sequence[str]} -- DNA strings of equal length
+        k {int} -- motif length
+
+    Keyword Arguments:
+        pseudocount {float} -- added to every count when building profiles (default: {0})
+
+    Returns:
+        List[str] -- best motif of each string
+
+    Example:
+    >>> dna = ["GGCGTTCAGGCA", "AAGAATCAGTCA", "CAAGGAGTTCGC", "CACGTCAATCAC", "CAATAATATTCG"]
+    >>> greedy_motif_search(dna, 3)
+    ['CAG', 'CAG', 'CAA', 'CAA', 'CAA']
+    >>> greedy_motif_search(dna, 3, pseudocount=1)
+    ['TTC', 'ATC', 'TTC', 'ATC', 'TTC']
+
+    """
+    codes = _encode_dna(dna, k)
+    t, n = codes.shape
+    windows = [sliding_window_view(row, k) for row in codes]
+    columns = np.arange(k)
+
+    best_starts = np.zeros(t, dtype=np.intp)
+    best_score = _score(_motif_codes(codes, best_starts, k))
+    block = max(1, _GREEDY_BLOCK // (n - k + 1))
+
+    for first in range(0, n - k + 1, block):
+        seeds = np.arange(first, min(first + block, n - k + 1))
+        starts = np.zeros((len(seeds), t), dtype=np.intp)
+        starts[:, 0] = seeds
+        counts = np.zeros((len(seeds), 4, k))
+        counts[np.arange(len(seeds))[:, None], windows[0][seeds], columns] += 1
+
+        for i in range(1, t):
+            with np.errstate(divide="ignore"):
+                logs = np.log((counts + pseudocount) / (i + 4 * pseudocount))
+            scores = sum(logs[:, codes[i, j:j+n-k+1], j] for j in range(k))
+            starts[:, i] = scores.argmax(axis=1)
+            counts[np.arange(len(seeds))[:, None], windows[i][starts[:, i]], columns] += 1
+
+        seed_scores = (t - counts.max(axis=1)).sum(axis=1)
+        best = seed_scores.argmin()
+        if seed_scores[best] < best_score:
+            best_score, best_starts = seed_scores[best], starts[best]
+
+    return _decode(_motif_codes(codes, best_starts, k))
+
+
+def randomized_motif_search(codes: np.ndarray, k: int, rng: np.random.Generator,
+                            pseudocount: float = 1) -> Tuple[np.ndarray, List[int]]:
+    """One run of RandomizedMotifSearch: start from random motifs and replace them
+    with the profile-most probable k-mers of their own profile until the score
+    stops improving
+
+    Arguments:
+        codes {np.ndarray} -- (t, n) encoded DNA strings, see encode_sequences
+        k {int} -- motif length
+        rng {np.random.Generator} -- random number generator
+
+    Keyword Arguments:
+        pseudocount {float} -- added to every count when building profiles (default: {1})
+
+    Returns:
+        Tuple[np.ndarray, List[int]] -- best motif start in each string, and the score after each iteration
+    """
+    starts = rng.integers(0, codes.shape[1] - k + 1, size=len(codes))
+    best_starts, best_score = starts, _score(_motif_codes(codes, starts, k))
+    trace = [best_score]
+
+    while True:
+        profile = MotifMatrix.from_codes(_motif_codes(codes, starts, k)).profile(pseudocount)
+        starts = window_log_probabilities(codes, profile).argmax(axis=1)
+        score = _score(_motif_codes(codes, starts, k))
+        trace.append(score)
+        if score >= best_score:
+            return best_starts, trace
+        best_starts, best_score = starts, score
+
+
+def gibbs_sampler(codes: np.ndarray, k: int, rng: np.random.Generator, n_iterations: int = 1000,
+                  pseudocount: float = 1, patience: int = None) -> Tuple[np.ndarray, List[int]]:
+    """One run of GibbsSampler: repeatedly drop one string's motif and resample it
+    from the profile of the others, weighted by the k-mers' probabilities
+
+    Arguments:
+        codes {np.ndarray} -- (t, n) encoded DNA strings, see encode_sequences
+        k {int} -- motif length
+        rng {np.random.Generator} -- random number generator
+
+    Keyword Arguments:
+        n_iterations {int} -- maximum number of resampling steps (default: {1000})
+        pseudocount {float} -- added to every count when building profiles (default: {1})
+        patience {int} -- stop after this many steps without improvement, None to run all (default: {None})
+
+    Returns:
+        Tuple[np.ndarray, List[int]] -- best motif start in each string, and the best score after each step
+    """
+    t = len(codes)
+    starts = rng.integers(0, codes.shape[1] - k + 1, size=t)
+    motifs = _motif_codes(codes, starts, k)
+    best_starts, best_score = starts.copy(), _score(motifs)
+    trace = [best_score]
+    stale = 0
+
+    for _ in range(n_iterations):
+        i = rng.integers(t)
+        profile = MotifMatrix.from_codes(np.delete(motifs, i, axis=0)).profile(pseudocount)
+        weights = kmer_probabilities(codes[i:i+1], profile)[0]
+        starts[i] = rng.choice(len(weights), p=weights)
+        motifs[i] = codes[i, starts[i]:starts[i]+k]
+
+        score = _score(motifs)
+        if score < best_score:
+            best_starts, best_score, stale = starts.copy(), score, 0
+        else:
+            stale += 1
+        trace.append(best_score)
+        if patience is not None and stale >= patience:
+            break
+
+    return best_starts, trace
+
+
+def _run_restarts(method: str, codes: np.ndarray, k: int, seeds: List[np.random.SeedSequence],
+                  n_iterations: int, pseudocount: float, patience: int) -> List[Tuple[np.ndarray, List[int]]]:
+    """Worker: run one restart per seed"""
+    results = []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        if method == "gibbs":
+            results.append(gibbs_sampler(codes, k, rng, n_iterations, pseudocount, patience))
+        else:
+            results.append(randomized_motif_search(codes, k, rng, pseudocount))
+
+    return results
+
+
+def motif_search(dna: Sequence[str], k: int, method: str = "randomized", restarts: int = 1000,
+                 seed: int = None, workers: int = 1, n_iterations: int = 1000, pseudocount: float = 1,
+                 patience: int = None, convergence: int = None) -> MotifSearchResult:
+    """Run many independent restarts of randomized or Gibbs motif search over a
+    process pool and keep the best motifs. Every restart draws from its own
+    generator, spawned from seed, so the result for a given seed does not depend
+    on the number of workers.
+
+    Arguments:
+        dna {Sequence[str]} -- DNA strings of equal length
+        k {int} -- motif length
+
+    Keyword Arguments:
+        method {str} -- "randomized" or "gibbs" (default: {"randomized"})
+        restarts {int} -- maximum number of restarts (default: {1000})
+        seed {int} -- root seed, None for fresh entropy (default: {None})
+        workers {int} -- worker processes, None for one per CPU (default: {1})
+        n_iterations {int} -- Gibbs sampling steps per restart (default: {1000})
+        pseudocount {float} -- added to every count when building profiles (default: {1})
+        patience {int} -- end a Gibbs restart after this many steps without improvement (default: {None})
+        convergence {int} -- stop after this many consecutive restarts without a better score (default: {None})
+
+    Returns:
+        MotifSearchResult -- best motifs, their score, per-restart score traces and restarts run
+
+    Example:
+    >>> dna = ["CGCCCCTCTCGGGGGTGTTCAGTAAACGGCCA", "GGGCGAGGTATGTGTAAGTGCCAAGGTGCCAG",
+    ...        "TAGTACCGAGACCGAAAGAAGTATACAGGCGT", "TAGATCAAGTTTCAGGTGCACGTCGGTGAACC",
+    ...        "AATCCACCAGCTCCACGTGCAATGTTGGCCTA"]
+    >>> result = motif_search(dna, 8, restarts=1000, seed=0)
+    >>> result.motifs, result.score
+    (['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG'], 9)
+
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method!r}, expected one of {METHODS}")
+    if restarts < 1:
+        raise ValueError("At least one restart is required")
+
+    codes = _encode_dna(dna, k)
+    seeds = np.random.SeedSequence(seed).spawn(restarts)
+    tasks = [seeds[i:i+RESTARTS_PER_TASK] for i in range(0, restarts, RESTARTS_PER_TASK)]
+    args = (codes, k)
+    options = (n_iterations, pseudocount, patience)
+
+    if workers == 1:
+        batches = (_run_restarts(method, *args, task, *options) for task in tasks)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        batches = executor.map(_run_restarts, [method] * len(tasks), [codes] * len(tasks), [k] * len(tasks),
+                               tasks, *([option] * len(tasks) for option in options))
+
+    best_starts, best_score = None, None
+    traces = []
+    stale = 0
+    try:
+        # results are consumed in restart order, so stopping is independent of the number of workers
+        for batch in batches:
+            for starts, trace in batch:
+                traces.append(trace)
+                score = min(trace)
+                if best_score is None or score < best_score:
+                    best_starts, best_score, stale = starts, score, 0
+                else:
+                    stale += 1
+                if convergence is not None and stale >= convergence:
+                    break
+            else:
+                continue
+            break
+    finally:
+        if workers != 1:
+            executor.shutdown(cancel_futures=True)
+
+    return MotifSearchResult(_decode(_motif_codes(codes, best_starts, k)), int(best_score), traces, len(traces))
@@ -1,11 +1,16 @@
-from collections import defaultdict
+from typing import Dict
 
+from bioalgo.motifs.motif_matrix import MotifMatrix
 
-def profile(count_matrix: Dict) -> Dict:
+
+def profile(count_matrix: Dict, pseudocount: float = 0) -> Dict:
     """Generate the profile matrix of the given count matrix
     
     Arguments:
         count_matrix {Dict} -- motif count matrix
+
+    Keyword Arguments:
+        pseudocount {float} -- added to every count before normalizing (default: {0})
     
     Returns:
         Dict -- profile matrix of the counts matrix
@@ -23,12 +28,4 @@ def profile(count_matrix: Dict) -> Dict:
     G [0.0, 0.0, 1.0, 1.0, 0.9, 0.9, 0.1, 0.0, 0.0, 0.0, 0.0, 0.0]
     T [0.7, 0.2, 0.0, 0.0, 0.1, 0.1, 0.0, 0.5, 0.8, 0.7, 0.3, 0.4]
     """
-    # the number of motifs is the sum of all counts in any column - since all columns should be derived
-    # from the same number of motifs, simply sum the first column to get the number of motifs
-    n_motifs = sum([count_matrix['A'][0], count_matrix['C'][0], count_matrix['G'][0], count_matrix['T'][0]])
-
-    profile = defaultdict(list)
-    for k, v in count_matrix.items():
-        profile[k] = list(map(lambda x: x / n_motifs, v))
-
-    return dict(profile)
\ No newline at end of file
+    return MotifMatrix.from_dict(count_matrix).profile(pseudocount).to_dict()
\ No newline at end of file
@@ -0,0 +1,190 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from bioalgo.motifs.motif_matrix import MotifMatrix
+from bioalgo.strings.kmer_counting import INVALID, sequence_to_codes
+
+
+Profile = Union[MotifMatrix, np.ndarray]
+Sequences = Union[Sequence[str], np.ndarray]
+
+
+def encode_sequences(sequences: Sequence[str]) -> np.ndarray:
+    """Encode DNA strings into one 2-D array of base codes for repeated scanning.
+    Shorter strings are padded with the invalid code, which no window may contain.
+
+    Arguments:
+        sequences {Sequence[str]} -- DNA strings
+
+    Returns:
+        np.ndarray -- (t, n) uint8 array, A=0, C=1, G=2, T=3 and 4 for padding or other symbols
+
+    Example:
+    >>> encode_sequences(["ACGT", "TTG"]).tolist()
+    [[0, 1, 2, 3], [3, 3, 2, 4]]
+
+    """
+    n = max((len(s) for s in sequences), default=0)
+    codes = np.full((len(sequences), n), INVALID, dtype=np.uint8)
+    for row, sequence in zip(codes, sequences):
+        row[:len(sequence)] = sequence_to_codes(sequence)
+
+    return codes
+
+
+def log_profile(profile: Profile) -> np.ndarray:
+    """Take the log of a profile and append a row of -inf for invalid bases
+
+    Arguments:
+        profile {Profile} -- 4 x k profile matrix
+
+    Returns:
+        np.ndarray -- 5 x k array of log-probabilities
+    """
+    values = profile.values if isinstance(profile, MotifMatrix) else np.asarray(profile)
+    with np.errstate(divide="ignore"):
+        logs = np.log(values.astype(np.float64))
+
+    return np.vstack((logs, np.full(values.shape[1], -np.inf)))
+
+
+def window_log_probabilities(sequences: Sequences, profile: Profile) -> np.ndarray:
+    """Score every k-mer of every sequence against a profile at once. Each k-mer's
+    log-probability is a sliding sum over the profile's log-probabilities gathered
+    by base code, one column per k-mer position.
+
+    Arguments:
+        sequences {Sequences} -- DNA strings, or their encode_sequences() array
+        profile {Profile} -- 4 x k profile matrix
+
+    Returns:
+        np.ndarray -- (t, n - k + 1) log-probabilities, -inf for k-mers of probability 0
+
+    Example:
+    >>> profile = np.array([[0.2, 0.2, 0.3], [0.4, 0.3, 0.1], [0.3, 0.3, 0.5], [0.1, 0.2, 0.1]])
+    >>> np.exp(window_log_probabilities(["ACCT"], profile)).round(3).tolist()
+    [[0.006, 0.012]]
+
+    """
+    codes = sequences if isinstance(sequences, np.ndarray) else encode_sequences(sequences)
+    logs = log_profile(profile)
+    k = logs.shape[1]
+    n_windows = codes.shape[1] - k + 1
+    if n_windows < 1:
+        raise ValueError("Sequences must be at least as long as the profile.")
+
+    scores = np.zeros((codes.shape[0], n_windows))
+    for j in range(k):
+        scores += logs[codes[:, j:j+n_windows], j]
+
+    return scores
+
+
+def _lengths(sequences: Sequences) -> np.ndarray:
+    """Length of each sequence; rows of an encode_sequences() array end before their trailing padding"""
+    if not isinstance(sequences, np.ndarray):
+        return np.array([len(s) for s in sequences])
+
+    valid = sequences != INVALID
+    return np.where(valid.any(axis=1), sequences.shape[1] - valid[:, ::-1].argmax(axis=1), 0)
+
+
+def _decode(codes: np.ndarray) -> str:
+    if (codes == INVALID).any():
+        raise ValueError("The k-mer holds a non-ACGT symbol; pass the sequences as strings to recover it.")
+
+    return "".join("ACGT"[code] for code in codes.tolist())
+
+
+def profile_most_probable_kmers(sequences: Sequences, profile: Profile) -> List[str]:
+    """Find the profile-most probable k-mer of each sequence, the first one on ties
+    and the first k-mer when every k-mer has probability 0. Every sequence must
+    be at least as long as the profile.
+
+    Arguments:
+        sequences {Sequences} -- DNA strings, or their encode_sequences() array
+        profile {Profile} -- 4 x k profile matrix
+
+    Returns:
+        List[str] -- one k-mer per sequence
+
+    Raises:
+        ValueError -- if a sequence is shorter than the profile, or if an encoded k-mer holds a non-ACGT symbol
+
+    Example:
+    >>> profile = np.array([[0.2, 0.2, 0.3], [0.4, 0.3, 0.1], [0.3, 0.3, 0.5], [0.1, 0.2, 0.1]])
+    >>> profile_most_probable_kmers(["ACCTGTTTATTGCCTAAGTTCCGAACAAACCCAATATAGCCCGAGGGCCT", "TTT"], profile)
+    ['CCG', 'TTT']
+    >>> profile_most_probable_kmers(["ACGT", "AC"], profile)
+    Traceback (most recent call last):
+        ...
+    ValueError: Sequences must be at least as long as the profile.
+
+    """
+    codes = sequences if isinstance(sequences, np.ndarray) else encode_sequences(sequences)
+    k = log_profile(profile).shape[1]
+    if (_lengths(sequences) - k + 1 < 1).any():
+        raise ValueError("Sequences must be at least as long as the profile.")
+    starts = window_log_probabilities(codes, profile).argmax(axis=1).tolist()
+
+    if isinstance(sequences, np.ndarray):
+        return [_decode(row[start:start+k]) for row, start in zip(codes, starts)]
+
+    return [sequence[start:start+k] for sequence, start in zip(sequences, starts)]
+
+
+def profile_most_probable_kmer(text: str, k: int, profile: Profile) -> str:
+    """Find the profile-most probable k-mer of text
+
+    Arguments:
+        text {str} -- DNA string
+        k {int} -- k-mer length
+        profile {Profile} -- 4 x k profile matrix
+
+    Returns:
+        str -- most probable k-mer, the first one on ties
+
+    Example:
+    >>> profile = np.array([[0.2, 0.2, 0.3, 0.2, 0.3], [0.4, 0.3, 0.1, 0.5, 0.1],
+    ...                     [0.3, 0.3, 0.5, 0.2, 0.4], [0.1, 0.2, 0.1, 0.1, 0.2]])
+    >>> profile_most_probable_kmer("ACCTGTTTATTGCCTAAGTTCCGAACAAACCCAATATAGCCCGAGGGCCT", 5, profile)
+    'CCGAG'
+
+    """
+    if log_profile(profile).shape[1] != k:
+        raise ValueError("Profile must have k columns.")
+
+    return profile_most_probable_kmers([text], profile)[0]
+
+
+def kmer_probabilities(sequences: Sequences, profile: Profile) -> np.ndarray:
+    """Turn each sequence's k-mer probabilities into a distribution for weighted
+    sampling, as used by randomized and Gibbs motif search. A sequence whose
+    k-mers all have probability 0 gets a uniform distribution over its own
+    k-mers; windows past the end of a shorter sequence always get 0.
+
+    Arguments:
+        sequences {Sequences} -- DNA strings, or their encode_sequences() array
+        profile {Profile} -- 4 x k profile matrix
+
+    Returns:
+        np.ndarray -- (t, n - k + 1) array, each row summing to 1
+
+    Example:
+    >>> profile = np.array([[0.5, 0.5], [0.5, 0.0], [0.0, 0.5], [0.0, 0.0]])
+    >>> kmer_probabilities(["ACAG", "TTT"], profile).tolist()
+    [[0.0, 0.5, 0.5], [0.5, 0.5, 0.0]]
+
+    """
+    codes = sequences if isinstance(sequences, np.ndarray) else encode_sequences(sequences)
+    scores = window_log_probabilities(codes, profile)
+    n_windows = _lengths(sequences) - log_profile(profile).shape[1] + 1
+    if (n_windows < 1).any():
+        raise ValueError("Sequences must be at least as long as the profile.")
+
+    exists = np.arange(scores.shape[1]) < n_windows[:, None]
+    best = scores.max(axis=1, keepdims=True)
+    weights = np.where(np.isfinite(best), np.exp(scores - np.where(np.isfinite(best), best, 0)), exists)
+
+    return weights / weights.sum(axis=1, keepdims=True)
@@ -1,8 +1,11 @@
-from strings import hamming_distance
+from typing import List
+
+import numpy as np
 
 
 def score(motifs: List[str], consensus_string: str) -> int:
-    """Score the motif matrix against a consensus sequence
+    """Score the motif matrix against a consensus sequence: the total Hamming
+    distance between the consensus and the motifs, whatever symbols they hold
     
     Arguments:
         motifs {List[str]} --  list of motifs to score
@@ -10,6 +13,9 @@ def score(motifs: List[str], consensus_string: str) -> int:
     
     Returns:
         int -- score
+
+    Raises:
+        ValueError -- if a motif and the consensus differ in length
     
     Example:
     >>> motifs = ["TCGGGGGTTTTT",
@@ -25,5 +31,13 @@ def score(motifs: List[str], consensus_string: str) -> int:
     >>> cons = "TCGGGGATTTCC"
     >>> print(score(motifs, cons))
     30
+    >>> score(["ACGN", "acgt"], "ACGT")
+    5
     """
-    return sum([hamming_distance(m, consensus_string) for m in motifs])
\ No newline at end of file
+    if any(len(motif) != len(consensus_string) for motif in motifs):
+        raise ValueError("Strings must be the same length")
+
+    symbols = np.frombuffer("".join(motifs).encode("utf-32-le"), dtype=np.uint32)
+    pattern = np.frombuffer(consensus_string.encode("utf-32-le"), dtype=np.uint32)
+
+    return (symbols.reshape(len(motifs), len(pattern)) != pattern).sum().item()
\ No newline at end of file
@@ -0,0 +1,94 @@
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+from bioalgo.clustering.features import frequencies_to_features
+from bioalgo.clustering.kmeans import squared_distances
+from bioalgo.strings.hamming_kernel import hamming_all_vs_all
+
+
+METRICS = ("hamming", "p-distance", "jukes-cantor")
+BLOCK_CELLS = 1 << 22  # profile distances computed at once
+
+
+def check_metric(metric: str) -> None:
+    """Raise a ValueError if metric is not one of the supported sequence distances
+
+    Arguments:
+        metric {str} -- name of the distance
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric!r}, expected one of {METRICS}")
+
+
+def sequence_distances(sequences: Sequence[str], metric: str = "hamming") -> np.ndarray:
+    """Pairwise distance matrix of aligned sequences, from the blocked
+    all-vs-all Hamming kernel of bioalgo.strings.hamming_kernel (2-bit packed
+    words for plain DNA, byte comparison otherwise)
+
+    Arguments:
+        sequences {Sequence[str]} -- aligned sequences of equal length
+
+    Keyword Arguments:
+        metric {str} -- "hamming" (mismatch count), "p-distance" (mismatch fraction)
+        or "jukes-cantor" (p-distance corrected for multiple substitutions, infinite
+        once p reaches 3/4) (default: {"hamming"})
+
+    Returns:
+        np.ndarray -- symmetric (n, n) float64 distance matrix
+
+    Example:
+    >>> sequence_distances(["ACGTAC", "ACGTTC", "TCGAAC"]).tolist()
+    [[0.0, 1.0, 2.0], [1.0, 0.0, 3.0], [2.0, 3.0, 0.0]]
+    >>> sequence_distances(["ACGTAC", "ACGTTC"], metric="jukes-cantor").round(4).tolist()
+    [[0.0, 0.1885], [0.1885, 0.0]]
+
+    """
+    check_metric(metric)
+    distances = hamming_all_vs_all(sequences).astype(np.float64)
+    if metric == "hamming" or not len(distances):
+        return distances
+
+    distances /= max(len(sequences[0]), 1)
+    if metric == "jukes-cantor":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = -0.75 * np.log1p(-4 / 3 * distances)
+        distances[np.isnan(distances)] = np.inf  # saturated: p >= 3/4
+
+    return distances
+
+
+def profile_distances(profiles: Union[np.ndarray, Sequence[Dict[str, int]]], k: int = None) -> np.ndarray:
+    """Pairwise Euclidean distance matrix of composition profiles, computed in
+    row blocks with one matrix product each
+
+    Arguments:
+        profiles {Union[np.ndarray, Sequence[Dict[str, int]]]} -- (n, d) feature matrix, such as
+        kmer_feature_matrix, or k-mer counts as returned by compute_frequencies
+
+    Keyword Arguments:
+        k {int} -- k-mer length, required when profiles are count dictionaries (default: {None})
+
+    Returns:
+        np.ndarray -- symmetric (n, n) float64 distance matrix
+
+    Example:
+    >>> from bioalgo.strings.compute_frequencies import compute_frequencies
+    >>> counts = [compute_frequencies(text, 1) for text in ["AAAA", "AACC", "CCCC"]]
+    >>> profile_distances(counts, 1).round(4).tolist()
+    [[0.0, 0.7071, 1.4142], [0.7071, 0.0, 0.7071], [1.4142, 0.7071, 0.0]]
+
+    """
+    if not isinstance(profiles, np.ndarray):
+        if k is None:
+            raise ValueError("k is required to build profiles from k-mer counts")
+        profiles = frequencies_to_features(profiles, k)
+
+    n = len(profiles)
+    distances = np.empty((n, n))
+    block = max(1, BLOCK_CELLS // max(n, 1))
+    for first in range(0, n, block):
+        distances[first:first + block] = np.sqrt(squared_distances(profiles[first:first + block], profiles))
+    np.fill_diagonal(distances, 0)
+
+    return np.minimum(distances, distances.T, out=distances)
@@ -0,0 +1,289 @@
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+
+
+BLOCK_CELLS = 1 << 20  # cells of the neighbor-joining matrix scanned at once
+
+
+class Tree(NamedTuple):
+    """Weighted tree whose leaves are nodes 0..n-1, in the order of the distance
+    matrix, and whose internal nodes are numbered from n in order of creation.
+    Each row of edges is a (parent, child) pair with the branch length at the
+    same index of lengths; root is the node Newick output starts from."""
+    edges: np.ndarray
+    lengths: np.ndarray
+    names: List[str]
+    root: int
+
+
+def _check_distances(distances: np.ndarray, names: Sequence[str]) -> List[str]:
+    distances = np.asarray(distances)
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1] or not len(distances):
+        raise ValueError("Distances must be a non-empty square matrix")
+    if not np.isfinite(distances).all():
+        raise ValueError("Distances must be finite; saturated Jukes-Cantor distances are infinite")
+    if not np.allclose(distances, distances.T):
+        raise ValueError("Distances must be symmetric")
+    names = [str(i) for i in range(len(distances))] if names is None else list(names)
+    if len(names) != len(distances):
+        raise ValueError("There must be one name per row of the distance matrix")
+
+    return names
+
+
+def _tree(edges: list, lengths: list, names: List[str], root: int) -> Tree:
+    return Tree(np.array(edges, dtype=np.int64).reshape(-1, 2), np.array(lengths, dtype=np.float64), names, root)
+
+
+def _closest_pair(matrix: np.ndarray, totals: np.ndarray, m: int):
+    """Pair i < j minimizing the neighbor-joining criterion
+    (m - 2) * D[i, j] - total[i] - total[j], scanned in row blocks"""
+    best, best_i, best_j = np.inf, 0, 1
+    block = max(1, BLOCK_CELLS // m)
+    for first in range(0, m, block):
+        last = min(first + block, m)
+        q = matrix[first:last, :m] * (m - 2)
+        q -= totals[first:last, None]
+        q -= totals[None, :m]
+        rows = np.arange(len(q))
+        q[rows, first + rows] = np.inf
+        flat = int(q.argmin())
+        if q.flat[flat] < best:
+            best, best_i, best_j = q.flat[flat], first + flat // m, flat % m
+
+    return min(best_i, best_j), max(best_i, best_j)
+
+
+def neighbor_joining(distances: np.ndarray, names: Sequence[str] = None) -> Tree:
+    """Neighbor joining. The working matrix is a single n x n copy updated in
+    place: the joined node takes the row of one neighbor and the last active
+    row moves into the other, so the active nodes always occupy the leading
+    m x m block. Row totals are updated in O(m) per join, and the minimum of
+    the criterion is a vectorized scan, for O(n^3) time and O(n^2) memory.
+    The result reconstructs an additive matrix exactly.
+
+    Arguments:
+        distances {np.ndarray} -- symmetric (n, n) distance matrix
+
+    Keyword Arguments:
+        names {Sequence[str]} -- leaf names, None for "0", "1", ... (default: {None})
+
+    Returns:
+        Tree -- unrooted tree, with root set to the last internal node created
+
+    Example:
+    >>> tree = neighbor_joining([[0, 23, 27, 20], [23, 0, 30, 28], [27, 30, 0, 30], [20, 28, 30, 0]])
+    >>> print("\\n".join(adjacency_list(tree)))
+    0->4:8.000
+    1->5:13.500
+    2->5:16.500
+    3->4:12.000
+    4->0:8.000
+    4->3:12.000
+    4->5:2.000
+    5->1:13.500
+    5->2:16.500
+    5->4:2.000
+
+    """
+    names = _check_distances(distances, names)
+    matrix = np.array(distances, dtype=np.float64)
+    n = len(matrix)
+    slots = np.arange(n)
+    totals = matrix.sum(axis=1)
+    edges, lengths = [], []
+
+    node, m = n, n
+    while m > 2:
+        i, j = _closest_pair(matrix, totals, m)
+        d_ij = matrix[i, j]
+        delta = (totals[i] - totals[j]) / (m - 2)
+        edges += [(node, slots[i]), (node, slots[j])]
+        lengths += [(d_ij + delta) / 2, (d_ij - delta) / 2]
+
+        joined = (matrix[i, :m] + matrix[j, :m] - d_ij) / 2
+        totals[:m] += joined - matrix[:m, i] - matrix[:m, j]
+        joined[[i, j]] = 0
+        matrix[i, :m] = joined
+        matrix[:m, i] = joined
+        totals[i] = joined.sum()
+        slots[i] = node
+
+        last = m - 1
+        if j != last:
+            matrix[j, :m] = matrix[last, :m]
+            matrix[:m, j] = matrix[:m, last]
+            matrix[j, j] = 0
+            totals[j] = totals[last]
+            slots[j] = slots[last]
+        node += 1
+        m -= 1
+
+    if n > 1:
+        edges.append((slots[0], slots[1]))
+        lengths.append(matrix[0, 1])
+
+    return _tree(edges, lengths, names, node - 1 if n > 2 else 0)
+
+
+def upgma(distances: np.ndarray, names: Sequence[str] = None) -> Tree:
+    """UPGMA: repeatedly merge the two closest clusters under a new node at half
+    their distance, averaging distances by cluster size. The merged cluster
+    reuses a row of one n x n working matrix, and the minimum of every row is
+    cached, so each merge rescans only the rows whose minimum pointed at a
+    merged cluster: O(n^2) memory and, in practice, O(n^2) time.
+
+    Arguments:
+        distances {np.ndarray} -- symmetric (n, n) distance matrix
+
+    Keyword Arguments:
+        names {Sequence[str]} -- leaf names, None for "0", "1", ... (default: {None})
+
+    Returns:
+        Tree -- rooted ultrametric tree
+
+    Example:
+    >>> tree = upgma([[0, 20, 17, 11], [20, 0, 20, 13], [17, 20, 0, 10], [11, 13, 10, 0]])
+    >>> print("\\n".join(adjacency_list(tree)))
+    0->5:7.000
+    1->6:8.833
+    2->4:5.000
+    3->4:5.000
+    4->2:5.000
+    4->3:5.000
+    4->5:2.000
+    5->0:7.000
+    5->4:2.000
+    5->6:1.833
+    6->1:8.833
+    6->5:1.833
+
+    """
+    names = _check_distances(distances, names)
+    matrix = np.array(distances, dtype=np.float64)
+    n = len(matrix)
+    np.fill_diagonal(matrix, np.inf)
+    slots = np.arange(n)
+    sizes = np.ones(n)
+    ages = np.zeros(2 * n - 1)
+    row_min = matrix.min(axis=1)
+    row_arg = matrix.argmin(axis=1)
+    edges, lengths = [], []
+
+    for node in range(n, 2 * n - 1):
+        i = int(row_min.argmin())
+        j = int(row_arg[i])
+        ages[node] = matrix[i, j] / 2
+        edges += [(node, slots[i]), (node, slots[j])]
+        lengths += [ages[node] - ages[slots[i]], ages[node] - ages[slots[j]]]
+
+        merged = (matrix[i] * sizes[i] + matrix[j] * sizes[j]) / (sizes[i] + sizes[j])
+        merged[[i, j]] = np.inf
+        matrix[j] = np.inf
+        matrix[:, j] = np.inf
+        matrix[i] = merged
+        matrix[:, i] = merged
+        sizes[i] += sizes[j]
+        slots[i] = node
+
+        # rows whose minimum was in a merged column are rescanned, the rest
+        # can only have improved through the new column i
+        stale = np.flatnonzero((row_arg == i) | (row_arg == j))
+        row_min[stale] = matrix[stale].min(axis=1)
+        row_arg[stale] = matrix[stale].argmin(axis=1)
+        closer = merged < row_min
+        row_min[closer] = merged[closer]
+        row_arg[closer] = i
+        row_min[j] = np.inf
+        row_min[i] = merged.min()
+        row_arg[i] = merged.argmin()
+
+    return _tree(edges, lengths, names, 2 * n - 2)
+
+
+def _neighbors(tree: Tree, n_nodes: int):
+    """CSR adjacency of the tree: neighbors of node v are
+    targets[offsets[v]:offsets[v+1]], with matching branch lengths"""
+    sources = np.concatenate((tree.edges[:, 0], tree.edges[:, 1]))
+    targets = np.concatenate((tree.edges[:, 1], tree.edges[:, 0]))
+    weights = np.concatenate((tree.lengths, tree.lengths))
+    order = np.lexsort((targets, sources))
+    offsets = np.searchsorted(sources[order], np.arange(n_nodes + 1))
+
+    return offsets, targets[order], weights[order]
+
+
+def adjacency_list(tree: Tree, decimals: int = 3) -> List[str]:
+    """Edges of the tree in both directions as "node->neighbor:length" lines,
+    sorted by node and neighbor
+
+    Arguments:
+        tree {Tree} -- tree
+
+    Keyword Arguments:
+        decimals {int} -- digits after the decimal point (default: {3})
+
+    Returns:
+        List[str] -- one line per directed edge
+    """
+    offsets, targets, weights = _neighbors(tree, len(tree.edges) + 1)
+    lines = []
+    for node in range(len(offsets) - 1):
+        for target, weight in zip(targets[offsets[node]:offsets[node + 1]].tolist(),
+                                  weights[offsets[node]:offsets[node + 1]].tolist()):
+            lines.append(f"{node}->{target}:{weight:.{decimals}f}")
+
+    return lines
+
+
+def _newick_name(name: str) -> str:
+    if any(symbol in name for symbol in " \t()[]':;,"):
+        return "'" + name.replace("'", "''") + "'"
+
+    return name
+
+
+def to_newick(tree: Tree, precision: int = 6) -> str:
+    """Write the tree in Newick format, starting from tree.root. Leaves are
+    labelled with their names and internal nodes are unlabelled. The tree is
+    walked iteratively, so deep trees do not hit the recursion limit.
+
+    Arguments:
+        tree {Tree} -- tree
+
+    Keyword Arguments:
+        precision {int} -- significant digits of branch lengths (default: {6})
+
+    Returns:
+        str -- Newick string ending with ";"
+
+    Example:
+    >>> tree = upgma([[0, 20, 17, 11], [20, 0, 20, 13], [17, 20, 0, 10], [11, 13, 10, 0]], names="ABCD")
+    >>> to_newick(tree)
+    '(B:8.83333,(A:7,(C:5,D:5):2):1.83333);'
+
+    """
+    n_leaves = len(tree.names)
+    offsets, targets, weights = _neighbors(tree, len(tree.edges) + 1)
+    parts = {}
+    # (node, parent, length, expanded): children are written before their parent
+    stack = [(tree.root, -1, None, False)]
+    while stack:
+        node, parent, length, expanded = stack.pop()
+        children = [(int(target), weight) for target, weight
+                    in zip(targets[offsets[node]:offsets[node + 1]], weights[offsets[node]:offsets[node + 1]])
+                    if target != parent]
+        if not expanded and children:
+            stack.append((node, parent, length, True))
+            stack.extend((child, node, weight, False) for child, weight in reversed(children))
+            continue
+
+        label = _newick_name(tree.names[node]) if node < n_leaves else ""
+        if children:
+            label = "(" + ",".join(parts.pop(child) for child, _ in children) + ")" + label
+        if length is not None:
+            label += f":{length:.{precision}g}"
+        parts[node] = label
+
+    return parts[tree.root] + ";"
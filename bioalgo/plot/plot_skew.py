@@ -1,22 +1,25 @@
-from typing import List
-
 import matplotlib.pyplot as plt
+import numpy as np
 
-from bioalgo.strings.compute_skew import compute_skew
-
+from bioalgo.strings.skew import downsample_skew, skew_array
 
 
-def plot_skew(sequence: str):
-    """Plot the skew diagram for the given sequence
+def plot_skew(sequence: str, points: int = 4000):
+    """Plot the skew diagram for the given sequence. Long sequences are reduced
+    to the minimum and maximum skew of each of points / 2 windows, so the number
+    of points drawn does not grow with the sequence length.
     
     Arguments:
         sequence {str} -- DNA sequence
+
+    Keyword Arguments:
+        points {int} -- maximum number of points to draw (default: {4000})
     """
-    skew_list = compute_skew.compute_skew(sequence)
-    positions = [x for x in range(len(sequence))]
+    skew = np.concatenate(([0], skew_array(sequence)))
+    positions, skew = downsample_skew(skew, points)
 
     # plot the skew
-    plt.plot(positions, skew_list)
+    plt.plot(positions, skew)
     plt.title("Skew Diagram")
     plt.xlabel("Position")
     plt.ylabel("Skew")
@@ -0,0 +1,309 @@
+"""On-disk 2-bit packed genome format
+
+Layout (all integers little-endian):
+
+    header   magic b"BA2B", version u16, reserved u16, record count u32, index offset u64
+    data     per record, its bases packed four to a byte (see bioalgo.strings.dna_packing)
+    index    per record: name length u16, name (utf-8), length u64, data offset u64,
+             N-run count u32, mask-run count u32, then the N runs and the soft-mask
+             (lowercase) runs, each as u64 starts followed by u64 lengths
+
+Any symbol other than A, C, G or T is stored as an N run and read back as 'N'.
+"""
+import mmap
+import struct
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from bioalgo.seqio.readers import DEFAULT_CHUNK_SIZE, read_records
+from bioalgo.seqio.writers import write_fasta
+from bioalgo.strings.dna_packing import pack_codes, unpack_codes
+
+
+MAGIC = b"BA2B"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIQ")
+_RECORD = struct.Struct("<QQII")
+
+_CODES = np.full(256, 255, dtype=np.uint8)
+for _code, _base in enumerate("ACGT"):
+    _CODES[ord(_base)] = _code
+    _CODES[ord(_base.lower())] = _code
+_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the starts and ends of the runs of True in a boolean array"""
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+class _RunList:
+    """Runs of positions accumulated chunk by chunk, merging runs that touch"""
+
+    def __init__(self):
+        self.starts = []
+        self.lengths = []
+
+    def add(self, mask: np.ndarray, offset: int):
+        for start, end in zip(*_runs(mask)):
+            start, end = int(start) + offset, int(end) + offset
+            if self.starts and self.starts[-1] + self.lengths[-1] == start:
+                self.lengths[-1] += end - start
+            else:
+                self.starts.append(start)
+                self.lengths.append(end - start)
+
+    def to_bytes(self) -> bytes:
+        return np.array(self.starts + self.lengths, dtype="<u8").tobytes()
+
+
+def _write_record(handle, name: str, chunks: Iterable[str]) -> bytes:
+    """Pack one record into handle and return its index entry"""
+    data_offset = handle.tell()
+    n_runs, mask_runs = _RunList(), _RunList()
+    carry = np.zeros(0, dtype=np.uint8)
+    length = 0
+
+    for chunk in chunks:
+        raw = np.frombuffer(chunk.encode("ascii"), dtype=np.uint8)
+        codes = _CODES[raw]
+        unknown = codes == 255
+        n_runs.add(unknown, length)
+        mask_runs.add(raw >= ord("a"), length)
+        codes[unknown] = 0
+        length += len(raw)
+
+        # keep records byte-aligned by carrying bases that do not fill a byte
+        codes = np.concatenate((carry, codes))
+        n_full = len(codes) // 4 * 4
+        handle.write(pack_codes(codes[:n_full]))
+        carry = codes[n_full:]
+
+    handle.write(pack_codes(carry))
+
+    name_bytes = name.encode("utf-8")
+    entry = struct.pack("<H", len(name_bytes)) + name_bytes
+    entry += _RECORD.pack(length, data_offset, len(n_runs.starts), len(mask_runs.starts))
+
+    return entry + n_runs.to_bytes() + mask_runs.to_bytes()
+
+
+def write_packed(records: Iterable[Tuple[str, Iterable[str]]], path: str):
+    """Write sequences to a packed genome file, streaming each record chunk by chunk
+
+    Arguments:
+        records {Iterable[Tuple[str, Iterable[str]]]} -- (name, chunks) pairs, e.g. from read_records
+        path {str} -- output path
+
+    Raises:
+        ValueError -- if two records share a name, since records are looked up by name
+    """
+    entries = []
+    names = set()
+    with open(path, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        for name, chunks in records:
+            if name in names:
+                raise ValueError(f"Duplicate record name: {name!r}")
+            names.add(name)
+            if isinstance(chunks, str):
+                chunks = [chunks]
+            entries.append(_write_record(handle, name, chunks))
+
+        index_offset = handle.tell()
+        for entry in entries:
+            handle.write(entry)
+
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, VERSION, 0, len(entries), index_offset))
+
+
+def fasta_to_packed(fasta_path: str, packed_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Convert a (optionally gzipped) FASTA file to the packed genome format
+
+    Arguments:
+        fasta_path {str} -- input FASTA path
+        packed_path {str} -- output packed genome path
+
+    Keyword Arguments:
+        chunk_size {int} -- bases read per chunk (default: {DEFAULT_CHUNK_SIZE})
+
+    Raises:
+        ValueError -- if two records share an ID
+    """
+    write_packed(read_records(fasta_path, chunk_size), packed_path)
+
+
+def packed_to_fasta(packed_path: str, fasta_path: str, line_width: int = 60):
+    """Convert a packed genome file back to FASTA
+
+    Arguments:
+        packed_path {str} -- input packed genome path
+        fasta_path {str} -- output FASTA path
+
+    Keyword Arguments:
+        line_width {int} -- bases per FASTA line (default: {60})
+    """
+    block = line_width * 16384
+    with PackedGenome(packed_path) as genome:
+        records = ((name, (genome.fetch(name, start, min(start + block, genome.length(name)))
+                           for start in range(0, genome.length(name), block)))
+                   for name in genome.names)
+        write_fasta(records, fasta_path, line_width)
+
+
+class _Record:
+    def __init__(self, length: int, data_offset: int, n_runs: np.ndarray, mask_runs: np.ndarray):
+        self.length = length
+        self.data_offset = data_offset
+        self.n_runs = n_runs
+        self.mask_runs = mask_runs
+
+
+def _overlapping(runs: np.ndarray, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """Yield the parts of the sorted (starts, lengths) runs that fall in [start, end)"""
+    starts, lengths = runs
+    ends = starts + lengths
+    first = np.searchsorted(ends, start, side="right")
+    last = np.searchsorted(starts, end, side="left")
+    for run_start, run_end in zip(starts[first:last], ends[first:last]):
+        yield max(int(run_start), start), min(int(run_end), end)
+
+
+class PackedSequence:
+    """Lazy view of one record of a PackedGenome that supports len() and slicing"""
+
+    def __init__(self, genome: "PackedGenome", name: str):
+        self._genome = genome
+        self.name = name
+
+    def __len__(self) -> int:
+        return self._genome.length(self.name)
+
+    def __getitem__(self, key) -> str:
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("sequence index out of range")
+            return self._genome.fetch(self.name, key, key + 1)
+
+        start, stop, step = key.indices(len(self))
+        if step == 1:
+            return self._genome.fetch(self.name, start, stop)
+
+        positions = range(start, stop, step)
+        if not positions:
+            return ""
+        low, high = min(positions[0], positions[-1]), max(positions[0], positions[-1]) + 1
+        sequence = self._genome.fetch(self.name, low, high)
+        return "".join(sequence[i - low] for i in positions)
+
+    def __str__(self) -> str:
+        return self._genome.fetch(self.name, 0, len(self))
+
+
+class PackedGenome:
+    """Random-access reader for packed genome files. The file is memory-mapped so
+    fetching a subsequence only touches the bytes that cover it.
+
+    Example:
+        with PackedGenome("genome.ba2b") as genome:
+            region = genome["chr1"][10000:10100]
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._records = self._read_index()
+
+    def _read_index(self) -> Dict[str, _Record]:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("File is too short to be a packed genome")
+
+        magic, version, _, n_records, position = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a packed genome file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported packed genome version: {version}")
+
+        records = {}
+        for _ in range(n_records):
+            (name_length,) = struct.unpack_from("<H", self._mmap, position)
+            position += 2
+            name = self._mmap[position:position+name_length].decode("utf-8")
+            position += name_length
+            length, data_offset, n_count, mask_count = _RECORD.unpack_from(self._mmap, position)
+            position += _RECORD.size
+
+            runs = []
+            for count in (n_count, mask_count):
+                values = np.frombuffer(self._mmap, dtype="<u8", count=2 * count, offset=position)
+                runs.append(values.astype(np.int64).reshape(2, count))
+                position += 16 * count
+
+            if name in records:
+                raise ValueError(f"Duplicate record name: {name!r}")
+            records[name] = _Record(length, data_offset, *runs)
+
+        return records
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._records)
+
+    def length(self, name: str) -> int:
+        return self._records[name].length
+
+    def fetch(self, name: str, start: int, end: int) -> str:
+        """Return bases [start, end) (0-based, half-open) of the named record
+
+        Arguments:
+            name {str} -- record name
+            start {int} -- first base
+            end {int} -- one past the last base
+
+        Returns:
+            str -- the subsequence, with N runs and soft-masked bases restored
+        """
+        record = self._records[name]
+        start, end = max(start, 0), min(end, record.length)
+        if start >= end:
+            return ""
+
+        data = memoryview(self._mmap)[record.data_offset:record.data_offset + (record.length + 3) // 4]
+        try:
+            bases = _BASES[unpack_codes(data, end - start, start)]
+        finally:
+            data.release()
+
+        for run_start, run_end in _overlapping(record.n_runs, start, end):
+            bases[run_start - start:run_end - start] = ord("N")
+        for run_start, run_end in _overlapping(record.mask_runs, start, end):
+            bases[run_start - start:run_end - start] |= 0x20
+
+        return bases.tobytes().decode("ascii")
+
+    def __getitem__(self, name: str) -> PackedSequence:
+        if name not in self._records:
+            raise KeyError(name)
+        return PackedSequence(self, name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackedGenome":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,215 @@
+import gzip
+from itertools import groupby
+from operator import itemgetter
+from typing import IO, Iterable, Iterator, Tuple
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # bases per chunk
+
+
+def open_sequence_file(path: str) -> IO[str]:
+    """Open a plain or gzip-compressed sequence file for reading as text
+
+    Arguments:
+        path {str} -- path to a FASTA/FASTQ file, optionally gzip-compressed
+
+    Returns:
+        IO[str] -- text file handle
+    """
+    with open(path, "rb") as handle:
+        magic = handle.read(2)
+
+    if magic == b"\x1f\x8b":
+        return gzip.open(path, "rt")
+
+    return open(path, "r")
+
+
+def _split(buffer: str, chunk_size: int) -> Tuple[list, str]:
+    """Split buffer into full chunks of chunk_size and the remaining tail"""
+    n_full = len(buffer) // chunk_size * chunk_size
+    chunks = [buffer[i:i+chunk_size] for i in range(0, n_full, chunk_size)]
+
+    return chunks, buffer[n_full:]
+
+
+def _fasta_chunks(handle: IO[str], chunk_size: int) -> Iterator[Tuple[int, str, str]]:
+    record_index = -1
+    record_id = None
+    pieces = []
+    buffered = 0
+    line_start = True
+
+    # readline(limit) keeps memory bounded even for single-line genomes
+    for line in iter(lambda: handle.readline(chunk_size), ""):
+        at_line_start = line_start
+        line_start = line.endswith("\n")
+
+        if at_line_start and line.startswith(">"):
+            if pieces:
+                yield record_index, record_id, "".join(pieces)
+            header = line
+            while not header.endswith("\n"):
+                rest = handle.readline(chunk_size)
+                if not rest:
+                    break
+                header += rest
+            line_start = True
+            record_id = header[1:].split()[0] if header[1:].strip() else ""
+            record_index += 1
+            yield record_index, record_id, ""
+            pieces = []
+            buffered = 0
+            continue
+
+        line = line.strip()
+        if not line:
+            continue
+
+        if record_id is None:
+            raise ValueError("FASTA sequence found before the first header line")
+
+        pieces.append(line)
+        buffered += len(line)
+        if buffered >= chunk_size:
+            chunks, tail = _split("".join(pieces), chunk_size)
+            for chunk in chunks:
+                yield record_index, record_id, chunk
+            pieces = [tail] if tail else []
+            buffered = len(tail)
+
+    if pieces:
+        yield record_index, record_id, "".join(pieces)
+
+
+def _fastq_chunks(handle: IO[str], chunk_size: int) -> Iterator[Tuple[int, str, str]]:
+    lines = (line.strip() for line in handle)
+
+    for record_index, header in enumerate(line for line in lines if line):
+        if not header.startswith("@"):
+            raise ValueError(f"Malformed FASTQ header: {header!r}")
+
+        record_id = header[1:].split()[0] if len(header) > 1 else ""
+        pieces = []
+        for line in lines:
+            if line.startswith("+"):
+                break
+            pieces.append(line)
+
+        sequence = "".join(pieces)
+
+        # quality strings may start with '@' so consume them by length, not by prefix
+        quality_length = 0
+        while quality_length < len(sequence):
+            quality = next(lines, None)
+            if quality is None:
+                raise ValueError(f"Truncated FASTQ record: {record_id}")
+            quality_length += len(quality)
+
+        yield record_index, record_id, ""
+        for i in range(0, len(sequence), chunk_size):
+            yield record_index, record_id, sequence[i:i+chunk_size]
+
+
+def _record_chunks(path: str, chunk_size: int) -> Iterator[Tuple[int, str, str]]:
+    """(record index, record id, chunk) triples in file order; every record
+    starts with an empty chunk, so records without sequence are seen too"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    with open_sequence_file(path) as handle:
+        first = handle.read(1)
+        handle.seek(0)
+        if first == "@":
+            yield from _fastq_chunks(handle, chunk_size)
+        elif first in (">", ""):
+            yield from _fasta_chunks(handle, chunk_size)
+        else:
+            raise ValueError(f"{path} is neither FASTA nor FASTQ")
+
+
+def read_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, str]]:
+    """Stream the sequences of a FASTA or FASTQ file (optionally gzipped) in
+    non-overlapping chunks of at most chunk_size bases
+
+    Arguments:
+        path {str} -- path to the sequence file
+
+    Keyword Arguments:
+        chunk_size {int} -- maximum number of bases per chunk (default: {DEFAULT_CHUNK_SIZE})
+
+    Returns:
+        Iterator[Tuple[str, str]] -- (record id, chunk) pairs in file order
+    """
+    for _, record_id, chunk in _record_chunks(path, chunk_size):
+        if chunk:
+            yield record_id, chunk
+
+
+def read_records(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Iterator[str]]]:
+    """Stream the records of a sequence file, each as a lazy iterator of chunks.
+    A record's chunks must be consumed before advancing to the next record.
+    Every header gives one record, even when its ID repeats an earlier one or
+    it has no sequence (then its iterator is empty).
+
+    Arguments:
+        path {str} -- path to the sequence file
+
+    Keyword Arguments:
+        chunk_size {int} -- maximum number of bases per chunk (default: {DEFAULT_CHUNK_SIZE})
+
+    Returns:
+        Iterator[Tuple[str, Iterator[str]]] -- (record id, chunk iterator) pairs
+    """
+    for (_, record_id), group in groupby(_record_chunks(path, chunk_size), key=itemgetter(0, 1)):
+        yield record_id, (chunk for _, _, chunk in group if chunk)
+
+
+def overlapping_chunks(chunks: Iterable[str], overlap: int) -> Iterator[Tuple[int, str]]:
+    """Prefix every chunk with the last overlap bases carried over from the previous
+    chunk so that windows spanning a chunk boundary are seen exactly once
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+        overlap {int} -- number of bases to carry over, k - 1 for k-mer windows
+
+    Returns:
+        Iterator[Tuple[int, str]] -- (0-based offset of the first base, chunk with carried prefix)
+
+    Example:
+    >>> list(overlapping_chunks(["ACGT", "TTAG", "C"], 2))
+    [(0, 'ACGT'), (2, 'GTTTAG'), (6, 'AGC')]
+
+    """
+    if overlap < 0:
+        raise ValueError("overlap must be non-negative")
+
+    carry = ""
+    offset = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        window = carry + chunk
+        yield offset, window
+        carry = window[max(len(window) - overlap, 0):] if overlap else ""
+        offset += len(window) - len(carry)
+
+
+def iter_sequence_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         overlap: int = 0) -> Iterator[Tuple[str, int, str]]:
+    """Stream a sequence file in bounded chunks with overlap bases carried between
+    consecutive chunks of the same record
+
+    Arguments:
+        path {str} -- path to the sequence file
+
+    Keyword Arguments:
+        chunk_size {int} -- maximum number of new bases per chunk (default: {DEFAULT_CHUNK_SIZE})
+        overlap {int} -- bases carried over from the previous chunk (default: {0})
+
+    Returns:
+        Iterator[Tuple[str, int, str]] -- (record id, 0-based offset within the record, chunk)
+    """
+    for record_id, chunks in read_records(path, chunk_size):
+        for offset, chunk in overlapping_chunks(chunks, overlap):
+            yield record_id, offset, chunk
@@ -0,0 +1,222 @@
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Set
+
+import numpy as np
+
+from bioalgo.seqio.readers import overlapping_chunks
+from bioalgo.strings.compute_frequencies import compute_frequencies
+from bioalgo.strings.find_clumps import ClumpFinder
+from bioalgo.strings.pattern_count import pattern_count
+from bioalgo.strings.pattern_index import pattern_index
+from bioalgo.strings.skew import skew_array
+
+
+def stream_nucleotides(chunks: Iterable[str]) -> Dict[str, int]:
+    """Count the nucleotides of a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+    Returns:
+        Dict[str, int] -- counts of nucleotides, as nucleotides() on the whole sequence
+
+    Example:
+    >>> stream_nucleotides(["ACAACTATGCATACT", "ATCGGGAACTATCCT"])
+    {'A': 10, 'C': 8, 'T': 8, 'G': 4}
+
+    """
+    counts = Counter()
+    for chunk in chunks:
+        counts.update(chunk.upper())
+
+    return dict(counts)
+
+
+def stream_gc_content(chunks: Iterable[str]) -> float:
+    """Return the GC content of a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+    Returns:
+        float -- GC content rounded to 5 decimal places
+
+    Example:
+    >>> stream_gc_content(["ACAACTATGCATACT", "ATCGGGAACTATCCT"])
+    40.0
+
+    """
+    gc_count = 0
+    length = 0
+    for chunk in chunks:
+        chunk = chunk.upper()
+        gc_count += chunk.count("G") + chunk.count("C")
+        length += len(chunk)
+
+    return round(gc_count / length * 100, 5)
+
+
+def stream_skew(chunks: Iterable[str]) -> Iterator[List[int]]:
+    """Compute the skew of a sequence streamed in chunks, carrying the running
+    skew from one chunk into the next
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+    Returns:
+        Iterator[List[int]] -- skew values of each chunk, which concatenate to compute_skew()
+
+    Example:
+    >>> list(stream_skew(["GGC", "CCA"]))
+    [[1, 2, 1], [0, -1, -1]]
+
+    """
+    carried = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        skew = skew_array(chunk, offset=carried)
+        carried = int(skew[-1])
+        yield skew.tolist()
+
+
+def _stream_extreme_skew(chunks: Iterable[str], minimum: bool) -> List[int]:
+    best, positions = 0, [0]
+    carried = length = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        skew = skew_array(chunk, offset=carried)
+        extreme = int(skew.min() if minimum else skew.max())
+        if extreme == best or (extreme < best) == minimum:
+            hits = (length + 1 + np.flatnonzero(skew == extreme)).tolist()
+            positions = positions + hits if extreme == best else hits
+            best = extreme
+        carried = int(skew[-1])
+        length += len(chunk)
+
+    return positions
+
+
+def stream_minimum_skew(chunks: Iterable[str]) -> List[int]:
+    """Find the positions of minimum skew in a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+    Returns:
+        List[int] -- positions in increasing order, as minimum_skew() on the whole sequence
+
+    Example:
+    >>> stream_minimum_skew(["TAAAGACTGCCGAGAGGCCAACACG", "AGTGCTAGAACGAGGGGCGTAAACGCGGGTCCGAT"])
+    [11, 24]
+
+    """
+    return _stream_extreme_skew(chunks, minimum=True)
+
+
+def stream_maximum_skew(chunks: Iterable[str]) -> List[int]:
+    """Find the positions of maximum skew in a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+    Returns:
+        List[int] -- positions in increasing order, as maximum_skew() on the whole sequence
+
+    Example:
+    >>> stream_maximum_skew(["CATGGGCATC", "GGCCATACGCC"])
+    [6, 12]
+
+    """
+    return _stream_extreme_skew(chunks, minimum=False)
+
+
+def stream_pattern_count(chunks: Iterable[str], pattern: str) -> int:
+    """Count the occurences of pattern in a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+        pattern {str} -- pattern to count
+
+    Returns:
+        int -- number of occurences, including those spanning chunk boundaries
+
+    Example:
+    >>> stream_pattern_count(["ACAACTATGCATAC", "TATCGGGAACTATCCT"], "ACTAT")
+    3
+
+    """
+    return sum(pattern_count(chunk, pattern) for _, chunk in overlapping_chunks(chunks, len(pattern) - 1))
+
+
+def stream_pattern_index(chunks: Iterable[str], pattern: str) -> Iterator[int]:
+    """Yield the 1-based positions of pattern in a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+        pattern {str} -- pattern to search for
+
+    Returns:
+        Iterator[int] -- positions in increasing order, as pattern_index() on the whole sequence
+
+    Example:
+    >>> list(stream_pattern_index(["ACAACTA", "TGCATACTATCGGGAACTATCCT"], "TAT"))
+    [6, 15, 25]
+
+    """
+    for offset, chunk in overlapping_chunks(chunks, len(pattern) - 1):
+        for position in pattern_index(chunk, pattern):
+            yield offset + position
+
+
+def stream_compute_frequencies(chunks: Iterable[str], k: int, backend: str = "python") -> Dict[str, int]:
+    """Count every k-mer of a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        backend {str} -- counting backend passed to compute_frequencies (default: {"python"})
+
+    Returns:
+        Dict[str, int] -- k-mers and their counts over the whole sequence
+
+    Example:
+    >>> stream_compute_frequencies(["AC", "GT"], 2)
+    {'AC': 1, 'CG': 1, 'GT': 1}
+
+    """
+    frequencies = Counter()
+    for _, chunk in overlapping_chunks(chunks, k - 1):
+        frequencies.update(compute_frequencies(chunk, k, backend))
+
+    return dict(frequencies)
+
+
+def stream_find_clumps(chunks: Iterable[str], k: int, L: int, t: int, backend: str = "python") -> Set[str]:
+    """Find the k-mers forming (L, t)-clumps in a sequence streamed in chunks
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one sequence
+        k {int} -- k-mer length
+        L {int} -- window length
+        t {int} -- minimum number of occurences inside a window
+
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" (default: {"python"})
+
+    Returns:
+        Set[str] -- k-mers forming clumps, as find_clumps() on the whole sequence
+
+    Example:
+    >>> sorted(stream_find_clumps(["CGGACTCGACAGATGTGAAGAACGACAATGTG", "AAGACTCGACACGACAGAGTGAAGAGAAGAGGAAACATTGTAA"], 5, 50, 4))
+    ['CGACA', 'GAAGA']
+
+    """
+    finder = ClumpFinder(k, L, t, backend)
+    for chunk in chunks:
+        finder.update(chunk)
+
+    return finder.clumps
@@ -0,0 +1,51 @@
+import gzip
+from typing import IO, Iterable, Tuple, Union
+
+
+def open_output_file(path: str) -> IO[str]:
+    """Open a sequence file for writing as text, gzip-compressed if path ends in .gz
+
+    Arguments:
+        path {str} -- output path
+
+    Returns:
+        IO[str] -- text file handle
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt")
+
+    return open(path, "w")
+
+
+def _write_wrapped(handle: IO[str], chunks: Iterable[str], line_width: int):
+    """Write a sequence given as consecutive chunks in lines of line_width bases"""
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk
+        n_full = len(buffer) // line_width * line_width
+        if n_full:
+            handle.write("\n".join(buffer[i:i+line_width] for i in range(0, n_full, line_width)) + "\n")
+        carry = buffer[n_full:]
+
+    if carry:
+        handle.write(carry + "\n")
+
+
+def write_fasta(records: Iterable[Tuple[str, Union[str, Iterable[str]]]], path: str, line_width: int = 60):
+    """Stream records to a FASTA file. Records are written as they are produced,
+    and a sequence may be given whole or as an iterable of consecutive chunks.
+
+    Arguments:
+        records {Iterable[Tuple[str, Union[str, Iterable[str]]]]} -- (record id, sequence or chunks) pairs
+        path {str} -- output path, gzip-compressed if it ends in .gz
+
+    Keyword Arguments:
+        line_width {int} -- bases per FASTA line (default: {60})
+    """
+    if line_width < 1:
+        raise ValueError("line_width must be a positive integer")
+
+    with open_output_file(path) as handle:
+        for name, sequence in records:
+            handle.write(f">{name}\n")
+            _write_wrapped(handle, [sequence] if isinstance(sequence, str) else sequence, line_width)
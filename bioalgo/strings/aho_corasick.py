@@ -0,0 +1,165 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from bioalgo.strings.reverse_complement import reverse_complement
+
+
+class AhoCorasick:
+    """Multi-pattern matcher built once from a set of patterns. A single pass over
+    the text reports every occurrence (overlapping included) of every pattern.
+
+    Arguments:
+        patterns {Iterable[str]} -- patterns to search for
+
+    Keyword Arguments:
+        include_reverse_complement {bool} -- also report occurrences of each pattern's
+        reverse complement, attributed to the pattern on the '-' strand (default: {False})
+
+    Example:
+    >>> matcher = AhoCorasick(["ACTAT", "TAT", "GGG"])
+    >>> matcher.count("ACAACTATGCATACTATCGGGAACTATCCT")
+    {'ACTAT': 3, 'TAT': 3, 'GGG': 1}
+    >>> matcher.index("ACAACTATGCATACTATCGGGAACTATCCT")["TAT"]
+    [6, 15, 25]
+    >>> AhoCorasick(["ATAG"], include_reverse_complement=True).index("ATAGCTAT")
+    {'ATAG': [1, 5]}
+
+    """
+
+    def __init__(self, patterns: Iterable[str], include_reverse_complement: bool = False):
+        self.patterns = list(dict.fromkeys(patterns))
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("Patterns must be a non-empty collection of non-empty strings")
+
+        goto = [{}]
+        outputs = [[]]
+
+        def add(word: str, hit: Tuple[int, int, str]):
+            state = 0
+            for symbol in word:
+                if symbol not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][symbol] = len(goto) - 1
+                state = goto[state][symbol]
+            outputs[state].append(hit)
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            add(pattern, (pattern_id, len(pattern), "+"))
+            if include_reverse_complement:
+                rc = reverse_complement(pattern)
+                if rc != pattern:
+                    add(rc, (pattern_id, len(pattern), "-"))
+
+        # breadth-first pass turns the trie into a complete automaton: every missing
+        # transition is resolved through the failure link ahead of search time
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = dict(delta[fail[state]])
+            for symbol, child in goto[state].items():
+                delta[state][symbol] = child
+                fail[child] = delta[fail[state]].get(symbol, 0)
+                queue.append(child)
+            outputs[state] = outputs[state] + outputs[fail[state]]
+
+        self._delta = delta
+        self._outputs = [tuple(hits) for hits in outputs]
+
+    def iter_matches(self, text: str, offset: int = 0) -> Iterator[Tuple[int, str, str]]:
+        """Yield every match in text
+
+        Arguments:
+            text {str} -- text to search
+
+        Keyword Arguments:
+            offset {int} -- number of bases preceding text, added to positions (default: {0})
+
+        Returns:
+            Iterator[Tuple[int, str, str]] -- (1-based position, pattern, strand) in order of match end
+        """
+        return self.iter_matches_chunks([text], offset)
+
+    def iter_matches_chunks(self, chunks: Iterable[str], offset: int = 0) -> Iterator[Tuple[int, str, str]]:
+        """Yield every match in a sequence streamed in chunks. The automaton state
+        is carried across chunk boundaries so no overlap between chunks is needed.
+
+        Arguments:
+            chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+        Keyword Arguments:
+            offset {int} -- number of bases preceding the first chunk, added to positions (default: {0})
+
+        Returns:
+            Iterator[Tuple[int, str, str]] -- (1-based position, pattern, strand) in order of match end
+        """
+        delta, outputs, patterns = self._delta, self._outputs, self.patterns
+        state = 0
+        position = offset + 2  # turns a 0-based match end into a 1-based match start
+        for chunk in chunks:
+            for i, symbol in enumerate(chunk, position):
+                state = delta[state].get(symbol, 0)
+                for pattern_id, length, strand in outputs[state]:
+                    yield i - length, patterns[pattern_id], strand
+            position += len(chunk)
+
+    def _counts(self, matches: Iterator[Tuple[int, str, str]]) -> Dict[str, int]:
+        counts = dict.fromkeys(self.patterns, 0)
+        for _, pattern, _ in matches:
+            counts[pattern] += 1
+        return counts
+
+    def _positions(self, matches: Iterator[Tuple[int, str, str]]) -> Dict[str, List[int]]:
+        positions = {pattern: [] for pattern in self.patterns}
+        for position, pattern, _ in matches:
+            positions[pattern].append(position)
+        for hits in positions.values():
+            hits.sort()
+        return positions
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Count the occurences of every pattern in text, as pattern_count() per pattern
+
+        Arguments:
+            text {str} -- text to search
+
+        Returns:
+            Dict[str, int] -- pattern -> number of occurences
+        """
+        return self._counts(self.iter_matches(text))
+
+    def index(self, text: str) -> Dict[str, List[int]]:
+        """Find the 1-based positions of every pattern in text, as pattern_index() per pattern
+
+        Arguments:
+            text {str} -- text to search
+
+        Returns:
+            Dict[str, List[int]] -- pattern -> sorted positions
+        """
+        return self._positions(self.iter_matches(text))
+
+    def count_chunks(self, chunks: Iterable[str]) -> Dict[str, int]:
+        """Count the occurences of every pattern in a sequence streamed in chunks
+
+        Arguments:
+            chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+        Returns:
+            Dict[str, int] -- pattern -> number of occurences
+        """
+        return self._counts(self.iter_matches_chunks(chunks))
+
+    def index_chunks(self, chunks: Iterable[str]) -> Dict[str, List[int]]:
+        """Find the 1-based positions of every pattern in a sequence streamed in chunks
+
+        Arguments:
+            chunks {Iterable[str]} -- consecutive pieces of one sequence
+
+        Returns:
+            Dict[str, List[int]] -- pattern -> sorted positions
+        """
+        return self._positions(self.iter_matches_chunks(chunks))
@@ -1,3 +1,6 @@
+from bioalgo.strings.dna_packing import pack_dna
+
+
 def compress_dna(text: str) -> int:
     """Compress a DNA string into a bit string
     
@@ -13,19 +16,8 @@ def compress_dna(text: str) -> int:
     
     """
 
-    bit_string = 1
-
-    for nt in text.upper():
-        bit_string <<= 2
-        if nt == "A":
-            bit_string |= 0b00
-        elif nt == "C":
-            bit_string |= 0b01
-        elif nt == "G":
-            bit_string |= 0b10
-        elif nt == "T":
-            bit_string |= 0b11
-        else:
-            raise ValueError(f'Invalid nucleotide: {nt}')
+    packed = pack_dna(text)
+    padding = len(packed) * 4 - len(text)
 
-    return bit_string
\ No newline at end of file
+    # leading 1 is a sentinel that preserves leading 'A's (0b00) in the integer
+    return (1 << 2 * len(text)) | (int.from_bytes(packed, "big") >> 2 * padding)
\ No newline at end of file
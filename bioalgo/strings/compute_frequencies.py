@@ -1,21 +1,36 @@
 from typing import Dict
 
+from bioalgo.strings.kmer_counting import check_backend, kmer_frequencies
 
-def compute_frequencies(text: str, k: int) -> Dict[str, int]:
+
+def compute_frequencies(text: str, k: int, backend: str = "python") -> Dict[str, int]:
     """Return the frequency array (count of each k-mer) in a given text 
     
     Arguments:
         text {str} -- text to seacrh
         k {int} -- k-mer length
     
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" counting backend. The python backend counts
+        substrings verbatim; the numpy backend upper-cases text and skips k-mers
+        containing non-ACGT symbols (default: {"python"})
+    
     Returns:
         Dict[str, int] -- dictionary of k-mers and their count within text
 
     Example:
     >>> compute_frequencies("ACGT", 2)
     {'AC': 1, 'CG': 1, 'GT': 1}
+    >>> compute_frequencies("ACGT", 2, backend="numpy")
+    {'AC': 1, 'CG': 1, 'GT': 1}
+    >>> compute_frequencies("ACNac", 2), compute_frequencies("ACNac", 2, backend="numpy")
+    ({'AC': 1, 'CN': 1, 'Na': 1, 'ac': 1}, {'AC': 2})
     
     """
+    check_backend(backend)
+    if backend == "numpy":
+        return kmer_frequencies(text, k)
+
     frequency_dict = {}
     for i in range(len(text) - k + 1):
         pattern = text[i:i+k]
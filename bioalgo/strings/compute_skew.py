@@ -1,23 +1,19 @@
-def compute_skew(sequence: str) -> List[float]:
+from typing import List
+
+from bioalgo.strings.skew import skew_array
+
+
+def compute_skew(sequence: str) -> List[int]:
     """Find the skew of the given sequence
     
     Arguments:
         sequence {str} -- DNA string
     
     Returns:
-        List[float] -- skew list
-    """
-    running_skew = []
-    skew = 0
+        List[int] -- skew after each base of sequence
 
-    for base in sequence.upper():
-        if base == "G":
-            skew += 1
-        elif base == "C":
-            skew -= 1
-        else:
-            skew += 0
-
-        running_skew.append(skew)
-
-    return running_skew
\ No newline at end of file
+    Example:
+    >>> compute_skew("GGCCA")
+    [1, 2, 1, 0, 0]
+    """
+    return skew_array(sequence).tolist()
\ No newline at end of file
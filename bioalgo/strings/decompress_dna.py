@@ -1,3 +1,6 @@
+from bioalgo.strings.dna_packing import unpack_dna
+
+
 def decompress_dna_bit_string(bit_string: int) -> str:
     """Decompress a bit string representation of DNA into a string representation
     
@@ -12,18 +15,11 @@ def decompress_dna_bit_string(bit_string: int) -> str:
     'ACGT'
     
     """
-    dna_string = ""
-    for i in range(0, bit_string.bit_length() - 1, 2):  # minus 1 excludes '1' sentinel value from compress_DNA
-        bits = bit_string >> i & 0b11
-        if bits == 0b00:
-            dna_string += "A"
-        elif bits == 0b01:
-            dna_string += "C"
-        elif bits == 0b10:
-            dna_string += "G"
-        elif bits == 0b11:
-            dna_string += "T"
-        else:
-            raise ValueError(f"Invalid DNA bit: {bits}")
+    if bit_string < 1:
+        raise ValueError(f"Invalid DNA bit string: {bit_string}")
+
+    length = (bit_string.bit_length() - 1) // 2  # minus 1 excludes '1' sentinel value from compress_DNA
+    padding = -length % 4
+    value = (bit_string ^ (1 << 2 * length)) << 2 * padding
 
-    return dna_string[::-1]
\ No newline at end of file
+    return unpack_dna(value.to_bytes((length + padding) // 4, "big"), length)
\ No newline at end of file
@@ -0,0 +1,105 @@
+from typing import Union
+
+import numpy as np
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_PACK_CODES = np.full(256, 255, dtype=np.uint8)
+for _code, _base in enumerate("ACGT"):
+    _PACK_CODES[ord(_base)] = _code
+    _PACK_CODES[ord(_base.lower())] = _code
+_UNPACK_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+def pack_codes(codes: np.ndarray) -> bytes:
+    """Pack an array of 2-bit codes (0-3) four bases to a byte, first base in
+    the most significant bits and the last byte padded with zero bits
+
+    Arguments:
+        codes {np.ndarray} -- uint8 array of values 0 to 3
+
+    Returns:
+        bytes -- packed bases, (len(codes) + 3) // 4 bytes long
+    """
+    codes = np.asarray(codes, dtype=np.uint8)
+    padded = np.zeros((len(codes) + 3) // 4 * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+
+    return ((quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]).tobytes()
+
+
+def pack_dna(text: Union[str, BytesLike]) -> bytes:
+    """Pack a DNA string into 2 bits per base
+
+    Arguments:
+        text {Union[str, BytesLike]} -- DNA string of A, C, G and T (any case)
+
+    Returns:
+        bytes -- packed bases
+
+    Example:
+    >>> pack_dna("ACGTA")
+    b'\\x1b\\x00'
+
+    """
+    if isinstance(text, str):
+        text = text.encode("ascii")
+
+    codes = _PACK_CODES[np.frombuffer(text, dtype=np.uint8)]
+    invalid = np.flatnonzero(codes == 255)
+    if invalid.size:
+        raise ValueError(f"Invalid nucleotide: {chr(text[invalid[0]])}")
+
+    return pack_codes(codes)
+
+
+def unpack_codes(data: BytesLike, length: int, start: int = 0) -> np.ndarray:
+    """Unpack length 2-bit codes beginning at base offset start of packed data.
+    Only the bytes covering the requested bases are read.
+
+    Arguments:
+        data {BytesLike} -- packed bases
+        length {int} -- number of bases to unpack
+
+    Keyword Arguments:
+        start {int} -- offset of the first base to unpack (default: {0})
+
+    Returns:
+        np.ndarray -- uint8 codes
+    """
+    first_byte = start // 4
+    last_byte = (start + length + 3) // 4
+    window = np.frombuffer(data, dtype=np.uint8, count=last_byte - first_byte, offset=first_byte)
+    codes = ((window[:, None] >> _SHIFTS) & 0b11).ravel()
+    skip = start - first_byte * 4
+
+    return codes[skip:skip+length]
+
+
+def unpack_dna(data: BytesLike, length: int, start: int = 0) -> str:
+    """Unpack length bases beginning at base offset start of packed data
+
+    Arguments:
+        data {BytesLike} -- packed bases
+        length {int} -- number of bases to unpack
+
+    Keyword Arguments:
+        start {int} -- offset of the first base to unpack (default: {0})
+
+    Returns:
+        str -- DNA string
+
+    Example:
+    >>> unpack_dna(b'\\x1b\\x00', 5)
+    'ACGTA'
+    >>> unpack_dna(b'\\x1b\\x00', 3, start=1)
+    'CGT'
+
+    """
+    if length <= 0:
+        return ""
+
+    return _UNPACK_BASES[unpack_codes(data, length, start)].tobytes().decode("ascii")
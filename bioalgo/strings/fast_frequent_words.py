@@ -1,7 +1,10 @@
-from itertools import product
+from typing import Set
 
+from bioalgo.strings.kmer_codec import decode_kmer, rolling_kmer_codes
+from bioalgo.strings.kmer_counting import check_backend, most_frequent_kmers
 
-def fast_frequent_words(text: str, k: int) -> Set[str]:
+
+def fast_frequent_words(text: str, k: int, backend: str = "python") -> Set[str]:
     """Find the most frequent kmers of size k in the given text looping
     through text only once.
     
@@ -9,26 +12,39 @@ def fast_frequent_words(text: str, k: int) -> Set[str]:
         text {str} -- text to search
         k {int} -- k-mer size
     
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" counting backend. Both read text in any case;
+        the python backend rejects non-ACGT symbols, while the numpy backend skips the
+        k-mers containing them and returns an empty set for text shorter than k (default: {"python"})
+    
     Returns:
         Set[str] -- most frequent k-mers in text
 
     Example:
     >>> fast_frequent_words("ACAACTATGCATACTATCGGGAACTATCCT", 5)
     {'ACTAT'}
+    >>> sorted(fast_frequent_words("ACGNacg", 2, backend="numpy"))
+    ['AC', 'CG']
+    >>> fast_frequent_words("ACGNacg", 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid nucleotide: N
     
     """
+    check_backend(backend)
+    if backend == "numpy":
+        return most_frequent_kmers(text, k)
+
     frequent_patterns = set()
-    kmers = list(product("ACGT", repeat=k))
-    freq_dict = {"".join(m):0 for m in kmers}
+    frequency_array = [0] * 4 ** k  # indexed by k-mer code
 
-    for i in range(len(text) - k + 1):
-        pattern = text[i:i+k]
-        freq_dict[pattern] += 1
+    for code in rolling_kmer_codes(text, k):
+        frequency_array[code] += 1
 
-    max_count = max(freq_dict.values())
+    max_count = max(frequency_array)
 
-    for k in freq_dict:
-        if freq_dict[k] == max_count:
-            frequent_patterns.add(k)
+    for code, count in enumerate(frequency_array):
+        if count == max_count:
+            frequent_patterns.add(decode_kmer(code, k))
 
     return frequent_patterns
\ No newline at end of file
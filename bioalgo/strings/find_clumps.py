@@ -0,0 +1,161 @@
+from collections import defaultdict, deque
+from typing import Set, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import _ENCODE, decode_kmers
+from bioalgo.strings.kmer_counting import BINCOUNT_MAX_K, check_backend, kmer_code_array, sequence_to_codes
+
+
+class ClumpFinder:
+    """Incremental (L, t)-clump finder. A k-mer forms a clump when it occurs at
+    least t times inside some window of length L. Sequence is fed in chunks and
+    the window state carries over from one chunk to the next, so feeding a
+    sequence piecewise gives the same clumps as feeding it whole.
+
+    The "python" backend slides the window one base at a time, adding the
+    entering k-mer to a 4^k count array and removing the leaving one. The
+    "numpy" backend sorts each chunk's k-mer positions by code and checks, for
+    every occurrence, whether the (t-1)-th next occurrence of the same k-mer is
+    at most L - k bases further on. Windows containing non-ACGT symbols are skipped.
+
+    Arguments:
+        k {int} -- k-mer length
+        L {int} -- window length
+        t {int} -- minimum number of occurences inside a window
+
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" (default: {"python"})
+
+    Example:
+    >>> finder = ClumpFinder(5, 50, 4)
+    >>> finder.update("CGGACTCGACAGATGTGAAGAACGACAATGTGAAGACTCGACACGACAGAGTGAAGAGAAGAGGAAACATTGTAA")
+    >>> sorted(finder.clumps)
+    ['CGACA', 'GAAGA']
+
+    """
+
+    def __init__(self, k: int, L: int, t: int, backend: str = "python"):
+        check_backend(backend)
+        if not 1 <= k <= L:
+            raise ValueError("k must be between 1 and L")
+        if t < 1:
+            raise ValueError("t must be a positive integer")
+
+        self.k = k
+        self.L = L
+        self.t = t
+        self.backend = backend
+        self.length = 0
+        self._slots = L - k + 1  # k-mers in a window
+        self._found = set()
+
+        # python backend: rolling code, run of valid bases and the k-mers in the window
+        self._code = 0
+        self._run = 0
+        self._window = deque()
+        self._counts = [0] * 4 ** k if k <= BINCOUNT_MAX_K else defaultdict(int)
+
+        # numpy backend: last k - 1 bases and last L - k k-mers of the previous chunk
+        self._bases = np.zeros(0, dtype=np.uint8)
+        self._tail_codes = np.zeros(0, dtype=np.uint64)
+        self._tail_valid = np.zeros(0, dtype=bool)
+
+    @property
+    def clumps(self) -> Set[str]:
+        """K-mers forming a clump in the sequence fed so far"""
+        if self.length < self.L:
+            return set()
+
+        return set(decode_kmers(sorted(self._found), self.k))
+
+    def update(self, chunk: Union[str, bytes]) -> None:
+        """Feed the next piece of sequence
+
+        Arguments:
+            chunk {Union[str, bytes]} -- next piece of the sequence
+        """
+        if self.backend == "numpy":
+            self._update_numpy(chunk)
+        else:
+            self._update_python(chunk)
+        self.length += len(chunk)
+
+    def _update_python(self, chunk: Union[str, bytes]) -> None:
+        k, t, slots = self.k, self.t, self._slots
+        mask = (1 << (2 * k)) - 1
+        code, run = self._code, self._run
+        window, counts, found = self._window, self._counts, self._found
+
+        for byte in chunk.encode("ascii") if isinstance(chunk, str) else chunk:
+            value = _ENCODE[byte]
+            if value < 0:
+                run = 0
+                value = 0
+            else:
+                run += 1
+            code = ((code << 2) | value) & mask
+
+            if len(window) == slots:
+                leaving = window.popleft()
+                if leaving is not None:
+                    counts[leaving] -= 1
+
+            if run >= k:
+                window.append(code)
+                counts[code] += 1
+                if counts[code] >= t:
+                    found.add(code)
+            else:
+                window.append(None)
+
+        self._code, self._run = code, min(run, k)
+
+    def _update_numpy(self, chunk: Union[str, bytes]) -> None:
+        k, t = self.k, self.t
+        seq = np.concatenate((self._bases, sequence_to_codes(chunk)))
+        new_codes, new_valid = kmer_code_array(seq, k)
+
+        all_codes = np.concatenate((self._tail_codes, new_codes))
+        all_valid = np.concatenate((self._tail_valid, new_valid))
+        positions = np.flatnonzero(all_valid)
+        order = np.argsort(all_codes[positions], kind="stable")
+        codes, positions = all_codes[positions][order], positions[order]
+
+        # occurrence i and occurrence i + t - 1 of the same k-mer fit inside one window
+        n = len(codes) - t + 1
+        if n > 0:
+            hits = (codes[:n] == codes[t-1:]) & (positions[t-1:] - positions[:n] < self._slots)
+            self._found.update(np.unique(codes[:n][hits]).tolist())
+
+        # a window reaching into the next chunk shares at most L - k k-mers with this one
+        tail = max(len(all_codes) - (self._slots - 1), 0)
+        self._tail_codes, self._tail_valid = all_codes[tail:], all_valid[tail:]
+        self._bases = seq[max(len(seq) - (k - 1), 0):]
+
+
+def find_clumps(text: Union[str, bytes], k: int, L: int, t: int, backend: str = "python") -> Set[str]:
+    """Find the k-mers forming (L, t)-clumps in text, that is the k-mers occurring
+    at least t times in some window of length L, in a single pass over text
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+        L {int} -- window length
+        t {int} -- minimum number of occurences inside a window
+
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" (default: {"python"})
+
+    Returns:
+        Set[str] -- k-mers forming clumps
+
+    Example:
+    >>> sorted(find_clumps("CGGACTCGACAGATGTGAAGAACGACAATGTGAAGACTCGACACGACAGAGTGAAGAGAAGAGGAAACATTGTAA", 5, 50, 4))
+    ['CGACA', 'GAAGA']
+
+    """
+    finder = ClumpFinder(k, L, t, backend)
+    finder.update(text)
+
+    return finder.clumps
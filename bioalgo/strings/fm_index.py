@@ -0,0 +1,176 @@
+import json
+import os
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.suffix_array import suffix_array
+
+
+_ARRAYS = ("bwt", "first_occurrence", "checkpoints", "sampled_rows", "sampled_positions")
+
+
+class FMIndex:
+    """Burrows-Wheeler / FM-index of a fixed reference text. Count queries run in
+    O(m) and each located occurrence costs at most sa_sample LF-mapping steps.
+
+    Arguments:
+        text {Union[str, bytes]} -- reference text without NUL characters
+
+    Keyword Arguments:
+        sa_sample {int} -- keep the suffix array entry of every sa_sample-th text position (default: {32})
+        occ_sample {int} -- store symbol counts every occ_sample rows of the BWT (default: {128})
+
+    Example:
+    >>> index = FMIndex("ACAACTATGCATACTATCGGGAACTATCCT")
+    >>> index.count("ACTAT")
+    3
+    >>> index.locate("TAT")
+    [6, 15, 25]
+
+    """
+
+    def __init__(self, text: Union[str, bytes] = None, sa_sample: int = 32, occ_sample: int = 128):
+        if text is None:  # empty shell filled in by load()
+            return
+
+        if isinstance(text, str):
+            text = text.encode("ascii")
+        if sa_sample < 1 or occ_sample < 1:
+            raise ValueError("Sampling rates must be positive integers")
+
+        sa = suffix_array(text)
+        raw = np.frombuffer(text, dtype=np.uint8)
+
+        # compact alphabet: sentinel is 0, the distinct text symbols 1..sigma in byte order
+        self.alphabet = bytes(np.unique(raw).tolist())
+        self.sa_sample = sa_sample
+        self.occ_sample = occ_sample
+        codes = np.zeros(256, dtype=np.uint8)
+        codes[np.frombuffer(self.alphabet, dtype=np.uint8)] = np.arange(1, len(self.alphabet) + 1)
+        self._codes = codes
+
+        symbols = np.zeros(len(raw) + 1, dtype=np.uint8)
+        symbols[:-1] = codes[raw]
+        self.bwt = symbols[sa - 1]  # sa - 1 wraps to the sentinel for the suffix at 0
+
+        counts = np.bincount(symbols, minlength=len(self.alphabet) + 1)
+        self.first_occurrence = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+
+        # checkpoints[b, c] counts symbol c in bwt[:b * occ_sample]
+        n_blocks = len(self.bwt) // occ_sample
+        blocks = self.bwt[:n_blocks * occ_sample].reshape(n_blocks, occ_sample)
+        self.checkpoints = np.zeros((n_blocks + 1, len(self.alphabet) + 1), dtype=np.int64)
+        for symbol in range(len(self.alphabet) + 1):
+            np.cumsum(np.count_nonzero(blocks == symbol, axis=1), out=self.checkpoints[1:, symbol])
+
+        sampled = np.flatnonzero(sa % sa_sample == 0)
+        self.sampled_rows = sampled.astype(np.int64)
+        self.sampled_positions = sa[sampled].astype(np.int64)
+
+    def __len__(self) -> int:
+        """Length of the indexed text, excluding the sentinel"""
+        return len(self.bwt) - 1
+
+    def _occ(self, symbol: int, row: int) -> int:
+        """Number of occurences of symbol in bwt[:row]"""
+        block = row // self.occ_sample
+        start = block * self.occ_sample
+        return int(self.checkpoints[block, symbol]) + int(np.count_nonzero(self.bwt[start:row] == symbol))
+
+    def _lf(self, row: int) -> int:
+        symbol = int(self.bwt[row])
+        return int(self.first_occurrence[symbol]) + self._occ(symbol, row)
+
+    def _range(self, pattern: Union[str, bytes]) -> Tuple[int, int]:
+        """Backward search: the half-open range of BWT rows prefixed by pattern"""
+        if isinstance(pattern, str):
+            pattern = pattern.encode("ascii")
+
+        top, bottom = 0, len(self.bwt)
+        for byte in reversed(pattern):
+            symbol = int(self._codes[byte])
+            if not symbol:
+                return 0, 0
+            top = int(self.first_occurrence[symbol]) + self._occ(symbol, top)
+            bottom = int(self.first_occurrence[symbol]) + self._occ(symbol, bottom)
+            if top >= bottom:
+                return 0, 0
+
+        return top, bottom
+
+    def count(self, pattern: Union[str, bytes]) -> int:
+        """Count the occurences of pattern in the indexed text
+
+        Arguments:
+            pattern {Union[str, bytes]} -- pattern to count
+
+        Returns:
+            int -- number of occurences, as pattern_count() on the text
+        """
+        top, bottom = self._range(pattern)
+
+        return bottom - top
+
+    def locate(self, pattern: Union[str, bytes]) -> List[int]:
+        """Return the 1-based positions of pattern in the indexed text
+
+        Arguments:
+            pattern {Union[str, bytes]} -- pattern to search for
+
+        Returns:
+            List[int] -- sorted positions, as pattern_index() on the text
+        """
+        top, bottom = self._range(pattern)
+        positions = []
+        for row in range(top, bottom):
+            steps = 0
+            sample = np.searchsorted(self.sampled_rows, row)
+            while sample == len(self.sampled_rows) or self.sampled_rows[sample] != row:
+                row = self._lf(row)
+                steps += 1
+                sample = np.searchsorted(self.sampled_rows, row)
+            positions.append(int(self.sampled_positions[sample]) + steps + 1)
+
+        return sorted(positions)
+
+    def save(self, directory: str):
+        """Write the index to a directory of .npy arrays plus a small JSON header
+
+        Arguments:
+            directory {str} -- output directory, created if missing
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+
+        meta = {"alphabet": list(self.alphabet), "sa_sample": self.sa_sample, "occ_sample": self.occ_sample}
+        with open(os.path.join(directory, "meta.json"), "w") as handle:
+            json.dump(meta, handle)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "FMIndex":
+        """Load an index written by save(), memory-mapping its arrays by default
+
+        Arguments:
+            directory {str} -- directory written by save()
+
+        Keyword Arguments:
+            mmap {bool} -- memory-map the arrays instead of reading them (default: {True})
+
+        Returns:
+            FMIndex -- the loaded index
+        """
+        with open(os.path.join(directory, "meta.json")) as handle:
+            meta = json.load(handle)
+
+        index = cls()
+        index.alphabet = bytes(meta["alphabet"])
+        index.sa_sample = meta["sa_sample"]
+        index.occ_sample = meta["occ_sample"]
+        index._codes = np.zeros(256, dtype=np.uint8)
+        index._codes[list(index.alphabet)] = np.arange(1, len(index.alphabet) + 1)
+        for name in _ARRAYS:
+            setattr(index, name, np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r" if mmap else None))
+
+        return index
@@ -1,23 +1,36 @@
 from typing import Set
 
+from bioalgo.strings.kmer_counting import check_backend, most_frequent_kmers
 from bioalgo.strings.pattern_count import pattern_count
 
 
-def frequent_words(text: str, k: int) -> Set[str]:
+def frequent_words(text: str, k: int, backend: str = "python") -> Set[str]:
     """Find the most frequent kmers of size k in the given text
     
     Arguments:
         text {str} -- text to find k-mer in
         k {int} -- size of k-mer
     
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" counting backend. The python backend counts
+        substrings verbatim and needs len(text) >= k; the numpy backend upper-cases text,
+        skips k-mers containing non-ACGT symbols and returns an empty set for text shorter
+        than k (default: {"python"})
+    
     Returns:
         Set[str] -- Set of most frequent k-mers found in text
     
     Example:
     >>> frequent_words("ACAACTATGCATACTATCGGGAACTATCCT", 5)
     {'ACTAT'}
+    >>> sorted(frequent_words("acgtACGT", 2)), sorted(frequent_words("acgtACGT", 2, backend="numpy"))
+    (['AC', 'CG', 'GT', 'ac', 'cg', 'gt', 'tA'], ['AC', 'CG', 'GT'])
     
     """
+    check_backend(backend)
+    if backend == "numpy":
+        return most_frequent_kmers(text, k)
+
     frequent_patterns = set()
     counts = []
 
@@ -1,11 +1,16 @@
 from typing import List
 from collections import Counter
+from itertools import chain
 
-from bioalgo.strings.neighbors import neighbors
-from bioalgo.strings.pattern_to_number import pattern_to_number
+from bioalgo.strings.kmer_codec import decode_kmer, rolling_kmer_codes
+from bioalgo.strings.kmer_counting import check_backend
+from bioalgo.strings.mismatch_counting import most_frequent_with_mismatches
+from bioalgo.strings.neighborhood import NeighborhoodCache
+from bioalgo.strings.reverse_complement import reverse_complement
 
 
-def frequent_words_with_mismatches(text: str, k: int, d: int) -> List[str]:
+def frequent_words_with_mismatches(text: str, k: int, d: int, cache: NeighborhoodCache = None,
+                                   backend: str = "python", include_reverse: bool = False) -> List[str]:
     """Find the most frequent words in a given text allowing mismatches.
 
     Arguments:
@@ -13,26 +18,45 @@ def frequent_words_with_mismatches(text: str, k: int, d: int) -> List[str]:
         k {int} -- kmer size
         d {int} -- number of mismatches
 
+    Keyword Arguments:
+        cache {NeighborhoodCache} -- neighborhood cache, shared across calls if given (default: {None})
+        backend {str} -- "python" or "numpy", which aggregates neighborhoods of distinct k-mers
+        in code space. Both read text in any case; the python backend rejects non-ACGT
+        symbols and needs len(text) >= k, while the numpy backend skips the k-mers
+        containing them and returns an empty list for text shorter than k (default: {"python"})
+        include_reverse {bool} -- also count approximate occurences of reverse complements (default: {False})
+
     Returns:
         List[str] -- list of k-mers that occur the maximum number of times
     
     Example:
     >>> frequent_words_with_mismatches("ACAACTATGCATACTATCGGGAACTATCCT", 5, 0)
     ['ACTAT']
+    >>> sorted(frequent_words_with_mismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1, include_reverse=True))
+    ['ACAT', 'ATGT']
+    >>> frequent_words_with_mismatches("", 4, 1, backend="numpy")
+    []
     """
-    neighborhoods = []
-    for i in range(len(text) - k + 1):
-        neighborhoods.append(neighbors(text[i:i+k], d))
+    check_backend(backend)
+    if backend == "numpy":
+        return most_frequent_with_mismatches(text, k, d, include_reverse)
+
+    if cache is None:
+        cache = NeighborhoodCache()
 
-    # form a single list holding all strings in neighborhoods
-    neighborhood_array = [neighbor for neighborhood in neighborhoods for neighbor in neighborhood]
+    # repeated k-mers reuse their cached neighborhood instead of regenerating it
+    occurences = Counter()
+    codes = rolling_kmer_codes(text, k)
+    if include_reverse:
+        codes = chain(codes, rolling_kmer_codes(reverse_complement(text), k))
 
-    occurences = Counter(neighborhood_array)
+    for code in codes:
+        occurences.update(cache.get(code, k, d))
 
     # return the max number of occurences -- could be more than one key with this value
     max_occurences = occurences[max(occurences, key=occurences.get)]
 
     # return all of the top occurences
-    frequent_words = [k for k, v in occurences.items() if v == max_occurences]
+    frequent_words = [decode_kmer(code, k) for code, v in occurences.items() if v == max_occurences]
 
     return frequent_words
\ No newline at end of file
@@ -1,3 +1,8 @@
+from operator import ne
+
+from bioalgo.strings.hamming_kernel import PACKED_MIN_LENGTH, bit_hamming_distance
+
+
 def hamming_distance(str_1: str, str_2: str) -> int:
     """Return the hamming distance between two strings of equal length
     
@@ -15,10 +20,7 @@ def hamming_distance(str_1: str, str_2: str) -> int:
     """
     if len(str_1) != len(str_2):
         raise ValueError("Strings must be the same length")
+    if len(str_1) < PACKED_MIN_LENGTH:
+        return sum(map(ne, str_1, str_2))
 
-    count = 0
-    for i in range(len(str_1)):
-        if str_1[i] != str_2[i]:
-            count += 1
-        
-    return count
\ No newline at end of file
+    return bit_hamming_distance(str_1, str_2)
\ No newline at end of file
@@ -0,0 +1,228 @@
+from functools import lru_cache
+from operator import ne
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+_DIGITS = str.maketrans("ACGT", "0123")
+_WORD_BASES = 32  # 2-bit bases per uint64 word
+PACKED_MIN_LENGTH = 64  # below this, a character comparison beats translating and parsing
+_LOW_BITS = np.uint64(0x5555555555555555)
+_CODES = np.full(256, 255, dtype=np.uint8)
+for _code, _base in enumerate("ACGT"):
+    _CODES[ord(_base)] = _code
+_BLOCK_BYTES = 1 << 26  # cap on temporaries built by the all-vs-all kernel
+
+
+def _packable(text: str) -> bool:
+    # isalpha rules out digits, signs, '_' and whitespace, which int(..., 4) would accept
+    return text.isascii() and text.isalpha()
+
+
+@lru_cache(maxsize=None)
+def _low_bits(k: int) -> int:
+    """Mask with the low bit of each of the k 2-bit bases set"""
+    return int("1" * k, 4)
+
+
+def packed_hamming(code_1: int, code_2: int, k: int) -> int:
+    """Hamming distance between two 2-bit packed k-mer codes: XOR the codes, fold
+    each base's two bits onto the low one and count the set bits
+
+    Arguments:
+        code_1 {int} -- packed k-mer, e.g. from encode_kmer
+        code_2 {int} -- packed k-mer of the same length
+        k {int} -- k-mer length
+
+    Returns:
+        int -- number of mismatching bases
+
+    Example:
+    >>> packed_hamming(0b00011011, 0b00011110, 4)
+    2
+
+    """
+    diff = code_1 ^ code_2
+
+    return ((diff | diff >> 1) & _low_bits(k)).bit_count()
+
+
+def bit_hamming_distance(str_1: str, str_2: str) -> int:
+    """Bit-parallel Hamming distance. Upper-case DNA strings of at least
+    PACKED_MIN_LENGTH bases are packed two bits per base into Python integers
+    and compared with one XOR and popcount; shorter strings, where translating
+    and parsing costs more than it saves, and any other strings use a
+    character comparison, so the result always equals hamming_distance().
+
+    Arguments:
+        str_1 {str} -- first string
+        str_2 {str} -- second string
+
+    Returns:
+        int -- hamming distance
+
+    Example:
+    >>> bit_hamming_distance("ATATACATACGCGCGC", "ATATATATGCGCGCGC")
+    2
+    >>> bit_hamming_distance("kitten", "sitten")
+    1
+
+    """
+    if len(str_1) != len(str_2):
+        raise ValueError("Strings must be the same length")
+    if len(str_1) < PACKED_MIN_LENGTH:
+        return sum(map(ne, str_1, str_2))
+
+    if _packable(str_1) and _packable(str_2):
+        try:
+            code_1 = int(str_1.translate(_DIGITS), 4)
+            code_2 = int(str_2.translate(_DIGITS), 4)
+        except ValueError:
+            pass
+        else:
+            return packed_hamming(code_1, code_2, len(str_1))
+
+    return sum(map(ne, str_1, str_2))
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+
+    as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=np.uint8)
+
+
+def pack_words(strings: Sequence[str]) -> Tuple[np.ndarray, bool]:
+    """Pack equal-length strings for the batch kernels. Upper-case DNA is packed 32
+    bases per uint64 word; anything else is kept one byte per symbol.
+
+    Arguments:
+        strings {Sequence[str]} -- strings of equal length
+
+    Returns:
+        Tuple[np.ndarray, bool] -- (n, words) array and whether it is 2-bit packed
+    """
+    if not strings:
+        return np.zeros((0, 0), dtype=np.uint64), True
+
+    length = len(strings[0])
+    if not all(len(s) == length for s in strings):
+        raise ValueError("Strings must be the same length")
+
+    try:
+        raw = np.frombuffer("".join(strings).encode("ascii"), dtype=np.uint8).reshape(len(strings), length)
+    except UnicodeEncodeError:
+        raise ValueError("Batch Hamming distances require ASCII strings")
+
+    codes = _CODES[raw]
+    if (codes == 255).any():
+        return raw, False
+
+    n_words = -(-length // _WORD_BASES)
+    padded = np.zeros((len(strings), n_words * _WORD_BASES), dtype=np.uint64)
+    padded[:, :length] = codes
+    shifts = np.arange(2 * (_WORD_BASES - 1), -1, -2, dtype=np.uint64)
+    words = np.bitwise_or.reduce(padded.reshape(len(strings), n_words, _WORD_BASES) << shifts, axis=2)
+
+    return words, True
+
+
+def _mismatches(a: np.ndarray, b: np.ndarray, packed: bool) -> np.ndarray:
+    """Per-word mismatch counts of broadcast-compatible word arrays"""
+    if not packed:
+        return (a != b).astype(np.int64)
+
+    diff = a ^ b
+    return _popcount((diff | (diff >> np.uint64(1))) & _LOW_BITS).astype(np.int64)
+
+
+def hamming_one_vs_many(query: str, targets: Sequence[str]) -> np.ndarray:
+    """Hamming distance from query to each of many strings of the same length
+
+    Arguments:
+        query {str} -- query string
+        targets {Sequence[str]} -- strings to compare against
+
+    Returns:
+        np.ndarray -- distances, as hamming_distance(query, target) for each target
+
+    Example:
+    >>> hamming_one_vs_many("ACGT", ["ACGT", "ACCA", "TGCA"]).tolist()
+    [0, 2, 4]
+
+    """
+    if not targets:
+        return np.zeros(0, dtype=np.int64)
+
+    words, packed = pack_words([query] + list(targets))
+
+    return _mismatches(words[1:], words[0], packed).sum(axis=1)
+
+
+def hamming_exceeds(query: str, targets: Sequence[str], d: int) -> np.ndarray:
+    """Flag the targets whose Hamming distance from query is greater than d. Words
+    are compared left to right and targets are dropped as soon as they exceed d.
+
+    Arguments:
+        query {str} -- query string
+        targets {Sequence[str]} -- strings to compare against
+        d {int} -- distance threshold
+
+    Returns:
+        np.ndarray -- boolean array, True where the distance is greater than d
+
+    Example:
+    >>> hamming_exceeds("ACGT", ["ACGT", "ACCA", "TGCA"], 2).tolist()
+    [False, False, True]
+
+    """
+    exceeds = np.zeros(len(targets), dtype=bool)
+    if not targets:
+        return exceeds
+
+    words, packed = pack_words([query] + list(targets))
+    query_words, words = words[0], words[1:]
+    active = np.arange(len(targets))
+    distance = np.zeros(len(targets), dtype=np.int64)
+
+    for column in range(words.shape[1]):
+        distance += _mismatches(words[active, column], query_words[column], packed)
+        over = distance > d
+        exceeds[active[over]] = True
+        active, distance = active[~over], distance[~over]
+        if not active.size:
+            break
+
+    return exceeds
+
+
+def hamming_all_vs_all(strings: Sequence[str]) -> np.ndarray:
+    """Pairwise Hamming distance matrix of equal-length strings, computed in row
+    blocks so temporaries stay bounded
+
+    Arguments:
+        strings {Sequence[str]} -- strings of equal length
+
+    Returns:
+        np.ndarray -- symmetric (n, n) int32 distance matrix
+
+    Example:
+    >>> hamming_all_vs_all(["ACGT", "ACCA", "TGCA"]).tolist()
+    [[0, 2, 4], [2, 0, 2], [4, 2, 0]]
+
+    """
+    words, packed = pack_words(list(strings))
+    n = len(words)
+    distances = np.zeros((n, n), dtype=np.int32)
+    if not n:
+        return distances
+
+    block = max(1, _BLOCK_BYTES // max(1, n * words.shape[1] * 8))
+    for start in range(0, n, block):
+        rows = words[start:start+block]
+        distances[start:start+block] = _mismatches(rows[:, None, :], words[None, :, :], packed).sum(axis=2)
+
+    return distances
+
@@ -1,17 +1,32 @@
+import random
 from typing import List
 
+import numpy as np
 
-def insert_kmer(text: List[str], kmer: str, mutations: int = 0) -> List[str]:
+from bioalgo.strings.simulate import codes_to_strings, plant_motif, strings_to_codes
+
+
+def insert_kmer(text: List[str], kmer: str, mutations: int = 0, rng: np.random.Generator = None) -> List[str]:
     """Randomly insert the given kmer with n mutations into each string in the list of DNA strings. 
-    Preserve the length of the original text. 
+    Preserve the length of the original text. Each string receives its own
+    independently mutated copy of the kmer.
     
     Arguments:
         text {List[str]} -- List of DNA strings to add kmers into
         kmer {str} -- kmer to insert into string
         mutations {int} -- number of random mutations in kmer (default: {0})
+
+    Keyword Arguments:
+        rng {np.random.Generator} -- random number generator, None to seed one from the random module (default: {None})
     
     Returns:
         List[str] -- List of DNA strings with randomly inserted kmers
+
+    Example:
+    >>> inserted = insert_kmer(["AAAAAAAAAA", "CCCCCCCCCC"], "GGG", rng=np.random.default_rng(1))
+    >>> all("GGG" in s for s in inserted)
+    True
+
     """
     if len(kmer) >= len(text[0]):
         raise ValueError(f"{kmer} is longer than or equivalent in length to DNA strings")
@@ -25,11 +40,8 @@ def insert_kmer(text: List[str], kmer: str, mutations: int = 0) -> List[str]:
     if not all(len(l) == lens for l in it):
         raise ValueError('Not DNA strings have same length!')
 
-    mutated_strings = []
-    for t in text:
-        start_index = random.randint(0, len(t) - len(kmer))
-        kmer = mutate(kmer, mutations)
-        new_string = t[:start_index] + kmer + t[start_index + len(kmer):]
-        mutated_strings.append(new_string)
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
 
-    return mutated_strings
\ No newline at end of file
+    planted, _ = plant_motif(strings_to_codes(text), kmer, mutations, rng)
+    return codes_to_strings(planted)
@@ -0,0 +1,171 @@
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+
+BASES = "ACGT"
+
+# byte value -> 2-bit code, -1 for anything that is not a nucleotide
+_ENCODE = [-1] * 256
+for _code, _base in enumerate(BASES):
+    _ENCODE[ord(_base)] = _code
+    _ENCODE[ord(_base.lower())] = _code
+_ENCODE_ARRAY = np.array(_ENCODE, dtype=np.int8)
+
+# 8-bit code -> 4-mer, so that decoding consumes four bases per lookup
+_DECODE_4MER = ["".join(BASES[(byte >> shift) & 0b11] for shift in (6, 4, 2, 0)) for byte in range(256)]
+_DECODE_ARRAY = np.frombuffer(BASES.encode("ascii"), dtype=np.uint8)
+
+MAX_K = 32  # largest k whose code fits in a uint64
+
+
+def encode_kmer(pattern: str) -> int:
+    """Encode a k-mer as an integer, two bits per base (A=0, C=1, G=2, T=3)
+
+    Arguments:
+        pattern {str} -- DNA string to encode
+
+    Returns:
+        int -- integer code of pattern
+
+    Example:
+    >>> encode_kmer("AGT")
+    11
+    >>> encode_kmer("gcggtaa")
+    9904
+
+    """
+    code = 0
+    for byte in pattern.encode("ascii"):
+        value = _ENCODE[byte]
+        if value < 0:
+            raise ValueError(f"Invalid nucleotide: {chr(byte)}")
+        code = (code << 2) | value
+
+    return code
+
+
+def decode_kmer(code: int, k: int) -> str:
+    """Decode an integer code back into its k-mer, four bases per table lookup
+
+    Arguments:
+        code {int} -- integer code of a k-mer
+        k {int} -- k-mer length
+
+    Returns:
+        str -- decoded k-mer
+
+    Example:
+    >>> decode_kmer(11, 3)
+    'AGT'
+    >>> decode_kmer(9904, 7)
+    'GCGGTAA'
+
+    """
+    if code < 0 or code >> (2 * k):
+        raise ValueError(f"Code {code} out of range for k={k}")
+
+    chunks = []
+    for _ in range(k // 4):
+        chunks.append(_DECODE_4MER[code & 0xFF])
+        code >>= 8
+
+    remainder = k % 4
+    if remainder:
+        chunks.append(_DECODE_4MER[code & 0xFF][4 - remainder:])
+
+    return "".join(reversed(chunks))
+
+
+def rolling_kmer_codes(text: str, k: int) -> Iterator[int]:
+    """Yield the code of every k-mer in text in O(n) by shifting the
+    previous code and masking off the base that left the window
+
+    Arguments:
+        text {str} -- DNA string
+        k {int} -- k-mer length
+
+    Returns:
+        Iterator[int] -- k-mer codes in order of position
+
+    Example:
+    >>> list(rolling_kmer_codes("ACGTA", 3))
+    [6, 27, 44]
+
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer")
+
+    mask = (1 << (2 * k)) - 1
+    code = 0
+    for i, byte in enumerate(text.encode("ascii")):
+        value = _ENCODE[byte]
+        if value < 0:
+            raise ValueError(f"Invalid nucleotide: {chr(byte)}")
+        code = ((code << 2) | value) & mask
+        if i >= k - 1:
+            yield code
+
+
+def encode_kmers(patterns: Iterable[str]) -> np.ndarray:
+    """Encode a batch of equal-length k-mers into an array of codes
+
+    Arguments:
+        patterns {Iterable[str]} -- k-mers of the same length (k <= 32)
+
+    Returns:
+        np.ndarray -- uint64 array of codes
+
+    Example:
+    >>> encode_kmers(["AGT", "TTT", "ACG"]).tolist()
+    [11, 63, 6]
+
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return np.zeros(0, dtype=np.uint64)
+
+    k = len(patterns[0])
+    if k > MAX_K:
+        raise ValueError(f"k must be at most {MAX_K} for batch encoding")
+    if not all(len(p) == k for p in patterns):
+        raise ValueError("All k-mers must be the same length")
+
+    raw = np.frombuffer("".join(patterns).encode("ascii"), dtype=np.uint8)
+    values = _ENCODE_ARRAY[raw]
+    if (values < 0).any():
+        raise ValueError("Invalid nucleotide in k-mers")
+
+    values = values.astype(np.uint64).reshape(len(patterns), k)
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+
+    return np.bitwise_or.reduce(values << shifts, axis=1)
+
+
+def decode_kmers(codes: Iterable[int], k: int) -> List[str]:
+    """Decode a batch of k-mer codes back into strings
+
+    Arguments:
+        codes {Iterable[int]} -- k-mer codes
+        k {int} -- k-mer length (k <= 32)
+
+    Returns:
+        List[str] -- decoded k-mers
+
+    Example:
+    >>> decode_kmers([11, 63, 6], 3)
+    ['AGT', 'TTT', 'ACG']
+
+    """
+    if k > MAX_K:
+        raise ValueError(f"k must be at most {MAX_K} for batch decoding")
+
+    codes = np.asarray(codes, dtype=np.uint64)
+    if not codes.size:
+        return []
+
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    values = ((codes[:, None] >> shifts) & np.uint64(0b11)).astype(np.uint8)
+    raw = _DECODE_ARRAY[values].tobytes().decode("ascii")
+
+    return [raw[i:i+k] for i in range(0, len(raw), k)]
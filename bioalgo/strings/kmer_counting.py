@@ -0,0 +1,173 @@
+from typing import Dict, Set, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import MAX_K, decode_kmers
+
+
+BACKENDS = ("python", "numpy")
+INVALID = 4  # code given to any byte that is not A, C, G or T
+BINCOUNT_MAX_K = 12  # largest k ever counted into a dense 4^k array (128 MiB of int64)
+BINCOUNT_MAX_RATIO = 2  # and only while 4^k is at most this many times the number of codes
+
+_SEQUENCE_CODES = np.full(256, INVALID, dtype=np.uint8)
+for _code, _base in enumerate("ACGT"):
+    _SEQUENCE_CODES[ord(_base)] = _code
+    _SEQUENCE_CODES[ord(_base.lower())] = _code
+
+
+def check_backend(backend: str) -> None:
+    """Raise a ValueError if backend is not one of the supported counting backends
+
+    Arguments:
+        backend {str} -- name of the backend
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend!r}, expected one of {BACKENDS}")
+
+
+def sequence_to_codes(text: Union[str, bytes]) -> np.ndarray:
+    """Convert a DNA sequence into a uint8 array of 2-bit codes
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+
+    Returns:
+        np.ndarray -- uint8 codes, A=0, C=1, G=2, T=3 and 4 for any other symbol
+
+    Example:
+    >>> sequence_to_codes("ACGTN").tolist()
+    [0, 1, 2, 3, 4]
+
+    """
+    if isinstance(text, str):
+        text = text.encode("ascii")
+
+    return _SEQUENCE_CODES[np.frombuffer(text, dtype=np.uint8)]
+
+
+def kmer_code_array(text: Union[str, bytes, np.ndarray], k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the code of every k-mer in text with vectorized shifts
+
+    Arguments:
+        text {Union[str, bytes, np.ndarray]} -- DNA sequence or output of sequence_to_codes
+        k {int} -- k-mer length (k <= 32)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- uint64 code of the k-mer starting at each position
+        and a boolean mask that is False where the window contains a non-ACGT symbol
+
+    Example:
+    >>> codes, valid = kmer_code_array("ACGTNA", 3)
+    >>> codes[valid].tolist(), valid.tolist()
+    ([6, 27], [True, True, False, False])
+
+    """
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}")
+
+    seq = text if isinstance(text, np.ndarray) else sequence_to_codes(text)
+    n_windows = max(len(seq) - k + 1, 0)
+
+    codes = np.zeros(n_windows, dtype=np.uint64)
+    for j in range(k):
+        codes <<= np.uint64(2)
+        codes |= (seq[j:j+n_windows] & 0b11).astype(np.uint64)
+
+    invalid = np.concatenate(([0], np.cumsum(seq == INVALID)))
+    valid = invalid[k:k+n_windows] == invalid[:n_windows]
+
+    return codes, valid
+
+
+def use_bincount(n_codes: int, k: int, max_k: int = BINCOUNT_MAX_K) -> bool:
+    """Decide whether n_codes k-mer codes are counted faster with bincount over
+    all 4^k codes than by sorting them. Sorting wins once the 4^k array outgrows
+    the input, so short texts never pay for a large dense array.
+
+    Arguments:
+        n_codes {int} -- number of k-mer codes to count
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        max_k {int} -- largest k allowed a dense array (default: {BINCOUNT_MAX_K})
+
+    Returns:
+        bool -- True to use bincount
+
+    Example:
+    >>> use_bincount(1_000_000, 10), use_bincount(1_000, 10), use_bincount(10 ** 9, 13)
+    (True, False, False)
+
+    """
+    return k <= max_k and 4 ** k <= BINCOUNT_MAX_RATIO * n_codes
+
+
+def count_kmers(text: Union[str, bytes, np.ndarray], k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Count every k-mer in text, with bincount over all 4^k codes when the
+    text is long enough for use_bincount() and by sorting the codes otherwise.
+
+    Arguments:
+        text {Union[str, bytes, np.ndarray]} -- DNA sequence or output of sequence_to_codes
+        k {int} -- k-mer length
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- sorted distinct k-mer codes and their counts
+
+    Example:
+    >>> codes, counts = count_kmers("ACGTACG", 3)
+    >>> codes.tolist(), counts.tolist()
+    ([6, 27, 44, 49], [2, 1, 1, 1])
+
+    """
+    codes, valid = kmer_code_array(text, k)
+    codes = codes[valid]
+
+    if use_bincount(codes.size, k):
+        counts = np.bincount(codes.astype(np.intp), minlength=4 ** k)
+        present = np.flatnonzero(counts)
+        return present.astype(np.uint64), counts[present]
+
+    return np.unique(codes, return_counts=True)
+
+
+def kmer_frequencies(text: Union[str, bytes], k: int) -> Dict[str, int]:
+    """Return the count of each k-mer in text using the NumPy backend
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+
+    Returns:
+        Dict[str, int] -- k-mers and their counts, windows containing non-ACGT symbols are skipped
+
+    Example:
+    >>> kmer_frequencies("ACGT", 2)
+    {'AC': 1, 'CG': 1, 'GT': 1}
+
+    """
+    codes, counts = count_kmers(text, k)
+
+    return dict(zip(decode_kmers(codes, k), counts.tolist()))
+
+
+def most_frequent_kmers(text: Union[str, bytes], k: int) -> Set[str]:
+    """Return the most frequent k-mers in text using the NumPy backend
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+
+    Returns:
+        Set[str] -- k-mers occurring the maximum number of times
+
+    Example:
+    >>> most_frequent_kmers("ACAACTATGCATACTATCGGGAACTATCCT", 5)
+    {'ACTAT'}
+
+    """
+    codes, counts = count_kmers(text, k)
+    if not counts.size:
+        return set()
+
+    return set(decode_kmers(codes[counts == counts.max()], k))
@@ -0,0 +1,139 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import decode_kmers
+from bioalgo.strings.kmer_counting import count_kmers, use_bincount
+from bioalgo.strings.neighborhood import mismatch_masks
+
+
+NEIGHBOR_BATCH = 1 << 22  # neighbor codes materialized at a time
+DENSE_MAX_K = 13  # a 4^13 count array (512 MiB) is still smaller than a sparse table that fills it
+
+
+def reverse_complement_codes(codes: np.ndarray, k: int) -> np.ndarray:
+    """Reverse complement an array of k-mer codes without decoding them: the
+    2-bit digits are reversed and complemented (A<->T is 0<->3, C<->G is 1<->2)
+
+    Arguments:
+        codes {np.ndarray} -- k-mer codes
+        k {int} -- k-mer length
+
+    Returns:
+        np.ndarray -- uint64 codes of the reverse complements
+
+    Example:
+    >>> reverse_complement_codes(np.array([6, 0]), 3).tolist()
+    [27, 63]
+
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    reversed_codes = np.zeros_like(codes)
+    for _ in range(k):
+        reversed_codes = (reversed_codes << np.uint64(2)) | (codes & np.uint64(0b11))
+        codes = codes >> np.uint64(2)
+
+    return reversed_codes ^ np.uint64((1 << (2 * k)) - 1)
+
+
+def mismatch_counts(text: Union[str, bytes, np.ndarray], k: int, d: int,
+                    include_reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Count, for every k-mer, the windows of text within Hamming distance d of it.
+    Each distinct k-mer's neighborhood is added once, weighted by the k-mer's
+    multiplicity, straight into a 4^k count array when use_bincount() allows it
+    for the number of neighbors (up to k = DENSE_MAX_K), or otherwise reduced batch
+    by batch into sorted sparse tables that are merged as they grow.
+
+    Arguments:
+        text {Union[str, bytes, np.ndarray]} -- DNA sequence or output of sequence_to_codes
+        k {int} -- k-mer length
+        d {int} -- maximum number of mismatches
+
+    Keyword Arguments:
+        include_reverse {bool} -- also count approximate occurences of each k-mer's
+        reverse complement (default: {False})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- sorted k-mer codes with a non-zero count, and the counts
+
+    Example:
+    >>> codes, counts = mismatch_counts("AAAT", 2, 1)
+    >>> dict(zip(decode_kmers(codes, 2), counts.tolist()))["AT"]
+    3
+
+    """
+    codes, multiplicity = count_kmers(text, k)
+    if include_reverse:
+        codes = np.concatenate((codes, reverse_complement_codes(codes, k)))
+        multiplicity = np.concatenate((multiplicity, multiplicity))
+
+    masks = mismatch_masks(k, d)
+    batch = max(1, NEIGHBOR_BATCH // len(masks))
+
+    if use_bincount(len(codes) * len(masks), k, max_k=DENSE_MAX_K):
+        totals = np.zeros(4 ** k, dtype=np.int64)
+        for start in range(0, len(codes), batch):
+            neighbors = (codes[start:start+batch, None] ^ masks).ravel()
+            np.add.at(totals, neighbors.astype(np.intp), np.repeat(multiplicity[start:start+batch], len(masks)))
+
+        present = np.flatnonzero(totals)
+        return present.astype(np.uint64), totals[present]
+
+    table = (np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64))
+    pending = []
+    for start in range(0, len(codes), batch):
+        neighbors = (codes[start:start+batch, None] ^ masks).ravel()
+        pending.append(_reduce(neighbors, np.repeat(multiplicity[start:start+batch], len(masks))))
+        # merge only once the partial tables outgrow the running one, so every
+        # entry is re-sorted O(log n) times instead of once per batch
+        if sum(len(part) for part, _ in pending) >= len(table[0]):
+            table = _merge([table] + pending)
+            pending = []
+
+    return _merge([table] + pending)
+
+
+def _reduce(codes: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum the weights of equal codes into a sorted (codes, totals) table"""
+    order = np.argsort(codes, kind="stable")  # timsort merges the already sorted runs cheaply
+    codes, weights = codes[order], weights[order]
+    first = np.ones(len(codes), dtype=bool)
+    first[1:] = codes[1:] != codes[:-1]
+    starts = np.flatnonzero(first)
+
+    return codes[starts], np.add.reduceat(weights, starts)
+
+
+def _merge(tables: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum (codes, totals) tables into one sorted table"""
+    return _reduce(np.concatenate([codes for codes, _ in tables]),
+                   np.concatenate([totals for _, totals in tables]))
+
+
+def most_frequent_with_mismatches(text: Union[str, bytes], k: int, d: int,
+                                  include_reverse: bool = False) -> List[str]:
+    """Return the k-mers with the most approximate occurences (at most d mismatches)
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+        d {int} -- maximum number of mismatches
+
+    Keyword Arguments:
+        include_reverse {bool} -- also count approximate occurences of reverse complements (default: {False})
+
+    Returns:
+        List[str] -- most frequent k-mers in lexicographic order
+
+    Example:
+    >>> most_frequent_with_mismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1)
+    ['ATGC', 'ATGT', 'GATG']
+    >>> most_frequent_with_mismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1, include_reverse=True)
+    ['ACAT', 'ATGT']
+
+    """
+    codes, counts = mismatch_counts(text, k, d, include_reverse)
+    if not counts.size:
+        return []
+
+    return decode_kmers(codes[counts == counts.max()], k)
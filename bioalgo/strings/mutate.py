@@ -1,31 +1,36 @@
-def mutate(text: str, n: int) -> str:
+import random
+
+import numpy as np
+
+from bioalgo.strings.simulate import codes_to_strings, mutate_codes, strings_to_codes
+
+
+def mutate(text: str, n: int, rng: np.random.Generator = None) -> str:
     """Mutate a string text n times
 
     Arguments:
         text {str} -- the string to mutate
         n {int} -- number of mutations to add to string
+
+    Keyword Arguments:
+        rng {np.random.Generator} -- random number generator, None to seed one from the random module (default: {None})
     
     Returns:
         str -- string with n mutations
+
+    Example:
+    >>> mutated = mutate("AAAAAAAAAA", 3, np.random.default_rng(0))
+    >>> len(mutated), sum(base != "A" for base in mutated)
+    (10, 3)
+
     """
     if not n:
         return text
 
     if n > len(text):
         raise ValueError("Number of mutations greater than the length of the string")
-    
-    positions = list(range(len(text)))  # indeces in the kmer
-    random.shuffle(positions)           # randomly swap the indeces
-    mutate_at = [positions.pop() for _ in range(n)]  # get n non-repeating random indeces
-
-    bases = ['A', 'C', 'G', 'T']
-    kmer = list(text)
-    for position in mutate_at:
-        current = kmer[position]
-        mutation = random.choice(bases)
-        while current == mutation:       # ensure that same base hasn't mutated back
-            mutation = random.choice(bases)
-        
-        kmer[position] = mutation
-
-    return "".join(kmer)
\ No newline at end of file
+
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    return codes_to_strings(mutate_codes(strings_to_codes([text]), count=n, rng=rng))[0]
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from itertools import combinations, product
+from typing import Iterator, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import decode_kmer, encode_kmer
+
+
+def _iter_masks(k: int, d: int) -> Iterator[int]:
+    for distance in range(min(d, k) + 1):
+        for positions in combinations(range(k), distance):
+            shifts = [2 * (k - 1 - p) for p in positions]
+            for values in product((1, 2, 3), repeat=distance):
+                mask = 0
+                for shift, value in zip(shifts, values):
+                    mask |= value << shift
+                yield mask
+
+
+def mismatch_masks(k: int, d: int) -> np.ndarray:
+    """XOR masks that turn a k-mer code into each member of its d-neighborhood.
+    A mask holds a non-zero 2-bit value at each mismatched position, and XOR with a
+    non-zero value always changes the base, so every neighbor is produced exactly once.
+
+    Arguments:
+        k {int} -- k-mer length (k <= 32)
+        d {int} -- maximum number of mismatches
+
+    Returns:
+        np.ndarray -- uint64 masks, the all-zero mask (the k-mer itself) first
+
+    Example:
+    >>> mismatch_masks(2, 1).tolist()
+    [0, 4, 8, 12, 1, 2, 3]
+
+    """
+    return np.fromiter(_iter_masks(k, d), dtype=np.uint64)
+
+
+def iter_neighbors(pattern: Union[str, int], d: int, k: int = None, as_codes: bool = False) -> Iterator[Union[str, int]]:
+    """Enumerate the d-neighborhood of a k-mer iteratively, each neighbor exactly once,
+    by walking mismatch positions and the three substitutions at each of them
+
+    Arguments:
+        pattern {Union[str, int]} -- k-mer, or its integer code (then k is required)
+        d {int} -- maximum number of mismatches
+
+    Keyword Arguments:
+        k {int} -- k-mer length when pattern is a code (default: {None})
+        as_codes {bool} -- yield integer codes instead of strings (default: {False})
+
+    Returns:
+        Iterator[Union[str, int]] -- neighbors in order of increasing distance
+
+    Example:
+    >>> list(iter_neighbors('AT', 1))
+    ['AT', 'CT', 'GT', 'TT', 'AG', 'AC', 'AA']
+    >>> list(iter_neighbors(3, 1, k=2, as_codes=True))
+    [3, 7, 11, 15, 2, 1, 0]
+
+    """
+    if isinstance(pattern, str):
+        k = len(pattern)
+        code = encode_kmer(pattern)
+    elif k is None:
+        raise ValueError("k is required when pattern is an integer code")
+    else:
+        code = pattern
+
+    for mask in _iter_masks(k, d):
+        yield code ^ mask if as_codes else decode_kmer(code ^ mask, k)
+
+
+class NeighborhoodCache:
+    """Least-recently-used cache of d-neighborhoods keyed by k-mer code. Memory is
+    bounded by max_codes, the total number of neighbor codes held across entries.
+
+    Keyword Arguments:
+        max_codes {int} -- upper bound on cached neighbor codes (default: {1 << 22})
+
+    Example:
+    >>> cache = NeighborhoodCache(max_codes=100)
+    >>> cache.get(3, k=2, d=1)
+    (3, 7, 11, 15, 2, 1, 0)
+    >>> cache.hits, cache.misses
+    (0, 1)
+
+    """
+
+    def __init__(self, max_codes: int = 1 << 22):
+        self.max_codes = max_codes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._masks = {}
+
+    def get(self, code: int, k: int, d: int) -> Tuple[int, ...]:
+        """Return the neighbor codes of the k-mer code, computing them on a miss
+
+        Arguments:
+            code {int} -- k-mer code
+            k {int} -- k-mer length
+            d {int} -- maximum number of mismatches
+
+        Returns:
+            Tuple[int, ...] -- neighbor codes
+        """
+        key = (code, k, d)
+        neighborhood = self._entries.get(key)
+        if neighborhood is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return neighborhood
+
+        self.misses += 1
+        if (k, d) not in self._masks:
+            self._masks[(k, d)] = tuple(_iter_masks(k, d))
+        neighborhood = tuple(code ^ mask for mask in self._masks[(k, d)])
+
+        if len(neighborhood) <= self.max_codes:
+            self._entries[key] = neighborhood
+            self._size += len(neighborhood)
+            while self._size > self.max_codes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+        return neighborhood
+
@@ -1,6 +1,6 @@
 from typing import Set
 
-from bioalgo.strings.hamming_distance import hamming_distance
+from bioalgo.strings.neighborhood import iter_neighbors
 
 
 def neighbors(pattern: str, d: int) -> Set:
@@ -14,25 +14,11 @@ def neighbors(pattern: str, d: int) -> Set:
         Set -- d-neighborhood of the kmer
 
     Example:
-    >>> neighbors('AT', 1)
-    {'GT', 'TT', 'AG', 'AC', 'AT', 'AA', 'CT'}
+    >>> sorted(neighbors('AT', 1))
+    ['AA', 'AC', 'AG', 'AT', 'CT', 'GT', 'TT']
     
     """
     if d == 0:
-        res = set()
-        res.add(pattern)
-        return res
+        return {pattern}
 
-    if len(pattern) == 1:
-        return(set(['A', 'C', 'G', 'T']))
-
-    neighborhood = set()
-    suffix_neighbors = neighbors(pattern[1:], d)
-    for s in suffix_neighbors:
-        if hamming_distance(pattern[1:], s) < d:
-            for n in ['A', 'C', 'G', 'T']:
-                neighborhood.add(str(n + s))
-        else:
-            neighborhood.add(str(pattern[0] + s))
-
-    return neighborhood
+    return set(iter_neighbors(pattern, d))
@@ -1,4 +1,5 @@
 from typing import Dict
+from collections import Counter
 
 
 def nucleotides(text: str) -> Dict[str, int]:
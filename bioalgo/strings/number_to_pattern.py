@@ -1,3 +1,6 @@
+from bioalgo.strings.kmer_codec import decode_kmer
+
+
 def number_to_pattern(index: int, k: int) -> str:
     """Convert an integer to its pattern representation
     
@@ -13,15 +16,4 @@ def number_to_pattern(index: int, k: int) -> str:
     'AGT'
 
     """
-    symbols = ["A", "C", "G", "T"]
-
-    if k == 1:
-        return symbols[index]
-
-    prefix_index = index // 4
-    r = index % 4
-    symbol = symbols[r]
-
-    prefix_pattern = number_to_pattern(prefix_index, k-1)
-
-    return prefix_pattern + symbol
\ No newline at end of file
+    return decode_kmer(index, k)
\ No newline at end of file
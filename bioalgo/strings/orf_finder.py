@@ -0,0 +1,170 @@
+from typing import Iterable, Iterator, List, NamedTuple, Sequence
+
+import numpy as np
+
+from bioalgo.strings.sequence_transforms import (
+    _INVALID_SYMBOL, _IUPAC_CODON_TABLE, _SYMBOL_INDEX, _SYMBOLS, complement_sequence)
+
+
+START_CODONS = ("ATG",)
+ALTERNATIVE_START_CODONS = ("ATG", "GTG", "TTG")  # common bacterial initiation codons
+
+# codons are indexed like translate_sequence's IUPAC table, one 4-bit symbol index per base
+_COMPLEMENT_SYMBOL = np.array([_SYMBOLS.index(complement_sequence(symbol)) for symbol in _SYMBOLS] + [_INVALID_SYMBOL])
+_CODONS = np.arange(16 ** 3)
+_REVERSE_CODON = ((_COMPLEMENT_SYMBOL[_CODONS & 15] << 8) | (_COMPLEMENT_SYMBOL[(_CODONS >> 4) & 15] << 4)
+                  | _COMPLEMENT_SYMBOL[_CODONS >> 8]).astype(np.uint16)
+_STOP_CODES = np.flatnonzero(_IUPAC_CODON_TABLE == ord("*")).astype(np.uint16)  # TAA, TAR, TRA, ...
+
+
+def _symbols(text: str) -> np.ndarray:
+    return _SYMBOL_INDEX[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+
+
+def _codon_codes(symbols: np.ndarray) -> np.ndarray:
+    n_codons = max(len(symbols) - 2, 0)
+    return (symbols[:n_codons] << 8) | (symbols[1:n_codons+1] << 4) | symbols[2:n_codons+2]
+
+
+class ORF(NamedTuple):
+    """Open reading frame. Coordinates are 1-based and inclusive on the forward
+    strand, and span the start codon through the stop codon on either strand."""
+    start: int
+    end: int
+    strand: str
+    protein: str
+
+
+class _ORFScanner:
+    """Single pass ORF detection over consecutive chunks of one sequence. Each
+    chunk is encoded into codon codes once; the forward and reverse strand
+    reading frames are tracked together by walking the start and stop codons
+    in order of position."""
+
+    def __init__(self, min_length: int, start_codons: Sequence[str]):
+        starts = np.concatenate([_codon_codes(_symbols(codon)) for codon in start_codons]).astype(np.uint16)
+        self.min_length = min_length
+        self._codons = {
+            "forward_start": starts,
+            "forward_stop": _STOP_CODES,
+            "reverse_start": _REVERSE_CODON[starts],
+            "reverse_stop": _REVERSE_CODON[_STOP_CODES],
+        }
+        self._bases = np.zeros(0, dtype=np.uint16)
+        self._buffer = np.zeros(0, dtype=np.uint16)  # codon code at every position from _buffer_start
+        self._buffer_start = 0
+        self._length = 0
+        self._forward_open = [-1, -1, -1]  # first start codon since the last stop, per frame
+        self._reverse_stop = [-1, -1, -1]  # last reverse strand stop codon, per frame
+        self._reverse_start = [-1, -1, -1]  # furthest reverse strand start codon after it
+
+    def _protein(self, codons: np.ndarray) -> str:
+        # the initiator codon is always read as methionine, whichever start codon it is
+        return "M" + _IUPAC_CODON_TABLE[codons[1:]].tobytes().decode("ascii")
+
+    def _forward_orf(self, start: int, stop: int) -> Iterator[ORF]:
+        if (stop - start) // 3 >= self.min_length:
+            codons = self._buffer[start - self._buffer_start:stop - self._buffer_start:3]
+            yield ORF(start + 1, stop + 3, "+", self._protein(codons))
+
+    def _reverse_orf(self, stop: int, start: int) -> Iterator[ORF]:
+        if (start - stop) // 3 >= self.min_length:
+            codons = self._buffer[start - self._buffer_start:stop - self._buffer_start:-3]
+            yield ORF(stop + 1, start + 3, "-", self._protein(_REVERSE_CODON[codons]))
+
+    def update(self, chunk: str) -> Iterator[ORF]:
+        """Scan the next chunk, yielding the ORFs it completes"""
+        seq = np.concatenate((self._bases, _symbols(chunk)))
+        codons = _codon_codes(seq)
+        first = self._length - len(self._bases)  # position of the first codon in this chunk
+        self._bases = seq[max(len(seq) - 2, 0):]
+        self._length += len(chunk)
+        self._buffer = np.concatenate((self._buffer, codons))
+
+        flags = {name: np.isin(codons, values) for name, values in self._codons.items()}
+        events = np.flatnonzero(np.logical_or.reduce(list(flags.values())))
+        forward_start, forward_stop, reverse_start, reverse_stop = (
+            flags[name][events].tolist() for name in ("forward_start", "forward_stop", "reverse_start", "reverse_stop"))
+
+        forward_open, rev_stop, rev_start = self._forward_open, self._reverse_stop, self._reverse_start
+        for i, position in enumerate((events + first).tolist()):
+            frame = position % 3
+            if forward_stop[i]:
+                if forward_open[frame] >= 0:
+                    yield from self._forward_orf(forward_open[frame], position)
+                forward_open[frame] = -1
+            elif forward_start[i] and forward_open[frame] < 0:
+                forward_open[frame] = position
+
+            if reverse_stop[i]:
+                if rev_start[frame] >= 0:
+                    yield from self._reverse_orf(rev_stop[frame], rev_start[frame])
+                rev_stop[frame], rev_start[frame] = position, -1
+            elif reverse_start[i] and rev_stop[frame] >= 0:
+                rev_start[frame] = position
+
+        # keep only the codons that a still open reading frame will need
+        pending = [position for position in forward_open + rev_stop if position >= 0]
+        keep_from = min(pending) if pending else self._buffer_start + len(self._buffer)
+        self._buffer = self._buffer[keep_from - self._buffer_start:]
+        self._buffer_start = keep_from
+
+    def finish(self) -> Iterator[ORF]:
+        """Yield the reverse strand ORFs whose start codon ends the sequence's last open frame"""
+        for frame in range(3):
+            if self._reverse_start[frame] >= 0:
+                yield from self._reverse_orf(self._reverse_stop[frame], self._reverse_start[frame])
+
+
+def iter_orfs(chunks: Iterable[str], min_length: int = 30, start_codons: Sequence[str] = START_CODONS) -> Iterator[ORF]:
+    """Find the open reading frames of a sequence streamed in chunks, in a single
+    pass covering all six frames. Each ORF runs from the first start codon after
+    a stop codon to the next in-frame stop codon, so nested starts are not
+    reported separately; frames without a stop codon are not reported.
+    Proteins are translated like translate_sequence, so ambiguous IUPAC codons
+    give their amino acid when it is unambiguous (GCN is A) and X otherwise,
+    and a codon that can only be a stop (TAR) ends the frame.
+
+    Arguments:
+        chunks {Iterable[str]} -- consecutive pieces of one DNA sequence
+
+    Keyword Arguments:
+        min_length {int} -- minimum protein length in amino acids, stop excluded (default: {30})
+        start_codons {Sequence[str]} -- codons that initiate translation, e.g.
+        ALTERNATIVE_START_CODONS (default: {START_CODONS})
+
+    Returns:
+        Iterator[ORF] -- ORFs in the order they are completed
+
+    Example:
+    >>> list(iter_orfs(["CCATGAAAT", "GGTAGCCTTAGACCATCC"], min_length=2))
+    [ORF(start=3, end=14, strand='+', protein='MKW'), ORF(start=17, end=25, strand='-', protein='MV')]
+
+    """
+    scanner = _ORFScanner(min_length, start_codons)
+    for chunk in chunks:
+        yield from scanner.update(chunk)
+    yield from scanner.finish()
+
+
+def find_orfs(sequence: str, min_length: int = 30, start_codons: Sequence[str] = START_CODONS) -> List[ORF]:
+    """Find the open reading frames of a DNA sequence on both strands
+
+    Arguments:
+        sequence {str} -- DNA sequence
+
+    Keyword Arguments:
+        min_length {int} -- minimum protein length in amino acids, stop excluded (default: {30})
+        start_codons {Sequence[str]} -- codons that initiate translation (default: {START_CODONS})
+
+    Returns:
+        List[ORF] -- ORFs sorted by start coordinate
+
+    Example:
+    >>> find_orfs("CCATGAAATGGTAGCCTTAGACCATCC", min_length=2)
+    [ORF(start=3, end=14, strand='+', protein='MKW'), ORF(start=17, end=25, strand='-', protein='MV')]
+    >>> find_orfs("ATGGCNNNNTAR", min_length=1)
+    [ORF(start=1, end=12, strand='+', protein='MAX')]
+
+    """
+    return sorted(iter_orfs([sequence], min_length, start_codons))
@@ -0,0 +1,226 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Set, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_codec import decode_kmers, rolling_kmer_codes
+from bioalgo.strings.kmer_counting import check_backend, count_kmers, sequence_to_codes
+from bioalgo.strings.mismatch_counting import mismatch_counts
+from bioalgo.strings.neighborhood import NeighborhoodCache
+
+
+DEFAULT_CHUNK_SIZE = 1 << 22  # k-mer start positions per shard
+
+
+def shard_bounds(length: int, k: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Split a sequence into shards that overlap by k - 1 bases, so that every
+    k-mer lies wholly inside exactly one shard
+
+    Arguments:
+        length {int} -- sequence length
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        chunk_size {int} -- k-mer start positions per shard (default: {DEFAULT_CHUNK_SIZE})
+
+    Returns:
+        List[Tuple[int, int]] -- half-open [start, end) base ranges
+
+    Example:
+    >>> shard_bounds(10, 3, chunk_size=4)
+    [(0, 6), (4, 10)]
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    n_kmers = length - k + 1
+    return [(start, min(start + chunk_size, n_kmers) + k - 1) for start in range(0, max(n_kmers, 0), chunk_size)]
+
+
+def _python_counts(shard: np.ndarray, k: int, d: int = None, include_reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Pure Python shard counter: plain k-mer counts, or mismatch counts when d is given"""
+    text = np.frombuffer(b"ACGTN", dtype=np.uint8)[shard].tobytes().decode("ascii")
+    counts = Counter()
+    cache = NeighborhoodCache()
+    pieces = text.split("N")
+    if include_reverse:
+        pieces += [piece[::-1].translate(str.maketrans("ACGT", "TGCA")) for piece in pieces]
+
+    for piece in pieces:
+        if len(piece) < k:
+            continue
+        if d is None:
+            counts.update(rolling_kmer_codes(piece, k))
+        else:
+            for code in rolling_kmer_codes(piece, k):
+                counts.update(cache.get(code, k, d))
+
+    codes = np.array(sorted(counts), dtype=np.uint64)
+    return codes, np.array([counts[code] for code in codes.tolist()], dtype=np.int64)
+
+
+def _count_shard(name: str, length: int, start: int, end: int, k: int, backend: str,
+                 d: int = None, include_reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Worker: attach to the shared sequence and count one shard of it"""
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        shard = np.ndarray((length,), dtype=np.uint8, buffer=memory.buf)[start:end].copy()
+    finally:
+        memory.close()
+
+    if backend == "python":
+        return _python_counts(shard, k, d, include_reverse)
+    if d is None:
+        codes, counts = count_kmers(shard, k)
+        return codes, counts.astype(np.int64)
+
+    return mismatch_counts(shard, k, d, include_reverse)
+
+
+def _merge(partials: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum per-shard (codes, counts) tables into one sorted table"""
+    if not partials:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+
+    codes = np.concatenate([codes for codes, _ in partials])
+    counts = np.concatenate([counts for _, counts in partials])
+    merged, inverse = np.unique(codes, return_inverse=True)
+
+    return merged, np.bincount(inverse, weights=counts, minlength=len(merged)).astype(np.int64)
+
+
+def _parallel_counts(text: Union[str, bytes], k: int, workers: int, chunk_size: int, backend: str,
+                     d: int = None, include_reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    check_backend(backend)
+    seq = sequence_to_codes(text)
+    bounds = shard_bounds(len(seq), k, chunk_size)
+
+    # the encoded sequence is placed in shared memory once; workers receive only its name
+    memory = shared_memory.SharedMemory(create=True, size=max(len(seq), 1))
+    try:
+        np.ndarray((len(seq),), dtype=np.uint8, buffer=memory.buf)[:] = seq
+        args = [(memory.name, len(seq), start, end, k, backend, d, include_reverse) for start, end in bounds]
+        if workers == 1:
+            partials = [_count_shard(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(_count_shard, *zip(*args))) if args else []
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return _merge(partials)
+
+
+def parallel_kmer_counts(text: Union[str, bytes], k: int, workers: int = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = "numpy") -> Tuple[np.ndarray, np.ndarray]:
+    """Count every k-mer of text across a process pool. Windows with non-ACGT symbols are skipped.
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        workers {int} -- worker processes, None for one per CPU (default: {None})
+        chunk_size {int} -- k-mer start positions per shard (default: {DEFAULT_CHUNK_SIZE})
+        backend {str} -- per-shard counting backend, "numpy" or "python" (default: {"numpy"})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- sorted distinct k-mer codes and their counts
+
+    Example:
+    >>> codes, counts = parallel_kmer_counts("ACGTACG", 3, workers=2, chunk_size=2)
+    >>> codes.tolist(), counts.tolist()
+    ([6, 27, 44, 49], [2, 1, 1, 1])
+
+    """
+    return _parallel_counts(text, k, workers, chunk_size, backend)
+
+
+def parallel_compute_frequencies(text: Union[str, bytes], k: int, workers: int = None,
+                                 chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = "numpy") -> Dict[str, int]:
+    """Parallel counterpart of compute_frequencies
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        workers {int} -- worker processes, None for one per CPU (default: {None})
+        chunk_size {int} -- k-mer start positions per shard (default: {DEFAULT_CHUNK_SIZE})
+        backend {str} -- per-shard counting backend, "numpy" or "python" (default: {"numpy"})
+
+    Returns:
+        Dict[str, int] -- k-mers and their counts
+
+    Example:
+    >>> parallel_compute_frequencies("ACGT", 2, workers=1)
+    {'AC': 1, 'CG': 1, 'GT': 1}
+
+    """
+    codes, counts = _parallel_counts(text, k, workers, chunk_size, backend)
+
+    return dict(zip(decode_kmers(codes, k), counts.tolist()))
+
+
+def parallel_frequent_words(text: Union[str, bytes], k: int, workers: int = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = "numpy") -> Set[str]:
+    """Parallel counterpart of fast_frequent_words and sorted_frequent_words
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+
+    Keyword Arguments:
+        workers {int} -- worker processes, None for one per CPU (default: {None})
+        chunk_size {int} -- k-mer start positions per shard (default: {DEFAULT_CHUNK_SIZE})
+        backend {str} -- per-shard counting backend, "numpy" or "python" (default: {"numpy"})
+
+    Returns:
+        Set[str] -- most frequent k-mers
+
+    Example:
+    >>> parallel_frequent_words("ACAACTATGCATACTATCGGGAACTATCCT", 5, workers=2, chunk_size=8)
+    {'ACTAT'}
+
+    """
+    codes, counts = _parallel_counts(text, k, workers, chunk_size, backend)
+    if not counts.size:
+        return set()
+
+    return set(decode_kmers(codes[counts == counts.max()], k))
+
+
+def parallel_frequent_words_with_mismatches(text: Union[str, bytes], k: int, d: int, include_reverse: bool = False,
+                                            workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                            backend: str = "numpy") -> List[str]:
+    """Parallel counterpart of frequent_words_with_mismatches: each shard aggregates
+    the neighborhoods of its own k-mers and the partial tables are summed
+
+    Arguments:
+        text {Union[str, bytes]} -- DNA sequence
+        k {int} -- k-mer length
+        d {int} -- maximum number of mismatches
+
+    Keyword Arguments:
+        include_reverse {bool} -- also count approximate occurences of reverse complements (default: {False})
+        workers {int} -- worker processes, None for one per CPU (default: {None})
+        chunk_size {int} -- k-mer start positions per shard (default: {DEFAULT_CHUNK_SIZE})
+        backend {str} -- per-shard counting backend, "numpy" or "python" (default: {"numpy"})
+
+    Returns:
+        List[str] -- most frequent k-mers in lexicographic order
+
+    Example:
+    >>> parallel_frequent_words_with_mismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1, workers=2, chunk_size=9)
+    ['ATGC', 'ATGT', 'GATG']
+
+    """
+    codes, counts = _parallel_counts(text, k, workers, chunk_size, backend, d, include_reverse)
+    if not counts.size:
+        return []
+
+    return decode_kmers(codes[counts == counts.max()], k)
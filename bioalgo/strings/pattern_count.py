@@ -1,8 +1,13 @@
-def pattern_count(text: str, pattern: str) -> int:
+from typing import Union
+
+from bioalgo.strings.fm_index import FMIndex
+
+
+def pattern_count(text: Union[str, FMIndex], pattern: str) -> int:
     """Count the number of occurences of a pattern within text
     
     Arguments:
-        text {str} -- text to count pattern in
+        text {Union[str, FMIndex]} -- text to count pattern in, or a prebuilt index of it
         pattern {str} -- pattern to be counted within text
 
     Returns:
@@ -11,8 +16,13 @@ def pattern_count(text: str, pattern: str) -> int:
     Example:
     >>> pattern_count("ACAACTATGCATACTATCGGGAACTATCCT", "ACTAT")
     3
+    >>> pattern_count(FMIndex("ACAACTATGCATACTATCGGGAACTATCCT"), "ACTAT")
+    3
 
     """
+    if isinstance(text, FMIndex):
+        return text.count(pattern)
+
     count  = 0
     pattern_size = len(pattern)
 
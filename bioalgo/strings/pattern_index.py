@@ -1,8 +1,13 @@
-def pattern_index(text: str, pattern: str) -> List[int]:
+from typing import List, Union
+
+from bioalgo.strings.fm_index import FMIndex
+
+
+def pattern_index(text: Union[str, FMIndex], pattern: str) -> List[int]:
     """Return the indeces (1-based) of a pattern within text
     
     Arguments:
-        text {str} -- text to search for pattern
+        text {Union[str, FMIndex]} -- text to search for pattern, or a prebuilt index of it
         pattern {str} -- pattern to search for in text
     
     Returns:
@@ -11,8 +16,13 @@ def pattern_index(text: str, pattern: str) -> List[int]:
     Example:
     >>> pattern_index("ACAACTATGCATACTATCGGGAACTATCCT", "TAT")
     [6, 15, 25]
+    >>> pattern_index(FMIndex("ACAACTATGCATACTATCGGGAACTATCCT"), "TAT")
+    [6, 15, 25]
     
     """
+    if isinstance(text, FMIndex):
+        return text.locate(pattern)
+
     indeces = []
     pattern_size = len(pattern)
 
@@ -1,3 +1,6 @@
+from bioalgo.strings.kmer_codec import encode_kmer
+
+
 def pattern_to_number(pattern: str) -> int:
     """"Transform a k-mer pattern into an integer
     
@@ -12,11 +15,4 @@ def pattern_to_number(pattern: str) -> int:
     11
     
     """
-    if not pattern:
-        return 0
-
-    symbols = {"A":0, "C":1, "G":2, "T":3}
-    symbol = pattern[-1]
-    prefix = pattern[:-1]
-
-    return 4 * pattern_to_number(prefix) + symbols.get(symbol)
\ No newline at end of file
+    return encode_kmer(pattern)
\ No newline at end of file
@@ -1,13 +1,22 @@
 import random
 from typing import List
 
+import numpy as np
 
-def random_DNA(n: int = 10, length: int = 100) -> List[str]:
-    """Generate n DNA strings of length l
+from bioalgo.strings.simulate import codes_to_strings, random_sequences
+
+
+def random_DNA(n: int = 10, length: int = 100, composition: List[float] = None,
+               rng: np.random.Generator = None) -> List[str]:
+    """Generate n DNA strings of length l. All strings are drawn in one batch;
+    without an rng the generator is seeded from the random module, so
+    random.seed still makes the output reproducible.
     
     Keyword Arguments:
         n {int} -- number of strings to randomly generate (default: {10})
         length {int} -- length of each randomly generated string (default: {100})
+        composition {List[float]} -- probabilities of A, C, G and T, None for uniform (default: {None})
+        rng {np.random.Generator} -- random number generator (default: {None})
     
     Returns:
         List[str] -- list of randomly generated DNA strings
@@ -15,8 +24,10 @@ def random_DNA(n: int = 10, length: int = 100) -> List[str]:
     Example:
     >>> random.seed(123)
     >>> random_DNA(2, 10)
-    ['AGATGAATGG', 'ACCGGCCATA']
+    ['TAGAGGTTTC', 'GCAGGAATAT']
 
     """
-    bases = ['A', 'C', 'G', 'T']
-    return ["".join([random.choice(bases) for l in range(length)]) for i in range(n)]
\ No newline at end of file
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    return codes_to_strings(random_sequences(n, length, composition, rng))
@@ -1,8 +1,11 @@
+from bioalgo.strings.sequence_transforms import reverse_complement_sequence
+
+
 def reverse_complement(pattern: str) -> str:
     """Return the reverse complement of the input pattern
     
     Arguments:
-        pattern {str} -- DNA string
+        pattern {str} -- DNA string, IUPAC ambiguity codes allowed
     
     Returns:
         str -- Reverse complement
@@ -12,6 +15,4 @@ def reverse_complement(pattern: str) -> str:
     'ACTATGCGACT'
 
     """
-    transtab = {"A":"T", "C":"G", "G":"C", "T":"A"}
-
-    return "".join(transtab[b] for b in pattern[::-1].upper())
\ No newline at end of file
+    return reverse_complement_sequence(pattern.upper())
\ No newline at end of file
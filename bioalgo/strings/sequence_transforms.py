@@ -0,0 +1,216 @@
+from itertools import product
+from typing import Dict, Union
+
+import numpy as np
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# standard genetic code indexed by 2-bit codon code (A=0, C=1, G=2, T/U=3), '*' for stop
+CODON_TABLE = "KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF"
+STOP_MODES = ("keep", "trim", "truncate", "raise")
+
+# IUPAC nucleotide codes and the bases each one stands for
+IUPAC_CODES = {
+    "A": "A", "C": "C", "G": "G", "T": "T", "U": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+_COMPLEMENT_PAIRS = ("ACGTURYSWKMBDHVN", "TGCAAYRSWMKVHDBN")
+
+_DNA_COMPLEMENT = _COMPLEMENT_PAIRS[0] + _COMPLEMENT_PAIRS[0].lower()
+_COMPLEMENT_STR = str.maketrans(_DNA_COMPLEMENT, _COMPLEMENT_PAIRS[1] + _COMPLEMENT_PAIRS[1].lower())
+_TRANSCRIBE_STR = str.maketrans("Tt", "Uu")
+_IUPAC_DELETE_STR = str.maketrans("", "", _DNA_COMPLEMENT)
+
+# byte lookup tables for bytes-like input, 0 marking a symbol that is not an IUPAC code
+_COMPLEMENT_BYTES = np.zeros(256, dtype=np.uint8)
+_COMPLEMENT_BYTES[list(_DNA_COMPLEMENT.encode("ascii"))] = list(_DNA_COMPLEMENT.translate(_COMPLEMENT_STR).encode("ascii"))
+_TRANSCRIBE_BYTES = np.zeros(256, dtype=np.uint8)
+_TRANSCRIBE_BYTES[list(_DNA_COMPLEMENT.encode("ascii"))] = list(_DNA_COMPLEMENT.translate(_TRANSCRIBE_STR).encode("ascii"))
+
+# codons of IUPAC symbols: each symbol gets a 4-bit index (ACGT first, so that
+# an unambiguous codon's index is its 2-bit code spread over 4-bit fields) and a
+# codon that only ever encodes one amino acid translates to it, anything else to 'X'
+_SYMBOLS = "ACGTRYSWKMBDHVN"
+_INVALID_SYMBOL = 15
+_SYMBOL_INDEX = np.full(256, _INVALID_SYMBOL, dtype=np.uint16)
+for _index, _symbol in enumerate(_SYMBOLS):
+    _SYMBOL_INDEX[[ord(_symbol), ord(_symbol.lower())]] = _index
+_SYMBOL_INDEX[[ord("U"), ord("u")]] = _SYMBOLS.index("T")
+
+_IUPAC_CODON_TABLE = np.full(16 ** 3, ord("X"), dtype=np.uint8)
+for _codon in product(range(len(_SYMBOLS)), repeat=3):
+    _amino_acids = {
+        CODON_TABLE[16 * "ACGT".index(a) + 4 * "ACGT".index(b) + "ACGT".index(c)]
+        for a, b, c in product(*(IUPAC_CODES[_SYMBOLS[i]] for i in _codon))
+    }
+    if len(_amino_acids) == 1:
+        _IUPAC_CODON_TABLE[(_codon[0] << 8) | (_codon[1] << 4) | _codon[2]] = ord(_amino_acids.pop())
+
+
+def _check_iupac(sequence: Union[str, BytesLike]) -> None:
+    if isinstance(sequence, str):
+        invalid = sequence.translate(_IUPAC_DELETE_STR)
+        if invalid:
+            raise ValueError(f"Invalid nucleotide: {invalid[0]}")
+    else:
+        raw = np.frombuffer(sequence, dtype=np.uint8)
+        invalid = np.flatnonzero(_COMPLEMENT_BYTES[raw] == 0)
+        if invalid.size:
+            raise ValueError(f"Invalid nucleotide: {chr(raw[invalid[0]])}")
+
+
+def check_stop_mode(stop: str) -> None:
+    """Raise a ValueError if stop is not one of the supported stop codon modes
+
+    Arguments:
+        stop {str} -- name of the mode
+    """
+    if stop not in STOP_MODES:
+        raise ValueError(f"Unknown stop mode: {stop!r}, expected one of {STOP_MODES}")
+
+
+def complement_sequence(sequence: Union[str, BytesLike]) -> Union[str, bytes]:
+    """Complement a DNA sequence of IUPAC codes, keeping its case
+
+    Arguments:
+        sequence {Union[str, BytesLike]} -- DNA sequence
+
+    Returns:
+        Union[str, bytes] -- complement, as str for str input and bytes otherwise
+
+    Example:
+    >>> complement_sequence("ACGTRYn")
+    'TGCAYRn'
+
+    """
+    _check_iupac(sequence)
+    if isinstance(sequence, str):
+        return sequence.translate(_COMPLEMENT_STR)
+
+    return _COMPLEMENT_BYTES[np.frombuffer(sequence, dtype=np.uint8)].tobytes()
+
+
+def reverse_complement_sequence(sequence: Union[str, BytesLike]) -> Union[str, bytes]:
+    """Reverse complement a DNA sequence of IUPAC codes, keeping its case
+
+    Arguments:
+        sequence {Union[str, BytesLike]} -- DNA sequence
+
+    Returns:
+        Union[str, bytes] -- reverse complement, as str for str input and bytes otherwise
+
+    Example:
+    >>> reverse_complement_sequence("AAGCTr")
+    'yAGCTT'
+    >>> reverse_complement_sequence(memoryview(b"AAGCTR"))
+    b'YAGCTT'
+
+    """
+    _check_iupac(sequence)
+    if isinstance(sequence, str):
+        return sequence[::-1].translate(_COMPLEMENT_STR)
+
+    return _COMPLEMENT_BYTES[np.frombuffer(sequence, dtype=np.uint8)[::-1]].tobytes()
+
+
+def transcribe_sequence(sequence: Union[str, BytesLike]) -> Union[str, bytes]:
+    """Transcribe a DNA sequence of IUPAC codes to RNA, keeping its case
+
+    Arguments:
+        sequence {Union[str, BytesLike]} -- DNA sequence
+
+    Returns:
+        Union[str, bytes] -- RNA sequence, as str for str input and bytes otherwise
+
+    Example:
+    >>> transcribe_sequence(b"GATtaca")
+    b'GAUuaca'
+
+    """
+    _check_iupac(sequence)
+    if isinstance(sequence, str):
+        return sequence.translate(_TRANSCRIBE_STR)
+
+    return _TRANSCRIBE_BYTES[np.frombuffer(sequence, dtype=np.uint8)].tobytes()
+
+
+def translate_sequence(sequence: Union[str, BytesLike], stop: str = "keep", allow_partial: bool = False) -> str:
+    """Translate a DNA or RNA sequence to protein with the standard genetic code.
+    Ambiguous IUPAC codons translate to their amino acid when every base they
+    stand for agrees on it (GCN is A), and to X otherwise.
+
+    Stop codons are written as '*' and handled according to stop:
+        "keep" -- leave every stop codon in the protein
+        "trim" -- drop a stop codon at the very end
+        "truncate" -- end the protein before the first stop codon
+        "raise" -- drop a stop codon at the very end and raise a ValueError on any other
+
+    Arguments:
+        sequence {Union[str, BytesLike]} -- DNA or RNA sequence, in frame
+
+    Keyword Arguments:
+        stop {str} -- stop codon mode (default: {"keep"})
+        allow_partial {bool} -- ignore trailing bases that do not fill a codon
+        instead of raising a ValueError (default: {False})
+
+    Returns:
+        str -- protein sequence
+
+    Example:
+    >>> translate_sequence("AUGGCNUAAUGGUGA")
+    'MA*W*'
+    >>> translate_sequence("AUGGCNUAAUGGUGA", stop="truncate")
+    'MA'
+
+    """
+    check_stop_mode(stop)
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii")
+
+    symbols = _SYMBOL_INDEX[np.frombuffer(sequence, dtype=np.uint8)]
+    invalid = np.flatnonzero(symbols == _INVALID_SYMBOL)
+    if invalid.size:
+        raise ValueError(f"Invalid nucleotide: {chr(np.frombuffer(sequence, dtype=np.uint8)[invalid[0]])}")
+    if len(symbols) % 3 and not allow_partial:
+        raise ValueError(f"Sequence length {len(symbols)} is not a multiple of 3")
+
+    codons = symbols[:len(symbols) - len(symbols) % 3].reshape(-1, 3)
+    protein = _IUPAC_CODON_TABLE[(codons[:, 0] << 8) | (codons[:, 1] << 4) | codons[:, 2]].tobytes().decode("ascii")
+
+    if stop == "truncate":
+        return protein.partition("*")[0]
+    if stop in ("trim", "raise") and protein.endswith("*"):
+        protein = protein[:-1]
+    if stop == "raise" and "*" in protein:
+        raise ValueError(f"Internal stop codon at codon {protein.index('*') + 1}")
+
+    return protein
+
+
+def six_frame_translation(sequence: Union[str, BytesLike], stop: str = "keep") -> Dict[int, str]:
+    """Translate the three forward and three reverse complement reading frames of
+    a DNA sequence. Bases left over at the end of a frame are ignored.
+
+    Arguments:
+        sequence {Union[str, BytesLike]} -- DNA sequence
+
+    Keyword Arguments:
+        stop {str} -- stop codon mode passed to translate_sequence (default: {"keep"})
+
+    Returns:
+        Dict[int, str] -- proteins keyed by frame: 1, 2, 3 forward and -1, -2, -3 reverse
+
+    Example:
+    >>> six_frame_translation("ATGGCCTAAG")
+    {1: 'MA*', 2: 'WPK', 3: 'GL', -1: 'LRP', -2: 'LGH', -3: '*A'}
+
+    """
+    reverse = reverse_complement_sequence(sequence)
+    frames = {}
+    for strand, seq in ((1, sequence), (-1, reverse)):
+        for offset in range(3):
+            frames[strand * (offset + 1)] = translate_sequence(seq[offset:], stop, allow_partial=True)
+
+    return frames
@@ -0,0 +1,210 @@
+from typing import Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from bioalgo.strings.kmer_counting import INVALID, sequence_to_codes
+
+
+_DECODE = np.frombuffer(b"ACGTN", dtype=np.uint8)
+
+
+def _generator(rng: Union[np.random.Generator, int, None]) -> np.random.Generator:
+    return rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+
+
+def codes_to_strings(codes: np.ndarray) -> List[str]:
+    """Decode a 2-D array of base codes into one DNA string per row
+
+    Arguments:
+        codes {np.ndarray} -- (n, length) array, A=0, C=1, G=2, T=3
+
+    Returns:
+        List[str] -- DNA strings
+
+    Example:
+    >>> codes_to_strings(np.array([[0, 1, 2, 3], [3, 3, 0, 0]]))
+    ['ACGT', 'TTAA']
+
+    """
+    codes = np.atleast_2d(codes)
+    if not codes.shape[1]:
+        return [""] * len(codes)
+
+    text = _DECODE[codes].tobytes().decode("ascii")
+    length = codes.shape[1]
+
+    return [text[i:i+length] for i in range(0, len(text), length)]
+
+
+def strings_to_codes(strings: Sequence[str]) -> np.ndarray:
+    """Encode equal-length DNA strings into a 2-D array of base codes
+
+    Arguments:
+        strings {Sequence[str]} -- DNA strings of equal length
+
+    Returns:
+        np.ndarray -- (n, length) uint8 array
+
+    Example:
+    >>> strings_to_codes(["ACGT", "TTAA"]).tolist()
+    [[0, 1, 2, 3], [3, 3, 0, 0]]
+
+    """
+    if any(len(s) != len(strings[0]) for s in strings):
+        raise ValueError("All DNA strings must be same length.")
+
+    codes = sequence_to_codes("".join(strings)).reshape(len(strings), -1 if strings and strings[0] else 0)
+    if (codes == INVALID).any():
+        raise ValueError("DNA strings may only contain A, C, G and T.")
+
+    return codes
+
+
+def random_sequences(n: int, length: int, composition: Sequence[float] = None,
+                     rng: Union[np.random.Generator, int, None] = None) -> np.ndarray:
+    """Generate n random DNA sequences in one batch
+
+    Arguments:
+        n {int} -- number of sequences
+        length {int} -- length of each sequence
+
+    Keyword Arguments:
+        composition {Sequence[float]} -- probabilities of A, C, G and T, None for uniform (default: {None})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        np.ndarray -- (n, length) uint8 array of base codes
+
+    Example:
+    >>> codes_to_strings(random_sequences(2, 10, rng=1))
+    ['TTACTGAGCG', 'CTGGCTTATA']
+    >>> codes_to_strings(random_sequences(1, 10, composition=[0.5, 0, 0, 0.5], rng=1))
+    ['TTATAATATA']
+
+    """
+    rng = _generator(rng)
+    if composition is None:
+        return rng.integers(0, 4, size=(n, length), dtype=np.uint8)
+
+    composition = np.asarray(composition, dtype=np.float64)
+    if composition.shape != (4,) or (composition < 0).any() or not composition.sum():
+        raise ValueError("composition must be four non-negative weights for A, C, G and T")
+
+    cumulative = np.cumsum(composition / composition.sum())
+    return np.searchsorted(cumulative, rng.random((n, length)), side="right").clip(max=3).astype(np.uint8)
+
+
+def mutate_codes(codes: np.ndarray, count: int = None, rate: float = None,
+                 rng: Union[np.random.Generator, int, None] = None) -> np.ndarray:
+    """Apply point mutations to every row of a code array. Each mutation changes
+    the base to one of the three others, chosen uniformly.
+
+    Arguments:
+        codes {np.ndarray} -- (n, length) array of base codes
+
+    Keyword Arguments:
+        count {int} -- mutate exactly this many distinct positions per row (default: {None})
+        rate {float} -- mutate each position independently with this probability (default: {None})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        np.ndarray -- mutated copy of codes
+
+    Example:
+    >>> original = np.zeros((3, 8), dtype=np.uint8)
+    >>> (mutate_codes(original, count=2, rng=0) != original).sum(axis=1).tolist()
+    [2, 2, 2]
+
+    """
+    if (count is None) == (rate is None):
+        raise ValueError("Give exactly one of count and rate")
+
+    rng = _generator(rng)
+    codes = np.array(codes, dtype=np.uint8, ndmin=2)
+    n, length = codes.shape
+
+    if count is not None:
+        if not 0 <= count <= length:
+            raise ValueError("Number of mutations greater than the length of the string")
+        mask = np.zeros((n, length), dtype=bool)
+        if count:
+            positions = rng.random((n, length)).argpartition(count - 1, axis=1)[:, :count]
+            mask[np.arange(n)[:, None], positions] = True
+    else:
+        if not 0 <= rate <= 1:
+            raise ValueError("rate must be between 0 and 1")
+        mask = rng.random((n, length)) < rate
+
+    shifts = rng.integers(1, 4, size=int(mask.sum()), dtype=np.uint8)
+    codes[mask] = (codes[mask] + shifts) & 0b11
+
+    return codes
+
+
+def plant_motif(codes: np.ndarray, motif: str, mutations: int = 0,
+                rng: Union[np.random.Generator, int, None] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Insert a copy of motif at a random position of every row, each copy
+    carrying its own independent mutations
+
+    Arguments:
+        codes {np.ndarray} -- (n, length) array of base codes
+        motif {str} -- motif to plant, shorter than the rows
+
+    Keyword Arguments:
+        mutations {int} -- point mutations in each planted copy (default: {0})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- copy of codes with the motifs planted, and the 0-based start in each row
+
+    Example:
+    >>> planted, starts = plant_motif(np.zeros((2, 10), dtype=np.uint8), "CGT", rng=3)
+    >>> codes_to_strings(planted), starts.tolist()
+    (['AAAAAACGTA', 'CGTAAAAAAA'], [6, 0])
+
+    """
+    rng = _generator(rng)
+    codes = np.array(codes, dtype=np.uint8, ndmin=2)
+    n, length = codes.shape
+    k = len(motif)
+    if k >= length:
+        raise ValueError(f"{motif} is longer than or equivalent in length to DNA strings")
+    if mutations >= k:
+        raise ValueError("Number of mutations is larger than size of the kmer")
+
+    copies = mutate_codes(np.tile(strings_to_codes([motif]), (n, 1)), count=mutations, rng=rng)
+    starts = rng.integers(0, length - k + 1, size=n)
+    codes[np.arange(n)[:, None], starts[:, None] + np.arange(k)] = copies
+
+    return codes, starts
+
+
+def iter_random_records(n: int, length: int, batch_size: int = 10000, composition: Sequence[float] = None,
+                        rng: Union[np.random.Generator, int, None] = None,
+                        prefix: str = "seq") -> Iterator[Tuple[str, str]]:
+    """Generate random sequences batch by batch as (record id, sequence) pairs,
+    ready for write_fasta, without holding more than one batch in memory
+
+    Arguments:
+        n {int} -- number of sequences
+        length {int} -- length of each sequence
+
+    Keyword Arguments:
+        batch_size {int} -- sequences generated per batch (default: {10000})
+        composition {Sequence[float]} -- probabilities of A, C, G and T, None for uniform (default: {None})
+        rng {Union[np.random.Generator, int, None]} -- generator or seed (default: {None})
+        prefix {str} -- record ids are prefix followed by a 1-based number (default: {"seq"})
+
+    Returns:
+        Iterator[Tuple[str, str]] -- records
+
+    Example:
+    >>> list(iter_random_records(2, 5, rng=1))
+    [('seq1', 'TTACT'), ('seq2', 'GAGCG')]
+
+    """
+    rng = _generator(rng)
+    for start in range(0, n, batch_size):
+        batch = random_sequences(min(batch_size, n - start), length, composition, rng)
+        for i, sequence in enumerate(codes_to_strings(batch), start + 1):
+            yield f"{prefix}{i}", sequence
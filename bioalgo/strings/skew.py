@@ -0,0 +1,119 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+# byte value -> change in skew: +1 for G, -1 for C, 0 for anything else
+_SKEW_STEP = np.zeros(256, dtype=np.int8)
+_SKEW_STEP[[ord("G"), ord("g")]] = 1
+_SKEW_STEP[[ord("C"), ord("c")]] = -1
+
+
+def skew_array(sequence: Union[str, bytes], offset: int = 0) -> np.ndarray:
+    """Compute the G - C skew after each base of sequence as a cumulative sum
+
+    Arguments:
+        sequence {Union[str, bytes]} -- DNA sequence
+
+    Keyword Arguments:
+        offset {int} -- skew carried over from preceding sequence (default: {0})
+
+    Returns:
+        np.ndarray -- int32 skew after each base, as compute_skew()
+
+    Example:
+    >>> skew_array("GGCCA").tolist()
+    [1, 2, 1, 0, 0]
+    >>> skew_array("CCA", offset=2).tolist()
+    [1, 0, 0]
+
+    """
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii")
+
+    skew = np.cumsum(_SKEW_STEP[np.frombuffer(sequence, dtype=np.uint8)], dtype=np.int32)
+    if offset:
+        skew += np.int32(offset)
+
+    return skew
+
+
+def _extreme_positions(sequence: Union[str, bytes], minimum: bool) -> List[int]:
+    # position i is the skew of the first i bases, so position 0 (skew 0) is a candidate too
+    skew = np.concatenate(([0], skew_array(sequence)))
+    extreme = skew.min() if minimum else skew.max()
+
+    return np.flatnonzero(skew == extreme).tolist()
+
+
+def minimum_skew(sequence: Union[str, bytes]) -> List[int]:
+    """Find the positions where the skew is smallest, the candidate origins of
+    replication. Position i is the skew of the first i bases, from 0 to len(sequence).
+
+    Arguments:
+        sequence {Union[str, bytes]} -- DNA sequence
+
+    Returns:
+        List[int] -- positions of minimum skew in increasing order
+
+    Example:
+    >>> minimum_skew("TAAAGACTGCCGAGAGGCCAACACGAGTGCTAGAACGAGGGGCGTAAACGCGGGTCCGAT")
+    [11, 24]
+
+    """
+    return _extreme_positions(sequence, minimum=True)
+
+
+def maximum_skew(sequence: Union[str, bytes]) -> List[int]:
+    """Find the positions where the skew is largest, the candidate termini of
+    replication. Position i is the skew of the first i bases, from 0 to len(sequence).
+
+    Arguments:
+        sequence {Union[str, bytes]} -- DNA sequence
+
+    Returns:
+        List[int] -- positions of maximum skew in increasing order
+
+    Example:
+    >>> maximum_skew("CATGGGCATCGGCCATACGCC")
+    [6, 12]
+
+    """
+    return _extreme_positions(sequence, minimum=False)
+
+
+def downsample_skew(skew: np.ndarray, points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a skew array to about points values for plotting, keeping the
+    minimum and maximum of each window so that no peak or trough is lost
+
+    Arguments:
+        skew {np.ndarray} -- skew values
+        points {int} -- number of points to keep (at least 2)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- indices into skew and the values at them, in index order
+
+    Example:
+    >>> positions, values = downsample_skew(np.array([0, 3, 1, 1, -2, 0, 5, 4]), 4)
+    >>> positions.tolist(), values.tolist()
+    ([0, 1, 4, 6], [0, 3, -2, 5])
+
+    """
+    skew = np.asarray(skew)
+    if points < 2:
+        raise ValueError("points must be at least 2")
+    if len(skew) <= points:
+        return np.arange(len(skew)), skew
+
+    width = -(-len(skew) // (points // 2))
+    windows = -(-len(skew) // width)
+    # pad with the last value: argmin/argmax return the first occurrence, never the padding
+    padded = np.pad(skew, (0, windows * width - len(skew)), mode="edge").reshape(windows, width)
+    starts = np.arange(windows) * width
+    lows = starts + padded.argmin(axis=1)
+    highs = starts + padded.argmax(axis=1)
+
+    positions = np.sort(np.stack((lows, highs), axis=1), axis=1).ravel()
+    positions = positions[np.concatenate(([True], positions[1:] != positions[:-1]))]
+
+    return positions, skew[positions]
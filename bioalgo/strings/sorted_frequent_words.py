@@ -1,10 +1,10 @@
 from typing import Set
 
-from bioalgo.strings.number_to_pattern import number_to_pattern
-from bioalgo.strings.pattern_to_number import pattern_to_number
+from bioalgo.strings.kmer_codec import decode_kmer, rolling_kmer_codes
+from bioalgo.strings.kmer_counting import check_backend, most_frequent_kmers
 
 
-def sorted_frequent_words(text: str, k: int) -> Set[str]:
+def sorted_frequent_words(text: str, k: int, backend: str = "python") -> Set[str]:
     """Find the most frequent kmers of size k in the given text by
     sorting
     
@@ -12,23 +12,33 @@ def sorted_frequent_words(text: str, k: int) -> Set[str]:
         text {str} -- text to search
         k {int} -- k-mer size
     
+    Keyword Arguments:
+        backend {str} -- "python" or "numpy" counting backend. Both read text in any case;
+        the python backend rejects non-ACGT symbols and needs len(text) >= k, while the
+        numpy backend skips the k-mers containing them and returns an empty set for text
+        shorter than k (default: {"python"})
+    
     Returns:
         Set[str] -- most frequent k-mers in text
 
     Example:
     >>> sorted_frequent_words("ACAACTATGCATACTATCGGGAACTATCCT", 5)
     {'ACTAT'}
+    >>> sorted(sorted_frequent_words("ACGNacg", 2, backend="numpy"))
+    ['AC', 'CG']
+    >>> sorted_frequent_words("ACGNacg", 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid nucleotide: N
     
     """
-    frequent_patterns = set()
-    index = []
-    count = []
-    for i in range(len(text) - k + 1):
-        pattern = text[i:i+k]
-        index.append(pattern_to_number(pattern))
-        count.append(1)
+    check_backend(backend)
+    if backend == "numpy":
+        return most_frequent_kmers(text, k)
 
-    sorted_index = sorted(index)
+    frequent_patterns = set()
+    sorted_index = sorted(rolling_kmer_codes(text, k))
+    count = [1] * len(sorted_index)
 
     for i in range(1, len(text) - k + 1):
         if sorted_index[i] == sorted_index[i-1]:
@@ -38,7 +48,6 @@ def sorted_frequent_words(text: str, k: int) -> Set[str]:
 
     for i in range(len(text) - k + 1):
         if count[i] == max_count:
-            pattern = number_to_pattern(sorted_index[i], k)
-            frequent_patterns.add(pattern)
+            frequent_patterns.add(decode_kmer(sorted_index[i], k))
 
     return frequent_patterns
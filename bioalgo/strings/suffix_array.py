@@ -0,0 +1,55 @@
+from typing import Union
+
+import numpy as np
+
+
+def suffix_array(text: Union[str, bytes]) -> np.ndarray:
+    """Build the suffix array of text terminated by a sentinel smaller than every
+    symbol, by prefix doubling: each round sorts suffixes on the ranks of their
+    first 2h symbols, so O(log n) vectorized sorts are needed.
+
+    Arguments:
+        text {Union[str, bytes]} -- text without NUL characters
+
+    Returns:
+        np.ndarray -- int64 start positions of the len(text) + 1 sorted suffixes,
+        the first one being the sentinel suffix at position len(text)
+
+    Example:
+    >>> suffix_array("panamabananas").tolist()
+    [13, 5, 3, 1, 7, 9, 11, 6, 4, 2, 8, 10, 0, 12]
+
+    """
+    if isinstance(text, str):
+        text = text.encode("ascii")
+
+    n = len(text) + 1
+    rank = np.zeros(n, dtype=np.int64)
+    rank[:-1] = np.frombuffer(text, dtype=np.uint8)
+    if n > 1 and rank[:-1].min() == 0:
+        raise ValueError("text must not contain NUL characters")
+
+    order = np.argsort(rank, kind="stable")
+    rank[order] = _dense_ranks(rank[order])
+
+    h = 1
+    while rank[order[-1]] < n - 1:
+        second = np.full(n, -1, dtype=np.int64)
+        second[:n - h] = rank[h:]
+        if n < 1 << 31:
+            order = np.argsort(rank * (n + 1) + second + 1)
+        else:
+            order = np.lexsort((second, rank))
+        rank[order] = _dense_ranks(rank[order], second[order])
+        h *= 2
+
+    return order
+
+
+def _dense_ranks(*sorted_keys: np.ndarray) -> np.ndarray:
+    """Rank the rows of lexicographically sorted key columns, equal rows sharing a rank"""
+    changed = np.zeros(len(sorted_keys[0]), dtype=bool)
+    for key in sorted_keys:
+        changed[1:] |= key[1:] != key[:-1]
+
+    return np.cumsum(changed)
@@ -1,3 +1,6 @@
+from bioalgo.strings.sequence_transforms import transcribe_sequence
+
+
 def transcribe(text: str) -> str:
     """transcribe a DNA string to RNA
     
@@ -6,7 +9,9 @@ def transcribe(text: str) -> str:
     
     Returns:
         str -- transcribed RNA string
-    """
-    transtab = {"A":"A", "C":"C", "G":"G", "T":"U"}
 
-    return "".join(transtab[t] for t in text.upper())
\ No newline at end of file
+    Example:
+    >>> transcribe("gattaca")
+    'GAUUACA'
+    """
+    return transcribe_sequence(text.upper())
\ No newline at end of file
@@ -1,39 +1,23 @@
-def translate(text: str) -> str:
+from bioalgo.strings.sequence_transforms import translate_sequence
+
+
+def translate(text: str, stop: str = "trim") -> str:
     """Translate an mRNA tring to protein
     
     Arguments:
         text {str} -- mRNA text string
+
+    Keyword Arguments:
+        stop {str} -- stop codon mode, see translate_sequence (default: {"trim"})
     
     Returns:
-        str -- protein string
-    """
+        str -- protein string, '*' marking any stop codon that is kept
 
-    codon_table = {'UUU': 'F', 'UUC':'F', 'UUA': 'L', 'UUG':'L', 'UCU': 'S', 
-                   'UCC': 'S', 'UCA': 'S', 'UCG':'S', 'UAU':'Y', 'UAC':'Y', 
-                   'UAA':'Stop', 'UAG':'Stop', 'UGU':'C', 'UGC':'C', 'UGA':'Stop', 
-                   'UGG': 'W', 'CUU':'L', 'CUC':'L', 'CUA':'L', 'CUG':'L', 'CCU':'P',
-                   'CCC':'P', 'CCA':'P', 'CCG':'P', 'CAU':'H', 'CAC':'H', 'CAA':'Q', 
-                   'CAG': 'Q', 'CGU':'R', 'CGC':'R', 'CGA':'R', 'CGG':'R', 'AUU':'I', 
-                   'AUC':'I', 'AUA':'I', 'AUG':'M', 'ACU':'T', 'ACC':'T', 'ACA':'T', 
-                   'ACG':'T', 'AAU':'N', 'AAC':'N', 'AAA':'K', 'AAG':'K', 'AGU':'S', 
-                   'AGC':'S', 'AGA':'R', 'AGG':'R', 'GUU':'V', 'GUC':'V', 'GUA':'V',
-                   'GUG':'V', 'GCU':'A', 'GCC':'A', 'GCA':'A', 'GCG':'A', 'GAU':'D',
-                   'GAC':'D', 'GAA':'E', 'GAG':'E', 'GGU':'G', 'GGC':'G', 'GGA':'G', 
-                   'GGG':'G'}
+    Raises:
+        ValueError -- if the length of text is not a multiple of 3
 
-    # split string into a list of codons
-    codons = [text[i:i+3] for i in range(0, len(text), 3)]
-
-    # check to see if every element in codons is divisible by three
-    # if not exit
-    for codon in codons:
-        if int(len(codon) / 3) == 1:
-            continue
-        else:
-            print(f"Codon: '{codon}' at index {codons.index(codon)} not divisible by 3. Exiting")
-            exit(1)
-
-    prot = ''.join([codon_table.get(codon) for codon in codons])
-
-    # remove 'Stop' codon from final string if present
-    return prot[:-4] if prot[-4:] == 'Stop' else prot
\ No newline at end of file
+    Example:
+    >>> translate("AUGGCCAUGGCGCCCAGAACUGAGAUCAAUAGUACCCGUAUUAACGGGUGA")
+    'MAMAPRTEINSTRING'
+    """
+    return translate_sequence(text, stop)
\ No newline at end of file